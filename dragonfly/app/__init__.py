@@ -1,4 +1,5 @@
 from .bind import bind_info
 
+from .async_mainloop import AsyncMainloop
 from .mainloop import Mainloop
 from .quit_ import Quit
\ No newline at end of file
@@ -0,0 +1,142 @@
+import asyncio
+
+import hive
+
+from .mainloop import run_due_ticks
+from ..sys.process import Process as _Process
+
+
+class _AsyncMainloop(object):
+
+    @hive.types(tick_rate='int', max_catch_up_ticks='int')
+    def __init__(self, tick_rate=60, max_catch_up_ticks=5):
+        self._hive = hive.get_run_hive()
+        self.tick_rate = tick_rate
+
+        # Ticks which are run at most to catch up, before the remaining backlog is dropped
+        self.max_catch_up_ticks = max_catch_up_ticks
+
+        self.tick_duration = 0.0
+        self.overrun_count = 0
+
+        self._loop = None
+        self._running = False
+        self._stopped = None
+
+        self._tick_handle = None
+        self._next_tick_time = 0.0
+
+        self._tasks = set()
+        self._pending_coroutines = []
+
+    def run(self):
+        """Run a new asyncio event loop until stopped"""
+        asyncio.run(self.run_async())
+
+    async def run_async(self):
+        """Tick on the running asyncio event loop until stopped"""
+        loop = self._loop = asyncio.get_running_loop()
+
+        self._stopped = loop.create_future()
+        self._running = True
+
+        self._hive.on_started()
+
+        # Start coroutines which were added before the loop was running
+        pending_coroutines, self._pending_coroutines = self._pending_coroutines, []
+        for coroutine in pending_coroutines:
+            self.create_task(coroutine)
+
+        if self._running:
+            self._next_tick_time = loop.time()
+            self._tick_handle = loop.call_at(self._next_tick_time, self._on_tick_due)
+
+        await self._stopped
+
+    def _on_tick_due(self):
+        loop = self._loop
+        time_step = 1.0 / self.tick_rate
+
+        next_tick_time, _ = run_due_ticks(self, loop.time, loop.time(), self._next_tick_time, time_step)
+
+        if not self._running:
+            return
+
+        self._next_tick_time = next_tick_time
+        self._tick_handle = loop.call_at(next_tick_time, self._on_tick_due)
+
+    def _finish(self):
+        for task in tuple(self._tasks):
+            task.cancel()
+
+        self._hive.on_stopped()
+
+        if not self._stopped.done():
+            self._stopped.set_result(None)
+
+    def get_tick_rate(self):
+        return self.tick_rate
+
+    def get_event_loop(self):
+        return self._loop
+
+    def create_task(self, coroutine):
+        """Run coroutine on the event loop until it completes, or the mainloop stops"""
+        if self._loop is None:
+            self._pending_coroutines.append(coroutine)
+            return None
+
+        task = self._loop.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def stop(self):
+        if not self._running:
+            return
+
+        self._running = False
+
+        if self._tick_handle is not None:
+            self._tick_handle.cancel()
+            self._tick_handle = None
+
+        # Finish after the current callback (e.g. tick) returns
+        self._loop.call_soon(self._finish)
+
+    def tick(self):
+        self._hive.tick()
+
+
+def build_async_mainloop(cls, i, ex, args):
+    """Fixed-timestep trigger generator scheduled on an asyncio event loop"""
+    i.tick = hive.triggerfunc()
+    i.stop = hive.triggerable(cls.stop)
+    i.run = hive.triggerable(cls.run)
+
+    ex.tick = hive.hook(i.tick)
+    ex.run = hive.entry(i.run)
+    ex.stop = hive.entry(i.stop)
+
+    i.tick_rate = hive.property(cls, "tick_rate", 'int')
+    i.pull_tick_rate = hive.pull_out(i.tick_rate)
+    ex.tick_rate = hive.output(i.pull_tick_rate)
+
+    # Instrumentation
+    i.tick_duration = hive.property(cls, "tick_duration", 'float')
+    i.pull_tick_duration = hive.pull_out(i.tick_duration)
+    ex.tick_duration = hive.output(i.pull_tick_duration)
+
+    i.overrun_count = hive.property(cls, "overrun_count", 'int')
+    i.pull_overrun_count = hive.pull_out(i.overrun_count)
+    ex.overrun_count = hive.output(i.pull_overrun_count)
+
+    ex.get_tick_rate = hive.plugin(cls.get_tick_rate, identifier="app.get_tick_rate")
+    ex.quit = hive.plugin(cls.stop, identifier="app.quit")
+
+    # Allow coroutine-based hives to run on the event loop
+    ex.get_event_loop = hive.plugin(cls.get_event_loop, identifier="app.get_event_loop")
+    ex.create_task = hive.plugin(cls.create_task, identifier="app.create_task")
+
+
+AsyncMainloop = _Process.extend("AsyncMainloop", build_async_mainloop, _AsyncMainloop)
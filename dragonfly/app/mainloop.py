@@ -6,36 +6,112 @@ import time
 from ..sys.process import Process as _Process
 
 
+def run_due_ticks(mainloop, clock, current_time, next_tick_time, time_step):
+    """Run the ticks of mainloop which are due at current_time, at most max_catch_up_ticks back to back.
+
+    Update the tick_duration and overrun_count of mainloop, and drop the backlog of ticks that could not be caught up.
+    Return the time of the next tick, and the time spent ticking.
+    """
+    busy_time = 0.0
+
+    tick_count = 0
+    while current_time >= next_tick_time and tick_count < mainloop.max_catch_up_ticks and mainloop._running:
+        mainloop.tick()
+
+        tick_end_time = clock()
+        mainloop.tick_duration = tick_end_time - current_time
+        busy_time += mainloop.tick_duration
+
+        next_tick_time += time_step
+        tick_count += 1
+
+        # Next tick became due before this one finished
+        if tick_end_time > next_tick_time:
+            mainloop.overrun_count += 1
+
+        current_time = tick_end_time
+
+    # Drop remaining backlog
+    if current_time >= next_tick_time:
+        next_tick_time = current_time
+
+    return next_tick_time, busy_time
+
+
 class _Mainloop(object):
 
-    @hive.types(tick_rate='int')
-    def __init__(self, tick_rate=60):
+    strategies = ("sleep", "hybrid", "spin")
+
+    # Clock and sleep functions, which may be replaced per instance (e.g. by a simulated clock)
+    clock = staticmethod(time.perf_counter)
+    sleep = staticmethod(time.sleep)
+
+    @hive.types(tick_rate='int', strategy='str', spin_time='float', max_catch_up_ticks='int')
+    @hive.options(strategy=set(strategies))
+    def __init__(self, tick_rate=60, strategy="hybrid", spin_time=0.002, max_catch_up_ticks=5):
+        if strategy not in self.strategies:
+            raise ValueError("Invalid mainloop strategy '{}', expected one of {}".format(strategy, self.strategies))
+
         self._hive = hive.get_run_hive()
         self.tick_rate = tick_rate
 
+        # Sleep until next tick, sleep until spin_time before next tick and then spin, or spin
+        self.strategy = strategy
+        self.spin_time = spin_time
+
+        # Ticks which are run at most to catch up, before the remaining backlog is dropped
+        self.max_catch_up_ticks = max_catch_up_ticks
+
+        self.tick_duration = 0.0
+        self.overrun_count = 0
+
         self._running = True
         self._listeners = []
 
+        self._start_time = None
+        self._busy_time = 0.0
+
+    @hive.typed_property("float")
+    def idle_percentage(self):
+        """Percentage of run time not spent ticking"""
+        if self._start_time is None:
+            return 0.0
+
+        run_time = self.clock() - self._start_time
+        if run_time <= 0.0:
+            return 0.0
+
+        return max(100.0 * (1.0 - self._busy_time / run_time), 0.0)
+
+    def _wait(self, duration):
+        strategy = self.strategy
+
+        if strategy == "sleep":
+            self.sleep(duration)
+
+        elif strategy == "hybrid":
+            # Sleep is not accurate enough for the end of the wait
+            if duration > self.spin_time:
+                self.sleep(duration - self.spin_time)
+
     def run(self):
         self._hive.on_started()
 
-        accumulator = 0.0
-        last_time = time.clock()
-
         time_step = 1.0 / self.tick_rate
+        clock = self.clock
+
+        self._start_time = next_tick_time = clock()
+        self._busy_time = 0.0
 
         while self._running:
-            current_time = time.clock()
-            elapsed_time = current_time - last_time
-            last_time = current_time
+            current_time = clock()
 
-            if elapsed_time > 0.25:
-                elapsed_time = 0.25
+            if current_time < next_tick_time:
+                self._wait(next_tick_time - current_time)
+                continue
 
-            accumulator += elapsed_time
-            while accumulator > time_step:
-                accumulator -= time_step
-                self.tick()
+            next_tick_time, busy_time = run_due_ticks(self, clock, current_time, next_tick_time, time_step)
+            self._busy_time += busy_time
 
         self._hive.on_stopped()
 
@@ -63,6 +139,18 @@ def build_mainloop(cls, i, ex, args):
     i.pull_tick_rate = hive.pull_out(i.tick_rate)
     ex.tick_rate = hive.output(i.pull_tick_rate)
 
+    # Instrumentation
+    i.tick_duration = hive.property(cls, "tick_duration", 'float')
+    i.pull_tick_duration = hive.pull_out(i.tick_duration)
+    ex.tick_duration = hive.output(i.pull_tick_duration)
+
+    i.overrun_count = hive.property(cls, "overrun_count", 'int')
+    i.pull_overrun_count = hive.pull_out(i.overrun_count)
+    ex.overrun_count = hive.output(i.pull_overrun_count)
+
+    i.pull_idle_percentage = hive.pull_out(cls.idle_percentage)
+    ex.idle_percentage = hive.output(i.pull_idle_percentage)
+
     ex.get_tick_rate = hive.plugin(cls.get_tick_rate, identifier="app.get_tick_rate")
     ex.quit = hive.plugin(cls.stop, identifier="app.quit")
 
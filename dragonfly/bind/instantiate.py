@@ -86,7 +86,9 @@ class InstantiatorClass:
         self._process_id_generator = id_generator()
 
         self.last_created_process_id = None
+        self.last_created_process_ids = ()
         self.bind_meta_class = None
+        self.count = 1
 
         # Runtime attributes
         self.hive_class = None
@@ -134,20 +136,15 @@ class InstantiatorClass:
         """Forget child hive when it is stopped"""
         instance = self._active_hives.pop(process_id)
         instance.on_stopped()
+        instance._hive_release()
 
     def stop_all_processes(self):
         """Stop all child hives if instantiator is stopped"""
         for instance_id in list(self._active_hives.keys()):
             self.stop_hive(instance_id)
 
-    def instantiate(self):
-        context = self._create_context()
-
-        bind_meta_args = self._hive._hive_object._hive_meta_args_frozen
-        bind_class = self.bind_meta_class(bind_meta_args=bind_meta_args, hive_class=self.hive_class)
-
-        # Create Hive and track ID
-        environment_hive = bind_class(context)
+    def _start_process(self, environment_hive):
+        """Track new environment hive and notify bind classes"""
         process_id = next(self._process_id_generator)
 
         # Store ID of process
@@ -159,6 +156,31 @@ class InstantiatorClass:
             callback(process_id, environment_hive)
 
         environment_hive.on_started()
+        return process_id
+
+    def instantiate(self):
+        context = self._create_context()
+
+        bind_meta_args = self._hive._hive_object._hive_meta_args_frozen
+        bind_class = self.bind_meta_class(bind_meta_args=bind_meta_args, hive_class=self.hive_class)
+
+        # Create Hive and track ID
+        environment_hive = bind_class(context)
+        self._start_process(environment_hive)
+
+    def instantiate_many(self):
+        """Instantiate count hives from a single HiveObject, sharing one context"""
+        context = self._create_context()
+
+        bind_meta_args = self._hive._hive_object._hive_meta_args_frozen
+        bind_class = self.bind_meta_class(bind_meta_args=bind_meta_args, hive_class=self.hive_class)
+
+        # Build a single HiveObject, and stamp out runtime hives from its instantiation template
+        hive_object = bind_class._hive_object_cls(context)
+        environment_hives = hive_object.instantiate_many(self.count)
+
+        self.last_created_process_ids = tuple(self._start_process(environment_hive)
+                                              for environment_hive in environment_hives)
 
 
 def declare_instantiator(meta_args):
@@ -183,6 +205,22 @@ def build_instantiator(cls, i, ex, args, meta_args):
 
     hive.trigger(i.trig_instantiate, i.pull_hive_class, pretrigger=True)
 
+    # Bulk instantiation
+    i.count = hive.property(cls, "count", "int")
+    i.pull_count = hive.pull_in(i.count)
+    ex.count = hive.antenna(i.pull_count)
+
+    i.trig_instantiate_many = hive.triggerfunc(cls.instantiate_many)
+    i.do_instantiate_many = hive.triggerable(i.trig_instantiate_many)
+    ex.create_many = hive.entry(i.do_instantiate_many)
+
+    hive.trigger(i.trig_instantiate_many, i.pull_hive_class, pretrigger=True)
+    hive.trigger(i.trig_instantiate_many, i.pull_count, pretrigger=True)
+
+    ex.process_ids = hive.property(cls, "last_created_process_ids", "tuple")
+    i.pull_process_ids = hive.pull_out(ex.process_ids)
+    ex.last_process_ids = hive.output(i.pull_process_ids)
+
     ex.process_id = hive.property(cls, "last_created_process_id", "int.process_id")
     i.pull_process_id = hive.pull_out(ex.process_id)
     ex.last_process_id = hive.output(i.pull_process_id)
@@ -7,6 +7,7 @@ from .orientation import Orientation
 from .parent import Parent
 from .position import Position
 from .spawn import Spawn
+from .store import ComponentStore, EntityStore
 from .tag import Tag
 from .this import This
 from .visibility import Visibility
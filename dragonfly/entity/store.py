@@ -0,0 +1,344 @@
+"""Renderer independent entity manager, which stores entity components as arrays (using NumPy if available).
+
+Entity ids index the component arrays directly; the ids of destroyed entities are reused by later spawns. Vector
+components are (N, 3) NumPy arrays, or lists of 3-tuples without NumPy. Relative positions and orientations are
+offsets in world axes, as the store does not compose transforms.
+"""
+import hive
+
+try:
+    import numpy
+
+except ImportError:
+    numpy = None
+
+
+VECTOR_COMPONENTS = ("position", "orientation", "linear_velocity", "angular_velocity")
+
+_ZERO = (0.0, 0.0, 0.0)
+
+
+class ComponentStore(object):
+    """Struct-of-arrays storage of entity components, with dense entity ids and free list reuse"""
+
+    def __init__(self, capacity=64):
+        self.capacity = 0
+
+        self._vectors = {name: self._allocate(0) for name in VECTOR_COMPONENTS}
+
+        self.alive = []
+        self.visible = []
+        self.parents = []
+        self.tags = []
+
+        self._free_ids = []
+
+        self._grow(capacity)
+
+    def __len__(self):
+        return len(self.alive) - len(self._free_ids)
+
+    def __contains__(self, entity_id):
+        return 0 <= entity_id < len(self.alive) and self.alive[entity_id]
+
+    @staticmethod
+    def _allocate(capacity):
+        if numpy is not None:
+            return numpy.zeros((capacity, 3))
+
+        return [_ZERO] * capacity
+
+    def _grow(self, capacity):
+        for name, values in self._vectors.items():
+            grown = self._allocate(capacity)
+            grown[:self.capacity] = values[:self.capacity]
+            self._vectors[name] = grown
+
+        self.capacity = capacity
+
+    @property
+    def entity_ids(self):
+        return [entity_id for entity_id, is_alive in enumerate(self.alive) if is_alive]
+
+    def get_array(self, component):
+        """Return array of component values, indexed by entity id (including unused rows)"""
+        return self._vectors[component]
+
+    def create(self):
+        if self._free_ids:
+            entity_id = self._free_ids.pop()
+
+            self.alive[entity_id] = True
+            self.visible[entity_id] = True
+            self.parents[entity_id] = None
+            self.tags[entity_id] = {}
+
+        else:
+            entity_id = len(self.alive)
+            if entity_id == self.capacity:
+                self._grow(max(self.capacity * 2, 1))
+
+            self.alive.append(True)
+            self.visible.append(True)
+            self.parents.append(None)
+            self.tags.append({})
+
+        for values in self._vectors.values():
+            values[entity_id] = _ZERO
+
+        return entity_id
+
+    def destroy(self, entity_id):
+        if entity_id not in self:
+            raise KeyError(entity_id)
+
+        self.alive[entity_id] = False
+        self.tags[entity_id] = None
+        self._free_ids.append(entity_id)
+
+    def get(self, component, entity_id):
+        if entity_id not in self:
+            raise KeyError(entity_id)
+
+        value = self._vectors[component][entity_id]
+        if numpy is not None:
+            return tuple(value.tolist())
+
+        return value
+
+    def set(self, component, entity_id, value):
+        if entity_id not in self:
+            raise KeyError(entity_id)
+
+        x, y, z = value
+        self._vectors[component][entity_id] = (float(x), float(y), float(z))
+
+    def get_many(self, component, entity_ids):
+        """Return array of component values for a sequence of entity ids"""
+        values = self._vectors[component]
+
+        if numpy is not None:
+            return values[numpy.asarray(entity_ids, dtype=int)]
+
+        return [values[entity_id] for entity_id in entity_ids]
+
+    def set_many(self, component, entity_ids, new_values):
+        """Set component values from an array, for a sequence of entity ids"""
+        values = self._vectors[component]
+
+        if numpy is not None:
+            values[numpy.asarray(entity_ids, dtype=int)] = new_values
+            return
+
+        for entity_id, (x, y, z) in zip(entity_ids, new_values):
+            values[entity_id] = (float(x), float(y), float(z))
+
+
+class EntityStoreClass:
+
+    @hive.types(capacity='int')
+    def __init__(self, capacity=64):
+        self.store = ComponentStore(capacity)
+
+        self._entities = {}
+        self._factories = {}
+        self._entity_hive_destructors = {}
+
+        self._on_destroyed_callbacks = []
+        self._on_created_callbacks = []
+
+        self._hive = hive.get_run_hive()
+
+    def spawn_entity(self, class_name):
+        # Factories are optional, as entities need not have a representation
+        factory = self._factories.get(class_name)
+        entity = factory() if factory is not None else None
+
+        entity_id = self.store.create()
+        self._entities[entity_id] = entity
+
+        for callback in self._on_created_callbacks:
+            callback(entity_id, entity)
+
+        return entity_id
+
+    def destroy_entity(self, entity_id):
+        if entity_id in self._entity_hive_destructors:
+            destructors = self._entity_hive_destructors.pop(entity_id)
+
+            for callback in destructors:
+                callback(entity_id)
+
+        entity = self._entities.pop(entity_id)
+        self.store.destroy(entity_id)
+
+        for callback in self._on_destroyed_callbacks:
+            callback(entity_id, entity)
+
+    def set_tag(self, entity_id, name, value):
+        self.store.tags[entity_id][name] = value
+
+    def get_tag(self, entity_id, name):
+        return self.store.tags[entity_id].get(name)
+
+    def set_visibility(self, entity_id, visible):
+        self.store.visible[entity_id] = visible
+
+    def get_visibility(self, entity_id):
+        return self.store.visible[entity_id]
+
+    def set_parent(self, entity_id, parent):
+        self.store.parents[entity_id] = parent
+
+    def get_parent(self, entity_id):
+        return self.store.parents[entity_id]
+
+    def get_absolute_position(self, entity_id):
+        return self.store.get("position", entity_id)
+
+    def set_absolute_position(self, entity_id, position):
+        self.store.set("position", entity_id, position)
+
+    def get_relative_position(self, entity_id, other_entity_id):
+        return _subtract(self.store.get("position", entity_id), self.store.get("position", other_entity_id))
+
+    def set_relative_position(self, entity_id, other_entity_id, position):
+        self.store.set("position", entity_id, _add(self.store.get("position", other_entity_id), position))
+
+    def get_absolute_orientation(self, entity_id):
+        return self.store.get("orientation", entity_id)
+
+    def set_absolute_orientation(self, entity_id, orientation):
+        self.store.set("orientation", entity_id, orientation)
+
+    def get_relative_orientation(self, entity_id, other_entity_id):
+        return _subtract(self.store.get("orientation", entity_id), self.store.get("orientation", other_entity_id))
+
+    def set_relative_orientation(self, entity_id, other_entity_id, orientation):
+        self.store.set("orientation", entity_id, _add(self.store.get("orientation", other_entity_id), orientation))
+
+    def get_linear_velocity(self, entity_id):
+        return self.store.get("linear_velocity", entity_id)
+
+    def set_linear_velocity(self, entity_id, velocity):
+        self.store.set("linear_velocity", entity_id, velocity)
+
+    def get_angular_velocity(self, entity_id):
+        return self.store.get("angular_velocity", entity_id)
+
+    def set_angular_velocity(self, entity_id, velocity):
+        self.store.set("angular_velocity", entity_id, velocity)
+
+    def get_many_positions(self, entity_ids):
+        return self.store.get_many("position", entity_ids)
+
+    def set_many_positions(self, entity_ids, positions):
+        self.store.set_many("position", entity_ids, positions)
+
+    def get_many_orientations(self, entity_ids):
+        return self.store.get_many("orientation", entity_ids)
+
+    def set_many_orientations(self, entity_ids, orientations):
+        self.store.set_many("orientation", entity_ids, orientations)
+
+    def get_many_linear_velocities(self, entity_ids):
+        return self.store.get_many("linear_velocity", entity_ids)
+
+    def set_many_linear_velocities(self, entity_ids, velocities):
+        self.store.set_many("linear_velocity", entity_ids, velocities)
+
+    def get_many_angular_velocities(self, entity_ids):
+        return self.store.get_many("angular_velocity", entity_ids)
+
+    def set_many_angular_velocities(self, entity_ids, velocities):
+        self.store.set_many("angular_velocity", entity_ids, velocities)
+
+    def register_hive_destructor(self, entity, destructor):
+        self._entity_hive_destructors.setdefault(entity, []).append(destructor)
+
+    def register_entity_factory(self, template_name, factory):
+        self._factories[template_name] = factory
+
+    def on_entity_destroyed(self, on_destroyed):
+        self._on_destroyed_callbacks.append(on_destroyed)
+
+    def on_entity_created(self, on_created):
+        self._on_created_callbacks.append(on_created)
+
+
+def _add(a, b):
+    return a[0] + b[0], a[1] + b[1], a[2] + b[2]
+
+
+def _subtract(a, b):
+    return a[0] - b[0], a[1] - b[1], a[2] - b[2]
+
+
+def build_entity_store(cls, i, ex, args):
+    """Renderer independent entity manager, storing components in arrays"""
+    ex.set_tag = hive.plugin(cls.set_tag, identifier="entity.tag.set", export_to_parent=True)
+    ex.get_tag = hive.plugin(cls.get_tag, identifier="entity.tag.get", export_to_parent=True)
+    ex.set_visibility = hive.plugin(cls.set_visibility, identifier="entity.visibility.set", export_to_parent=True)
+    ex.get_visibility = hive.plugin(cls.get_visibility, identifier="entity.visibility.get", export_to_parent=True)
+    ex.spawn_entity = hive.plugin(cls.spawn_entity, identifier="entity.spawn", export_to_parent=True)
+    ex.destroy_entity = hive.plugin(cls.destroy_entity, identifier="entity.destroy", export_to_parent=True)
+    ex.register_entity_factory = hive.plugin(cls.register_entity_factory, "entity.register_factory",
+                                             export_to_parent=True)
+    ex.register_hive_destructor = hive.plugin(cls.register_hive_destructor, "entity.register_destructor",
+                                              export_to_parent=True)
+
+    ex.set_parent = hive.plugin(cls.set_parent, identifier="entity.parent.set", export_to_parent=True)
+    ex.get_parent = hive.plugin(cls.get_parent, identifier="entity.parent.get", export_to_parent=True)
+
+    ex.set_abs_position = hive.plugin(cls.set_absolute_position, identifier="entity.position.set.absolute",
+                                      export_to_parent=True)
+    ex.get_abs_position = hive.plugin(cls.get_absolute_position, identifier="entity.position.get.absolute",
+                                      export_to_parent=True)
+    ex.set_rel_position = hive.plugin(cls.set_relative_position, identifier="entity.position.set.relative",
+                                      export_to_parent=True)
+    ex.get_rel_position = hive.plugin(cls.get_relative_position, identifier="entity.position.get.relative",
+                                      export_to_parent=True)
+
+    ex.set_abs_orientation = hive.plugin(cls.set_absolute_orientation, identifier="entity.orientation.set.absolute",
+                                         export_to_parent=True)
+    ex.get_abs_orientation = hive.plugin(cls.get_absolute_orientation, identifier="entity.orientation.get.absolute",
+                                         export_to_parent=True)
+    ex.set_rel_orientation = hive.plugin(cls.set_relative_orientation, identifier="entity.orientation.set.relative",
+                                         export_to_parent=True)
+    ex.get_rel_orientation = hive.plugin(cls.get_relative_orientation, identifier="entity.orientation.get.relative",
+                                         export_to_parent=True)
+
+    ex.set_linear_velocity = hive.plugin(cls.set_linear_velocity, identifier="entity.linear_velocity.set",
+                                         export_to_parent=True)
+    ex.get_linear_velocity = hive.plugin(cls.get_linear_velocity, identifier="entity.linear_velocity.get",
+                                         export_to_parent=True)
+    ex.set_angular_velocity = hive.plugin(cls.set_angular_velocity, identifier="entity.angular_velocity.set",
+                                          export_to_parent=True)
+    ex.get_angular_velocity = hive.plugin(cls.get_angular_velocity, identifier="entity.angular_velocity.get",
+                                          export_to_parent=True)
+
+    # Bulk access to components of many entities
+    ex.get_many_positions = hive.plugin(cls.get_many_positions, identifier="entity.position.get_many",
+                                        export_to_parent=True)
+    ex.set_many_positions = hive.plugin(cls.set_many_positions, identifier="entity.position.set_many",
+                                        export_to_parent=True)
+    ex.get_many_orientations = hive.plugin(cls.get_many_orientations, identifier="entity.orientation.get_many",
+                                           export_to_parent=True)
+    ex.set_many_orientations = hive.plugin(cls.set_many_orientations, identifier="entity.orientation.set_many",
+                                           export_to_parent=True)
+    ex.get_many_linear_velocities = hive.plugin(cls.get_many_linear_velocities,
+                                                identifier="entity.linear_velocity.get_many", export_to_parent=True)
+    ex.set_many_linear_velocities = hive.plugin(cls.set_many_linear_velocities,
+                                                identifier="entity.linear_velocity.set_many", export_to_parent=True)
+    ex.get_many_angular_velocities = hive.plugin(cls.get_many_angular_velocities,
+                                                 identifier="entity.angular_velocity.get_many", export_to_parent=True)
+    ex.set_many_angular_velocities = hive.plugin(cls.set_many_angular_velocities,
+                                                 identifier="entity.angular_velocity.set_many", export_to_parent=True)
+
+    ex.on_entity_destroyed = hive.socket(cls.on_entity_destroyed, "entity.on_destroyed", policy=hive.MultipleOptional,
+                                         export_to_parent=True)
+    ex.on_entity_created = hive.socket(cls.on_entity_created, "entity.on_created", policy=hive.MultipleOptional,
+                                       export_to_parent=True)
+
+
+EntityStore = hive.hive("EntityStore", build_entity_store, builder_cls=EntityStoreClass)
@@ -3,6 +3,7 @@ from .bind import bind_info
 from .dispatch import Dispatch
 from .event import EventHandler, EventManager, EventDispatcher
 from .listener import Listener
+from .scheduler import TickScheduler, TickSubscription, Timer, TimerWheel
 from .start import OnStart
 from .stop import OnStop
 from .tick import OnTick
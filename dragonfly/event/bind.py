@@ -41,7 +41,7 @@ class EventBindClass(factory.create_external_class()):
         if hasattr(self._hive, "event_leader"):
             # Pull leader
             self._hive.event_leader()
-            dict(leader=self.leader)
+            return dict(leader=self.leader)
 
         return {}
 
@@ -69,11 +69,15 @@ _BindEvent = hive.dyna_hive("BindEvent", build_bind, declarator=factory.external
 
 
 class EventEnvironmentClass(factory.create_environment_class()):
+    """Event environment of a bound hive.
+
+    Handlers of the bound hive are registered directly with the parent event manager (with the leader prepended to
+    their patterns), so events are dispatched once through the parent's index, rather than again by each environment.
+    """
 
     def __init__(self, context):
         super().__init__(context)
 
-        self._dispatcher = EventDispatcher()
         self._hive = hive.get_run_hive()
 
         self._main_add_handler = context.plugins['event.add_handler']
@@ -82,51 +86,90 @@ class EventEnvironmentClass(factory.create_environment_class()):
         self._can_process_events = True
 
         leader = context.config.get('leader', None)
-        self._main_handler = EventHandler(self.handle_event, leader)
-        self._handler_is_registered = False
+        self._leader = tuple(leader) if leader else ()
+
+        # Map of handler to handlers registered with parent
+        self._main_handlers = {}
 
-    def _update_listener_state(self):
-        has_handlers = self._dispatcher.has_handlers
+        # Dispatcher for events read by the bound hive itself, created on demand
+        self._dispatcher = None
 
-        needs_unregistration = not (has_handlers and self._can_process_events) and self._handler_is_registered
-        needs_registration = has_handlers and self._can_process_events and not self._handler_is_registered
+    def _create_main_handler(self, handler):
+        leader = self._leader
+        if not leader:
+            return handler
 
-        if needs_registration:
-            self._main_add_handler(self._main_handler)
-            self._handler_is_registered = True
+        pattern = handler.pattern
+        if not pattern:
+            return EventHandler(handler.callback, leader, handler.priority, mode="leader")
 
-        elif needs_unregistration:
-            self._main_remove_handler(self._main_handler)
-            self._handler_is_registered = False
+        return EventHandler(handler.callback, leader + tuple(pattern), handler.priority, handler.mode)
 
     def pause(self):
         assert self._can_process_events
         self._can_process_events = False
 
-        self._update_listener_state()
+        for main_handlers in self._main_handlers.values():
+            for main_handler in main_handlers:
+                self._main_remove_handler(main_handler)
 
     def resume(self):
         assert not self._can_process_events
         self._can_process_events = True
 
-        self._update_listener_state()
+        for main_handlers in self._main_handlers.values():
+            for main_handler in main_handlers:
+                self._main_add_handler(main_handler)
 
     def add_handler(self, handler):
-        self._dispatcher.add_handler(handler)
-        self._update_listener_state()
+        main_handler = self._create_main_handler(handler)
+        self._main_handlers.setdefault(handler, []).append(main_handler)
+
+        if self._can_process_events:
+            self._main_add_handler(main_handler)
+
+        if self._dispatcher is not None:
+            self._dispatcher.add_handler(handler)
 
     def remove_handler(self, handler):
-        self._dispatcher.remove_handler(handler)
-        self._update_listener_state()
+        try:
+            main_handlers = self._main_handlers[handler]
+
+        except KeyError:
+            raise ValueError("{} is not a registered handler".format(handler))
+
+        main_handler = main_handlers.pop(0)
+        if not main_handlers:
+            del self._main_handlers[handler]
+
+        if self._can_process_events:
+            self._main_remove_handler(main_handler)
+
+        if self._dispatcher is not None:
+            self._dispatcher.remove_handler(handler)
 
     def handle_event(self, event):
+        """Dispatch event to the handlers of the bound hive only"""
+        if self._dispatcher is None:
+            self._dispatcher = EventDispatcher()
+
+            for handler, main_handlers in self._main_handlers.items():
+                for _ in main_handlers:
+                    self._dispatcher.add_handler(handler)
+
         self._dispatcher.handle_event(event)
 
     def on_closed(self):
         """Disconnect from external event stream"""
-        self._dispatcher.clear_handlers()
+        if self._can_process_events:
+            for main_handlers in self._main_handlers.values():
+                for main_handler in main_handlers:
+                    self._main_remove_handler(main_handler)
+
+        self._main_handlers.clear()
 
-        self._update_listener_state()
+        if self._dispatcher is not None:
+            self._dispatcher.clear_handlers()
 
 
 def declare_event_environment(meta_args):
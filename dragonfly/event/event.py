@@ -1,5 +1,12 @@
+from bisect import bisect_left, insort
+from collections import deque
+from heapq import merge
+from itertools import count
+
 import hive
 
+from .scheduler import TickScheduler, TimerWheel
+
 
 def match_leader(event, leader):
     event_leader = event[:len(leader)]
@@ -44,38 +51,354 @@ class EventHandler:
                     self.callback()
 
 
+class _HandlerEntry:
+    """Registration of an EventHandler within an EventDispatcher"""
+
+    __slots__ = ("sort_key", "handler", "tail_index", "is_active")
+
+    def __init__(self, handler, sequence_id):
+        # Handlers of equal priority are called in order of registration
+        self.sort_key = handler.priority, sequence_id
+        self.handler = handler
+        self.is_active = True
+
+        pattern = handler.pattern
+
+        # Index from which the event tail is passed to the callback (None for no arguments, 0 for the whole event)
+        if not pattern:
+            self.tail_index = 0
+
+        elif handler.mode == "leader":
+            self.tail_index = len(pattern)
+
+        else:
+            self.tail_index = None
+
+    def __lt__(self, other):
+        return self.sort_key < other.sort_key
+
+
+class _PrefixNode:
+    """Node of the trie of leader / trigger patterns"""
+
+    __slots__ = ("entries", "children")
+
+    def __init__(self):
+        self.entries = []
+        self.children = {}
+
+
 class EventDispatcher:
+    """Dispatch events to handlers in order of priority.
+
+    Handlers are indexed by pattern (exact-match handlers by hash, leader and trigger handlers in a trie of pattern
+    elements), so only the handlers which match an event are visited. Handler priority and pattern are read when the
+    handler is added.
+    """
+
+    max_cached_events = 1024
 
     def __init__(self):
-        self._handlers = []
+        self._entries = {}
+        self._sequence_ids = count()
+
+        self._any_entries = []
+        self._match_entries = {}
+        self._prefix_root = _PrefixNode()
+
+        # Map of event to matching entries, invalidated when handlers change
+        self._dispatch_cache = {}
 
     @property
     def has_handlers(self):
-        return bool(self._handlers)
+        return bool(self._entries)
+
+    def _get_entries_for(self, handler, create):
+        """Return sorted list of entries which holds handlers with the same pattern, or None if never called"""
+        pattern = handler.pattern
+        if not pattern:
+            return self._any_entries
+
+        pattern = tuple(pattern)
+        mode = handler.mode
+
+        if mode == "match":
+            if create:
+                return self._match_entries.setdefault(pattern, [])
+
+            return self._match_entries[pattern]
+
+        if mode not in ("leader", "trigger"):
+            return None
+
+        node = self._prefix_root
+        for element in pattern:
+            if create:
+                node = node.children.setdefault(element, _PrefixNode())
+
+            else:
+                node = node.children[element]
+
+        return node.entries
+
+    def _prune(self, handler):
+        """Remove empty index entries for the pattern of handler"""
+        pattern = handler.pattern
+        if not pattern:
+            return
+
+        pattern = tuple(pattern)
+
+        if handler.mode == "match":
+            if not self._match_entries[pattern]:
+                del self._match_entries[pattern]
+
+            return
+
+        path = [self._prefix_root]
+        for element in pattern:
+            path.append(path[-1].children[element])
+
+        for element, parent, node in zip(reversed(pattern), reversed(path[:-1]), reversed(path[1:])):
+            if node.entries or node.children:
+                break
+
+            del parent.children[element]
 
     def add_handler(self, handler):
-        self._handlers.append(handler)
-        self._handlers.sort()
+        entry = _HandlerEntry(handler, next(self._sequence_ids))
+        self._entries.setdefault(handler, []).append(entry)
+
+        entries = self._get_entries_for(handler, create=True)
+        if entries is not None:
+            insort(entries, entry)
+
+        self._dispatch_cache.clear()
 
     def remove_handler(self, handler):
-        self._handlers.remove(handler)
-        self._handlers.sort()
+        try:
+            handler_entries = self._entries[handler]
+
+        except KeyError:
+            raise ValueError("{} is not a registered handler".format(handler))
+
+        entry = handler_entries.pop(0)
+        if not handler_entries:
+            del self._entries[handler]
+
+        # Handler may be removed whilst an event is being dispatched
+        entry.is_active = False
+
+        entries = self._get_entries_for(handler, create=False)
+        if entries is not None:
+            del entries[bisect_left(entries, entry)]
+            self._prune(handler)
+
+        self._dispatch_cache.clear()
 
     def clear_handlers(self):
-        self._handlers.clear()
+        for handler_entries in self._entries.values():
+            for entry in handler_entries:
+                entry.is_active = False
+
+        self._entries.clear()
+        self._any_entries = []
+        self._match_entries.clear()
+        self._prefix_root = _PrefixNode()
+        self._dispatch_cache.clear()
+
+    def _find_entries(self, event):
+        """Return tuple of entries whose handlers match event, in order of priority"""
+        candidates = []
+
+        if self._any_entries:
+            candidates.append(self._any_entries)
+
+        try:
+            match_entries = self._match_entries.get(event)
+
+        except TypeError:
+            match_entries = None
+
+        if match_entries:
+            candidates.append(match_entries)
+
+        node = self._prefix_root
+        for element in event:
+            try:
+                node = node.children.get(element)
+
+            except TypeError:
+                break
+
+            if node is None:
+                break
+
+            if node.entries:
+                candidates.append(node.entries)
+
+        if len(candidates) == 1:
+            return tuple(candidates[0])
+
+        return tuple(merge(*candidates))
 
     def handle_event(self, event):
-        for handler in self._handlers:
-            handler(event)
+        dispatch_cache = self._dispatch_cache
+
+        try:
+            entries = dispatch_cache[event]
+
+        except KeyError:
+            entries = self._find_entries(event)
+
+            if len(dispatch_cache) >= self.max_cached_events:
+                dispatch_cache.clear()
+
+            dispatch_cache[event] = entries
+
+        # Unhashable event
+        except TypeError:
+            entries = self._find_entries(event)
+
+        for entry in entries:
+            if not entry.is_active:
+                continue
+
+            tail_index = entry.tail_index
+
+            if tail_index is None:
+                entry.handler.callback()
+
+            elif tail_index:
+                entry.handler.callback(event[tail_index:])
+
+            else:
+                entry.handler.callback(event)
 
 
 class EventHiveClass(EventDispatcher):
 
-    def __init__(self):
+    overflow_policies = ("drop_oldest", "drop_newest", "flush")
+
+    @hive.types(queued='bool', coalesce='bool', max_queue_size='int', overflow_policy='str')
+    @hive.options(overflow_policy=set(overflow_policies))
+    def __init__(self, queued=False, coalesce=False, max_queue_size=1024, overflow_policy="drop_oldest"):
         super(EventHiveClass, self).__init__()
 
+        if overflow_policy not in self.overflow_policies:
+            raise ValueError("Invalid overflow policy '{}', expected one of {}"
+                             .format(overflow_policy, self.overflow_policies))
+
         self.pushed_event = None
 
+        # Events pushed into event_in are queued until the next tick, if queued
+        self.queued = queued
+        self.coalesce = coalesce
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+
+        self.max_queue_depth = 0
+        self.dropped_count = 0
+        self.coalesced_count = 0
+
+        self._event_queue = deque()
+        self._queued_events = set()
+
+        if queued:
+            # Drain queue before other tick handlers
+            self.add_handler(EventHandler(self.flush_events, ("tick",), priority=float("-inf"), mode="match"))
+
+        # Tick subscribers are called from one handler
+        self.tick_scheduler = TickScheduler()
+        self._tick_handler = EventHandler(self.tick_scheduler.tick, ("tick",), mode="match")
+        self._tick_handler_is_registered = False
+
+        # Timers are advanced by the tick scheduler. The wheel is created by the first schedule() call, as its slots
+        # are costly for event managers which never schedule a timer
+        self.timer_wheel = None
+
+    @hive.typed_property("int")
+    def queue_depth(self):
+        return len(self._event_queue)
+
+    def queue_event(self, event):
+        """Queue event to be dispatched by flush_events"""
+        queued_events = self._queued_events
+
+        try:
+            is_queued = self.coalesce and event in queued_events
+
+        # Unhashable events are not coalesced
+        except TypeError:
+            is_queued = False
+
+        if is_queued:
+            self.coalesced_count += 1
+            return
+
+        event_queue = self._event_queue
+
+        if len(event_queue) >= self.max_queue_size:
+            overflow_policy = self.overflow_policy
+
+            if overflow_policy == "drop_newest":
+                self.dropped_count += 1
+                return
+
+            elif overflow_policy == "drop_oldest":
+                self._discard_queued(event_queue.popleft())
+                self.dropped_count += 1
+
+            else:
+                self.flush_events()
+
+        event_queue.append(event)
+
+        if self.coalesce:
+            try:
+                queued_events.add(event)
+
+            except TypeError:
+                pass
+
+        if len(event_queue) > self.max_queue_depth:
+            self.max_queue_depth = len(event_queue)
+
+    def _discard_queued(self, event):
+        if self.coalesce:
+            try:
+                self._queued_events.discard(event)
+
+            except TypeError:
+                pass
+
+    def flush_events(self):
+        """Dispatch queued events (events queued meanwhile are left for the next flush)"""
+        event_queue = self._event_queue
+
+        for _ in range(len(event_queue)):
+            event = event_queue.popleft()
+            self._discard_queued(event)
+            self.handle_event(event)
+
+    def add_tick_subscriber(self, callback, divisor=1, phase=None):
+        if not self._tick_handler_is_registered:
+            self.add_handler(self._tick_handler)
+            self._tick_handler_is_registered = True
+
+        return self.tick_scheduler.add_subscriber(callback, divisor, phase)
+
+    def remove_tick_subscriber(self, subscription):
+        self.tick_scheduler.remove_subscriber(subscription)
+
+    def schedule(self, delay, callback):
+        timer_wheel = self.timer_wheel
+        if timer_wheel is None:
+            timer_wheel = self.timer_wheel = TimerWheel()
+            self.add_tick_subscriber(timer_wheel.advance)
+
+        return timer_wheel.schedule(delay, callback)
+
     def on_started(self):
         self.handle_event(("start",))
 
@@ -83,13 +406,22 @@ class EventHiveClass(EventDispatcher):
         self.handle_event(("stop",))
 
     def on_event_in(self):
-        self.handle_event(self.pushed_event)
+        if self.queued:
+            self.queue_event(self.pushed_event)
+
+        else:
+            self.handle_event(self.pushed_event)
 
 
 def event_builder(cls, i, ex, args):
     ex.add_handler = hive.plugin(cls.add_handler, identifier="event.add_handler", export_to_parent=True)
     ex.remove_handler = hive.plugin(cls.remove_handler, identifier="event.remove_handler", export_to_parent=True)
     ex.read_event = hive.plugin(cls.handle_event, identifier="event.process", export_to_parent=True)
+    ex.add_tick_subscriber = hive.plugin(cls.add_tick_subscriber, identifier="event.add_tick_subscriber",
+                                         export_to_parent=True)
+    ex.remove_tick_subscriber = hive.plugin(cls.remove_tick_subscriber, identifier="event.remove_tick_subscriber",
+                                            export_to_parent=True)
+    ex.schedule = hive.plugin(cls.schedule, identifier="time.schedule", export_to_parent=True)
 
     # Send startup and stop events
     ex.on_stopped = hive.plugin(cls.on_stopped, identifier="on_stopped")
@@ -103,6 +435,25 @@ def event_builder(cls, i, ex, args):
     i.on_event_in = hive.triggerable(cls.on_event_in)
     hive.trigger(i.push_event, i.on_event_in)
 
+    # Event queue
+    i.flush_events = hive.triggerable(cls.flush_events)
+    ex.flush_events = hive.entry(i.flush_events)
+
+    i.pull_queue_depth = hive.pull_out(cls.queue_depth)
+    ex.queue_depth = hive.output(i.pull_queue_depth)
+
+    i.max_queue_depth = hive.property(cls, 'max_queue_depth', 'int')
+    i.pull_max_queue_depth = hive.pull_out(i.max_queue_depth)
+    ex.max_queue_depth = hive.output(i.pull_max_queue_depth)
+
+    i.dropped_count = hive.property(cls, 'dropped_count', 'int')
+    i.pull_dropped_count = hive.pull_out(i.dropped_count)
+    ex.dropped_count = hive.output(i.pull_dropped_count)
+
+    i.coalesced_count = hive.property(cls, 'coalesced_count', 'int')
+    i.pull_coalesced_count = hive.pull_out(i.coalesced_count)
+    ex.coalesced_count = hive.output(i.pull_coalesced_count)
+
 
 EventManager = hive.hive("EventHive", event_builder, EventHiveClass)
 
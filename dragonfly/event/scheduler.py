@@ -0,0 +1,220 @@
+class TickSubscription:
+    """Subscription of a callback to a TickScheduler, called every divisor ticks"""
+
+    __slots__ = ("callback", "divisor", "phase", "is_enabled", "is_removed")
+
+    def __init__(self, callback, divisor, phase):
+        self.callback = callback
+        self.divisor = divisor
+        self.phase = phase
+        self.is_enabled = True
+        self.is_removed = False
+
+    def enable(self):
+        self.is_enabled = True
+
+    def disable(self):
+        self.is_enabled = False
+
+
+class TickScheduler:
+    """Call tick subscribers from a single flat list, rather than through individual event handlers.
+
+    Subscribers with a divisor greater than one are called every divisor ticks, and are staggered across ticks.
+    Enabling and disabling subscriptions only sets a flag; removed subscriptions are compacted on the next tick.
+    """
+
+    def __init__(self):
+        self._subscriptions = []
+        self._subscription_counts = {}
+        self._needs_compaction = False
+
+        self.tick_count = 0
+
+    @property
+    def has_subscriptions(self):
+        return bool(self._subscriptions)
+
+    def add_subscriber(self, callback, divisor=1, phase=None):
+        """Subscribe callback to be called every divisor ticks, and return its TickSubscription.
+
+        :param callback: callable without arguments
+        :param divisor: number of ticks between calls
+        :param phase: tick offset at which the callback is called (assigned round-robin if None)
+        """
+        if divisor < 1:
+            raise ValueError("Tick divisor must be at least one, not {}".format(divisor))
+
+        # Spread subscribers with the same divisor evenly across ticks
+        subscription_count = self._subscription_counts.get(divisor, 0)
+        self._subscription_counts[divisor] = subscription_count + 1
+
+        if phase is None:
+            phase = subscription_count
+
+        subscription = TickSubscription(callback, divisor, phase % divisor)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def remove_subscriber(self, subscription):
+        if subscription.is_removed:
+            raise ValueError("{} is not a registered subscription".format(subscription))
+
+        subscription.is_enabled = False
+        subscription.is_removed = True
+        self._needs_compaction = True
+
+    def clear_subscribers(self):
+        for subscription in self._subscriptions:
+            subscription.is_enabled = False
+            subscription.is_removed = True
+
+        self._subscriptions = []
+        self._subscription_counts.clear()
+        self._needs_compaction = False
+
+    def tick(self):
+        if self._needs_compaction:
+            self._subscriptions = [s for s in self._subscriptions if not s.is_removed]
+            self._needs_compaction = False
+
+        tick_count = self.tick_count
+        self.tick_count = tick_count + 1
+
+        # Subscriptions added during this tick are called from the next tick
+        for subscription in tuple(self._subscriptions):
+            if subscription.is_enabled and (subscription.divisor == 1 or
+                                            (tick_count - subscription.phase) % subscription.divisor == 0):
+                subscription.callback()
+
+
+class Timer:
+    """Pending callback of a TimerWheel"""
+
+    __slots__ = ("callback", "delay", "expires", "_wheel", "_slot")
+
+    def __init__(self, wheel, callback, delay):
+        self.callback = callback
+        self.delay = delay
+        self.expires = None
+
+        self._wheel = wheel
+        self._slot = None
+
+    @property
+    def is_pending(self):
+        return self._slot is not None
+
+    @property
+    def remaining(self):
+        """Number of ticks until the timer expires (zero if not pending)"""
+        if self._slot is None:
+            return 0
+
+        return self.expires - self._wheel.current_tick
+
+    def cancel(self):
+        if self._slot is not None:
+            del self._slot[self]
+            self._slot = None
+            self._wheel.pending_count -= 1
+
+    def rearm(self, delay=None):
+        """Restart the timer, using the previous delay if none is given"""
+        self.cancel()
+
+        if delay is not None:
+            self.delay = delay
+
+        self._wheel._insert(self, self._wheel.current_tick + self.delay)
+
+
+class TimerWheel:
+    """Hierarchical timer wheel, which calls callbacks a number of ticks after they are scheduled.
+
+    Each level divides time into 2 ** slot_bits slots, which each span the range of a whole slot of the level below.
+    When the lowest level wraps around, timers from the next slot of the level above are moved down. Scheduling,
+    cancellation and advancing a tick have constant cost, independently of the number of pending timers.
+    """
+
+    slot_bits = 8
+    level_count = 4
+
+    def __init__(self):
+        slot_count = 1 << self.slot_bits
+
+        self._levels = [[{} for _ in range(slot_count)] for _ in range(self.level_count)]
+        self._slot_mask = slot_count - 1
+        self._max_delay = (1 << (self.slot_bits * self.level_count)) - 1
+
+        self.current_tick = 0
+        self.pending_count = 0
+
+    def schedule(self, delay, callback):
+        """Call callback after delay ticks, and return its Timer.
+
+        :param delay: number of ticks (at least one)
+        :param callback: callable without arguments
+        """
+        if delay < 1:
+            raise ValueError("Timer delay must be at least one tick, not {}".format(delay))
+
+        timer = Timer(self, callback, delay)
+        self._insert(timer, self.current_tick + delay)
+        return timer
+
+    def _insert(self, timer, expires):
+        current_tick = self.current_tick
+        expires = min(expires, current_tick + self._max_delay)
+
+        # Find the lowest level which spans the remaining ticks
+        remaining = expires - current_tick
+        level = 0
+        shift = 0
+        while remaining >> (shift + self.slot_bits) and level < self.level_count - 1:
+            level += 1
+            shift += self.slot_bits
+
+        slot = self._levels[level][(expires >> shift) & self._slot_mask]
+        slot[timer] = None
+
+        timer.expires = expires
+        timer._slot = slot
+        self.pending_count += 1
+
+    def _cascade(self, level):
+        """Move timers of the current slot of level to lower levels"""
+        index = (self.current_tick >> (level * self.slot_bits)) & self._slot_mask
+        slots = self._levels[level]
+
+        timers = slots[index]
+        slots[index] = {}
+
+        self.pending_count -= len(timers)
+        for timer in timers:
+            self._insert(timer, timer.expires)
+
+        return index
+
+    def advance(self):
+        """Advance by one tick, and call the callbacks of expired timers"""
+        self.current_tick += 1
+
+        index = self.current_tick & self._slot_mask
+        if not index:
+            for level in range(1, self.level_count):
+                if self._cascade(level):
+                    break
+
+        slots = self._levels[0]
+        timers = slots[index]
+        if not timers:
+            return
+
+        slots[index] = {}
+
+        # Callbacks may schedule, cancel or re-arm other timers, including those in this slot
+        for timer in list(timers):
+            if timer._slot is timers:
+                timer.cancel()
+                timer.callback()
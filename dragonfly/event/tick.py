@@ -5,46 +5,87 @@ from .event import EventHandler
 
 class _TickCls:
 
-    @hive.types(activate_on_start='bool')
-    def __init__(self, activate_on_start=True):
+    @hive.types(activate_on_start='bool', divisor='int')
+    def __init__(self, activate_on_start=True, divisor=1):
         self._hive = hive.get_run_hive()
 
         self._add_handler = None
         self._remove_handler = None
 
+        self._subscription = None
+
         self._active = False
         self._activate_on_started = activate_on_start
 
+        self._divisor = divisor
+        self._tick_count = 0
+
+        self._handler = EventHandler(self._on_tick_event, ("tick",), mode="match")
+
+    def _on_tick_event(self):
+        """Trigger on_tick every divisor ticks, if no tick scheduler is available"""
+        tick_count = self._tick_count
+        self._tick_count = tick_count + 1
+
+        if not tick_count % self._divisor:
+            self._hive._on_tick()
+
     def set_add_handler(self, add_handler):
         self._add_handler = add_handler
 
-        self._handler = EventHandler(self._hive._on_tick, ("tick",), mode="match")
-
         if self._activate_on_started:
             self.enable()
 
     def set_remove_handler(self, remove_handler):
         self._remove_handler = remove_handler
 
-    def enable(self):
+    def set_add_tick_subscriber(self, add_tick_subscriber):
+        # Replace the event handler registered by set_add_handler
+        if self._active and self._subscription is None:
+            self._remove_handler(self._handler)
+
+        self._subscription = add_tick_subscriber(self._hive._on_tick, self._divisor)
+
         if not self._active:
+            self._subscription.disable()
+
+    def enable(self):
+        if self._active:
+            return
+
+        if self._subscription is not None:
+            self._subscription.enable()
+
+        else:
             self._add_handler(self._handler)
-            self._active = True
+
+        self._active = True
 
     def disable(self):
-        if self._active:
+        if not self._active:
+            return
+
+        if self._subscription is not None:
+            self._subscription.disable()
+
+        else:
             self._remove_handler(self._handler)
-            self._active = False
+
+        self._active = False
 
 
 def build_tick(cls, i, ex, args):
-    """Tick event sensor, trigger on_tick every tick"""
+    """Tick event sensor, trigger on_tick every tick (or every divisor ticks)"""
     i.on_tick = hive.triggerfunc()
     ex.on_tick = hive.hook(i.on_tick)
 
     ex.get_add_handler = hive.socket(cls.set_add_handler, "event.add_handler", policy=hive.SingleRequired)
     ex.get_remove_handler = hive.socket(cls.set_remove_handler, "event.remove_handler", policy=hive.SingleRequired)
 
+    # Use batched tick scheduler of the event manager, if available
+    ex.get_add_tick_subscriber = hive.socket(cls.set_add_tick_subscriber, "event.add_tick_subscriber",
+                                             policy=hive.SingleOptional)
+
     i.enable = hive.triggerable(cls.enable)
     ex.enable = hive.entry(i.enable)
 
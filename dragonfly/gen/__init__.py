@@ -4,4 +4,6 @@ from .iter_ import Iterator
 from .next_ import Next
 from .while_ import While
 from .range_ import Range
+from .sliced_foreach import SlicedForEach
+from .stream import Map, Filter, Chunk, Window, Take
 from .zip_ import Zip
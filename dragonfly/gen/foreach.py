@@ -1,8 +1,11 @@
+from itertools import islice
+
 import hive
 
 
 def declare_foreach(meta_args):
     meta_args.data_type = hive.parameter("str", "int")
+    meta_args.chunk_size = hive.parameter("int", 1)
 
 
 def do_iter(self):
@@ -20,12 +23,36 @@ def do_iter(self):
     self.finished()
 
 
+def create_iter_chunked(chunk_size):
+    """Create modifier which pushes lists of up to chunk_size items, to amortise the cost of each push"""
+    def do_iter_chunked(self):
+        self._break_ = False
+
+        iterator = iter(self._iterable)
+        index = 0
+
+        while not self._break_:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+
+            self._chunk = chunk
+            self._index = index
+
+            self.chunk.push()
+            index += len(chunk)
+
+        self.finished()
+
+    return do_iter_chunked
+
+
 def do_break(self):
     self._break_ = True
 
 
 def build_foreach(i, ex, args, meta_args):
-    """Iterate over iterable object"""
+    """Iterate over iterable object, pushing each item (or lists of chunk_size items if chunk_size > 1)"""
     # Set iterable
     i.iterable = hive.attribute()
     i.pull_iterable = hive.pull_in(i.iterable)
@@ -37,9 +64,19 @@ def build_foreach(i, ex, args, meta_args):
 
     i.break_ = hive.attribute('bool', False)
 
-    i.item = hive.attribute(meta_args.data_type)
-    i.push_item = hive.push_out(i.item)
-    ex.item = hive.output(i.push_item)
+    if meta_args.chunk_size > 1:
+        i.chunk = hive.attribute("list")
+        i.push_chunk = hive.push_out(i.chunk)
+        ex.chunk = hive.output(i.push_chunk)
+
+        i.iter = hive.modifier(create_iter_chunked(meta_args.chunk_size))
+
+    else:
+        i.item = hive.attribute(meta_args.data_type)
+        i.push_item = hive.push_out(i.item)
+        ex.item = hive.output(i.push_item)
+
+        i.iter = hive.modifier(do_iter)
 
     i.index = hive.attribute('int', 0)
     i.pull_index = hive.pull_out(i.index)
@@ -51,7 +88,6 @@ def build_foreach(i, ex, args, meta_args):
     ex.break_ = hive.entry(i.do_break)
     ex.finished = hive.hook(i.finished)
 
-    i.iter = hive.modifier(do_iter)
     hive.trigger(i.do_trig, i.pull_iterable)
     hive.trigger(i.do_trig, i.iter)
 
@@ -0,0 +1,188 @@
+from time import perf_counter
+
+import hive
+
+from ..event import EventHandler
+
+
+class _SlicedForEachCls:
+
+    @hive.types(max_items='int', max_time='float')
+    def __init__(self, max_items=100, max_time=0.0):
+        self._hive = hive.get_run_hive()
+
+        self._add_handler = None
+        self._remove_handler = None
+
+        self._subscription = None
+        self._handler = EventHandler(self.on_tick, ("tick",), mode="match")
+        self._active = False
+
+        # Limits per tick (0 disables a limit); max_time is in milliseconds
+        self.max_items = max_items
+        self.max_time = max_time
+
+        self.iterable = None
+        self._iterator = None
+        self._length = None
+
+        self.item = None
+        self.index = 0
+        self.count = 0
+        self.running = False
+
+    @hive.typed_property("float")
+    def progress(self):
+        """Fraction of items processed, if the length of the iterable is known (otherwise 0.0 until finished)"""
+        if self._length:
+            return min(self.count / self._length, 1.0)
+
+        if self._iterator is not None and not self.running:
+            return 1.0
+
+        return 0.0
+
+    def set_add_handler(self, add_handler):
+        self._add_handler = add_handler
+
+    def set_remove_handler(self, remove_handler):
+        self._remove_handler = remove_handler
+
+    def set_add_tick_subscriber(self, add_tick_subscriber):
+        self._subscription = add_tick_subscriber(self.on_tick)
+        self._subscription.disable()
+
+    def _enable(self):
+        if self._active:
+            return
+
+        if self._subscription is not None:
+            self._subscription.enable()
+
+        else:
+            self._add_handler(self._handler)
+
+        self._active = True
+
+    def _disable(self):
+        if not self._active:
+            return
+
+        if self._subscription is not None:
+            self._subscription.disable()
+
+        else:
+            self._remove_handler(self._handler)
+
+        self._active = False
+
+    def start(self):
+        try:
+            self._length = len(self.iterable)
+
+        except TypeError:
+            self._length = None
+
+        self._iterator = iter(self.iterable)
+        self.index = 0
+        self.count = 0
+        self.running = True
+
+        self._enable()
+
+    def break_(self):
+        if self.running:
+            self._finish()
+
+    def _finish(self):
+        self.running = False
+        self._disable()
+
+        self._hive.finished()
+
+    def on_tick(self):
+        """Push items until the iterator is exhausted, or a limit for this tick is reached"""
+        iterator = self._iterator
+        push_item = self._hive.item.push
+
+        max_items = self.max_items or -1
+        deadline = perf_counter() + self.max_time / 1000 if self.max_time else None
+
+        while max_items and self.running:
+            try:
+                self.item = next(iterator)
+
+            except StopIteration:
+                self._finish()
+                return
+
+            self.index = index = self.count
+            self.count = index + 1
+
+            push_item()
+
+            max_items -= 1
+
+            # Reading the clock is costly compared with pushing an item, so only do so periodically
+            if deadline is not None and not index & 15 and perf_counter() >= deadline:
+                break
+
+
+def declare_sliced_foreach(meta_args):
+    meta_args.data_type = hive.parameter("str", "int")
+
+
+def build_sliced_foreach(cls, i, ex, args, meta_args):
+    """Iterate over iterable object across ticks, pushing at most max_items items (or for at most max_time
+    milliseconds) per tick
+    """
+    i.iterable = hive.property(cls, "iterable")
+    i.pull_iterable = hive.pull_in(i.iterable)
+    ex.iterable = hive.antenna(i.pull_iterable)
+
+    i.do_start = hive.triggerfunc()
+    i.trig_start = hive.triggerable(i.do_start)
+    ex.start = hive.entry(i.trig_start)
+
+    i.start = hive.triggerable(cls.start)
+    hive.trigger(i.do_start, i.pull_iterable)
+    hive.trigger(i.do_start, i.start)
+
+    i.break_ = hive.triggerable(cls.break_)
+    ex.break_ = hive.entry(i.break_)
+
+    i.item = hive.property(cls, "item", meta_args.data_type)
+    i.push_item = hive.push_out(i.item)
+    ex.item = hive.output(i.push_item)
+
+    i.index = hive.property(cls, "index", "int")
+    i.pull_index = hive.pull_out(i.index)
+    ex.index = hive.output(i.pull_index)
+
+    i.count = hive.property(cls, "count", "int")
+    i.pull_count = hive.pull_out(i.count)
+    ex.count = hive.output(i.pull_count)
+
+    i.pull_progress = hive.pull_out(cls.progress)
+    ex.progress = hive.output(i.pull_progress)
+
+    i.running = hive.property(cls, "running", "bool")
+    i.pull_running = hive.pull_out(i.running)
+    ex.running = hive.output(i.pull_running)
+
+    ex.max_items = hive.property(cls, "max_items", "int")
+    ex.max_time = hive.property(cls, "max_time", "float")
+
+    i.finished = hive.triggerfunc()
+    ex.finished = hive.hook(i.finished)
+
+    ex.get_add_handler = hive.socket(cls.set_add_handler, "event.add_handler", policy=hive.SingleRequired)
+    ex.get_remove_handler = hive.socket(cls.set_remove_handler, "event.remove_handler", policy=hive.SingleRequired)
+
+    # Use batched tick scheduler of the event manager, if available
+    ex.get_add_tick_subscriber = hive.socket(cls.set_add_tick_subscriber, "event.add_tick_subscriber",
+                                             policy=hive.SingleOptional)
+
+
+SlicedForEach = hive.dyna_hive("SlicedForEach", build_sliced_foreach, declare_sliced_foreach,
+                               builder_cls=_SlicedForEachCls)
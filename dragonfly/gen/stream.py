@@ -0,0 +1,129 @@
+"""Streaming hives, which compose lazily over iterators.
+
+Each hive pulls an iterable from its antenna and outputs a new iterator which wraps it, so chains of streaming hives
+only consume their source when the final iterator is consumed (e.g. by ForEach or Next).
+"""
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+
+import hive
+
+from ..op.expression import _math_globals
+
+
+@lru_cache(maxsize=None)
+def compile_item_function(expression):
+    """Compile expression of the item "x" into a function of x, once per unique expression string"""
+    code = compile("lambda x: ({})".format(expression), "<item expression {!r}>".format(expression), "eval")
+    return eval(code, dict(_math_globals))
+
+
+def chunk_stream(iterable, size):
+    """Yield lists of size items, and a shorter final list for any remaining items"""
+    if size < 1:
+        raise ValueError("Chunk size must be at least 1, got {}".format(size))
+
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def window_stream(iterable, size, step=1):
+    """Yield tuples of size consecutive items, starting a new window every step items"""
+    if size < 1 or step < 1:
+        raise ValueError("Window size and step must be at least 1, got {} and {}".format(size, step))
+
+    window = deque(maxlen=size)
+    skip = 0
+
+    for item in iterable:
+        window.append(item)
+
+        if len(window) < size:
+            continue
+
+        if skip:
+            skip -= 1
+            continue
+
+        yield tuple(window)
+        skip = step - 1
+
+
+def _build_stream(i, ex, create_iterator):
+    """Add iterable antenna and iterator output, which wraps the pulled iterable with create_iterator"""
+    i.iterable = hive.attribute()
+    i.pull_iterable = hive.pull_in(i.iterable)
+    ex.iterable = hive.antenna(i.pull_iterable)
+
+    i.iterator = hive.attribute("iterator")
+    i.pull_iterator = hive.pull_out(i.iterator)
+    ex.iterator = hive.output(i.pull_iterator)
+
+    def do_stream(self):
+        self._iterator = create_iterator(self._iterable)
+
+    i.do_stream = hive.modifier(do_stream)
+
+    hive.trigger(i.pull_iterator, i.pull_iterable, pretrigger=True)
+    hive.trigger(i.pull_iterable, i.do_stream)
+
+
+def declare_item_expression(meta_args):
+    meta_args.expression = hive.parameter("str", "x")
+
+
+def build_map(i, ex, args, meta_args):
+    """Lazily evaluate expression of each item x"""
+    func = compile_item_function(meta_args.expression)
+    _build_stream(i, ex, lambda iterable: map(func, iterable))
+
+
+def build_filter(i, ex, args, meta_args):
+    """Lazily yield only the items x for which expression is true"""
+    func = compile_item_function(meta_args.expression)
+    _build_stream(i, ex, lambda iterable: filter(func, iterable))
+
+
+def declare_chunk(meta_args):
+    meta_args.size = hive.parameter("int", 16)
+
+
+def build_chunk(i, ex, args, meta_args):
+    """Lazily group items into lists of size items"""
+    size = meta_args.size
+    _build_stream(i, ex, lambda iterable: chunk_stream(iterable, size))
+
+
+def declare_window(meta_args):
+    meta_args.size = hive.parameter("int", 2)
+    meta_args.step = hive.parameter("int", 1)
+
+
+def build_window(i, ex, args, meta_args):
+    """Lazily yield sliding windows of size items"""
+    size = meta_args.size
+    step = meta_args.step
+    _build_stream(i, ex, lambda iterable: window_stream(iterable, size, step))
+
+
+def declare_take(meta_args):
+    meta_args.count = hive.parameter("int", 1)
+
+
+def build_take(i, ex, args, meta_args):
+    """Lazily yield the first count items"""
+    count = meta_args.count
+    _build_stream(i, ex, lambda iterable: islice(iterable, count))
+
+
+Map = hive.dyna_hive("Map", build_map, declare_item_expression)
+Filter = hive.dyna_hive("Filter", build_filter, declare_item_expression)
+Chunk = hive.dyna_hive("Chunk", build_chunk, declare_chunk)
+Window = hive.dyna_hive("Window", build_window, declare_window)
+Take = hive.dyna_hive("Take", build_take, declare_take)
@@ -0,0 +1 @@
+from .framing import Framing, FramingError, MessageDecoder, encode_message
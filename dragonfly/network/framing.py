@@ -0,0 +1,279 @@
+from struct import Struct
+
+import hive
+
+
+_u32 = Struct("!I")
+
+
+class FramingError(ValueError):
+    pass
+
+
+def encode_varint(value):
+    """Encode unsigned integer as LEB128 varint"""
+    encoded = bytearray()
+
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+
+        if value:
+            encoded.append(byte | 0x80)
+
+        else:
+            encoded.append(byte)
+            return bytes(encoded)
+
+
+def encode_message(message, mode="u32"):
+    """Return framed message, for the given framing mode ('varint', 'u32' or 'newline')"""
+    if mode == "u32":
+        return _u32.pack(len(message)) + message
+
+    elif mode == "varint":
+        return encode_varint(len(message)) + message
+
+    elif mode == "newline":
+        if b"\n" in message:
+            raise FramingError("Newline-delimited message cannot contain a newline")
+
+        return message + b"\n"
+
+    raise ValueError("Invalid framing mode '{}'".format(mode))
+
+
+class MessageDecoder:
+    """Reassemble framed messages from a stream of received chunks.
+
+    Received data is appended to a single buffer, from which complete messages are read by offset. Consumed data is
+    discarded only when it makes up most of the buffer, so the cost of decoding is linear in the size of the stream.
+    """
+
+    def __init__(self, mode="u32", max_message_size=1 << 24):
+        if mode not in ("varint", "u32", "newline"):
+            raise ValueError("Invalid framing mode '{}'".format(mode))
+
+        self.mode = mode
+        self.max_message_size = max_message_size
+
+        self._buffer = bytearray()
+        self._offset = 0
+
+        # Index from which to search for the next delimiter
+        self._search_offset = 0
+
+    @property
+    def pending_size(self):
+        """Number of received bytes not yet returned as messages"""
+        return len(self._buffer) - self._offset
+
+    def reset(self):
+        self._buffer.clear()
+        self._offset = 0
+        self._search_offset = 0
+
+    def _read_header(self):
+        """Return message length and header size, or None if the header is incomplete"""
+        buffer = self._buffer
+        offset = self._offset
+
+        if self.mode == "u32":
+            if len(buffer) - offset < 4:
+                return None
+
+            length, = _u32.unpack_from(buffer, offset)
+            return length, 4
+
+        length = 0
+        shift = 0
+        index = offset
+
+        while index < len(buffer):
+            byte = buffer[index]
+            length |= (byte & 0x7F) << shift
+            index += 1
+
+            if not byte & 0x80:
+                return length, index - offset
+
+            shift += 7
+            if shift > 63:
+                raise FramingError("Varint header is too long")
+
+        return None
+
+    def _read_delimited(self):
+        buffer = self._buffer
+
+        end = buffer.find(b"\n", self._search_offset)
+        if end == -1:
+            self._search_offset = len(buffer)
+
+            if len(buffer) - self._offset > self.max_message_size:
+                raise FramingError("Message exceeds maximum size of {} bytes".format(self.max_message_size))
+
+            return None
+
+        message = bytes(buffer[self._offset:end])
+        self._offset = self._search_offset = end + 1
+        return message
+
+    def _read_prefixed(self):
+        header = self._read_header()
+        if header is None:
+            return None
+
+        length, header_size = header
+        if length > self.max_message_size:
+            raise FramingError("Message of {} bytes exceeds maximum size of {} bytes"
+                               .format(length, self.max_message_size))
+
+        start = self._offset + header_size
+        end = start + length
+        if end > len(self._buffer):
+            return None
+
+        message = bytes(self._buffer[start:end])
+        self._offset = end
+        return message
+
+    def feed(self, data):
+        """Add received data, and return list of completed messages"""
+        buffer = self._buffer
+        buffer += data
+
+        read_message = self._read_delimited if self.mode == "newline" else self._read_prefixed
+
+        messages = []
+        while True:
+            message = read_message()
+            if message is None:
+                break
+
+            messages.append(message)
+
+        # Discard consumed data once it outweighs the remainder
+        offset = self._offset
+        if offset and offset * 2 >= len(buffer):
+            del buffer[:offset]
+            self._search_offset = max(self._search_offset - offset, 0)
+            self._offset = 0
+
+        return messages
+
+
+class _FramingClass:
+
+    @hive.types(max_message_size='int')
+    def __init__(self, max_message_size=1 << 24):
+        self._hive = hive.get_run_hive()
+
+        meta_args = self._hive._hive_object._hive_meta_args_frozen
+        self._mode = meta_args.mode
+        self._max_message_size = max_message_size
+
+        # Decoders by address, if by_address
+        self._decoders = {}
+        self._decoder = MessageDecoder(self._mode, max_message_size)
+
+        self.received_data = None
+        self.message = None
+
+        self.address = None
+        self.message_address = None
+        self.closed_address = None
+
+        self.outgoing_message = None
+        self.framed_data = None
+
+    def _get_decoder(self):
+        try:
+            return self._decoders[self.address]
+
+        except KeyError:
+            decoder = self._decoders[self.address] = MessageDecoder(self._mode, self._max_message_size)
+            return decoder
+
+    def decode(self):
+        if self.address is not None:
+            decoder = self._get_decoder()
+
+        else:
+            decoder = self._decoder
+
+        for message in decoder.feed(self.received_data):
+            self.message_address = self.address
+            self.message = message
+            self._hive._on_message()
+
+    def encode(self):
+        self.framed_data = encode_message(self.outgoing_message, self._mode)
+        self._hive._on_framed()
+
+    def reset(self):
+        """Discard partial message received from closed address"""
+        self._decoders.pop(self.closed_address, None)
+
+
+def declare_framing(meta_args):
+    meta_args.mode = hive.parameter("str", "u32", options={"varint", "u32", "newline"})
+    meta_args.by_address = hive.parameter("bool", False)
+
+
+def build_framing(cls, i, ex, args, meta_args):
+    """Split received byte stream into messages, and frame outgoing messages.
+
+    Messages are length-prefixed by a varint or u32 header, or delimited by newlines
+    """
+    # Decoding
+    i.received_data = hive.property(cls, "received_data", "bytes")
+    i.push_received_data = hive.push_in(i.received_data)
+    ex.data_in = hive.antenna(i.push_received_data)
+
+    i.decode = hive.triggerable(cls.decode)
+    hive.trigger(i.push_received_data, i.decode)
+
+    i.message = hive.property(cls, "message", "bytes")
+    i.push_message = hive.push_out(i.message)
+    ex.message = hive.output(i.push_message)
+
+    i.on_message = hive.triggerfunc()
+    hive.trigger(i.on_message, i.push_message)
+
+    # Keep separate stream for each address, e.g. of TCPServer clients
+    if meta_args.by_address:
+        i.address = hive.property(cls, "address", "tuple")
+        i.pull_address = hive.pull_in(i.address)
+        ex.address = hive.antenna(i.pull_address)
+
+        hive.trigger(i.push_received_data, i.pull_address, pretrigger=True)
+
+        i.message_address = hive.property(cls, "message_address", "tuple")
+        i.pull_message_address = hive.pull_out(i.message_address)
+        ex.message_address = hive.output(i.pull_message_address)
+
+        i.closed_address = hive.property(cls, "closed_address", "tuple")
+        i.push_closed_address = hive.push_in(i.closed_address)
+        ex.close_address = hive.antenna(i.push_closed_address)
+
+        i.reset = hive.triggerable(cls.reset)
+        hive.trigger(i.push_closed_address, i.reset)
+
+    # Encoding
+    i.outgoing_message = hive.property(cls, "outgoing_message", "bytes")
+    i.push_outgoing_message = hive.push_in(i.outgoing_message)
+    ex.send = hive.antenna(i.push_outgoing_message)
+
+    i.encode = hive.triggerable(cls.encode)
+    hive.trigger(i.push_outgoing_message, i.encode)
+
+    i.framed_data = hive.property(cls, "framed_data", "bytes")
+    i.push_framed_data = hive.push_out(i.framed_data)
+    ex.data_out = hive.output(i.push_framed_data)
+
+    i.on_framed = hive.triggerfunc()
+    hive.trigger(i.on_framed, i.push_framed_data)
+
+
+Framing = hive.dyna_hive("Framing", build_framing, declare_framing, builder_cls=_FramingClass)
@@ -1,10 +1,11 @@
 from threading import Thread, Event
-from queue import Queue, Empty as QueueEmpty
+from collections import deque
 from socket import socket, AF_INET, SOCK_STREAM
 from select import select
 
 import hive
 
+from .utils import drain
 from ...event import OnTick
 
 
@@ -20,13 +21,18 @@ class TCPClientClass:
         self.outgoing_data = None
         self.server_address = None
 
-        self._received_queue = Queue()
-        self._outgoing_queue = Queue()
+        self.received_batch = None
+        self.outgoing_batch = None
+
+        # Shared with the client thread, see drain()
+        self._received_queue = deque()
+        self._outgoing_queue = deque()
 
         self._connected_state = False
         self._acknowledged_connected_state = False
 
         self._hive = hive.get_run_hive()
+        self._per_packet = self._hive._hive_object._hive_meta_args_frozen.per_packet
         self._thread = Thread(target=self._handle_connections_threaded, daemon=True)
 
         self._buffer_size = buffer_size
@@ -39,20 +45,23 @@ class TCPClientClass:
         self._thread.start()
 
     def do_send(self):
-        self._outgoing_queue.put(self.outgoing_data)
+        self._outgoing_queue.append(self.outgoing_data)
 
-    def _sync_received_data(self):
-        received_queue = self._received_queue
+    def do_send_many(self):
+        self._outgoing_queue.extend(self.outgoing_batch)
 
-        while True:
-            try:
-                data = received_queue.get_nowait()
+    def _sync_received_data(self):
+        received = drain(self._received_queue)
+        if not received:
+            return
 
-            except QueueEmpty:
-                break
+        self.received_batch = received
+        self._hive._on_received_batch()
 
-            received_queue.task_done()
+        if not self._per_packet:
+            return
 
+        for data in received:
             self.received_data = data
             self._hive._on_received()
 
@@ -90,21 +99,19 @@ class TCPClientClass:
                     return
 
                 else:
-                    received_queue.put(data)
+                    received_queue.append(data)
 
             # Send data
-            while True:
-                try:
-                    data = outgoing_queue.get_nowait()
+            for data in drain(outgoing_queue):
+                main_socket.sendall(data)
 
-                except QueueEmpty:
-                    break
 
-                outgoing_queue.task_done()
-                main_socket.send(data)
+def declare_client(meta_args):
+    # Batch consumers may disable per packet dispatch, which costs a push for every packet
+    meta_args.per_packet = hive.parameter("bool", True)
 
 
-def build_server(cls, i, ex, args):
+def build_server(cls, i, ex, args, meta_args):
     i.connect_address = hive.property(cls, "server_address", "tuple")
     i.push_connect = hive.push_in(i.connect_address)
     ex.connect_to = hive.antenna(i.push_connect)
@@ -115,7 +122,6 @@ def build_server(cls, i, ex, args):
     # Hive callbacks
     i.on_disconnected = hive.triggerfunc()
     i.on_connected = hive.triggerfunc()
-    i.on_received = hive.triggerfunc()
 
     # Receiving connection
     ex.on_connected = hive.hook(i.on_connected)
@@ -123,12 +129,22 @@ def build_server(cls, i, ex, args):
     # Lost connection
     ex.on_disconnected = hive.hook(i.on_disconnected)
 
-    # Receiving
-    i.received_data = hive.property(cls, "received_data", "bytes")
-    i.push_received = hive.push_out(i.received_data)
-    ex.on_received = hive.output(i.push_received)
+    # Receiving each packet
+    if meta_args.per_packet:
+        i.received_data = hive.property(cls, "received_data", "bytes")
+        i.push_received = hive.push_out(i.received_data)
+        ex.on_received = hive.output(i.push_received)
 
-    hive.trigger(i.on_received, i.push_received)
+        i.on_received = hive.triggerfunc()
+        hive.trigger(i.on_received, i.push_received)
+
+    # Receiving all data of a tick, as list
+    i.received_batch = hive.property(cls, "received_batch", "list")
+    i.push_received_batch = hive.push_out(i.received_batch)
+    ex.on_received_batch = hive.output(i.push_received_batch)
+
+    i.on_received_batch = hive.triggerfunc()
+    hive.trigger(i.on_received_batch, i.push_received_batch)
 
     # Sending
     i.outgoing_data = hive.property(cls, "outgoing_data", "bytes")
@@ -138,9 +154,17 @@ def build_server(cls, i, ex, args):
     i.do_send_data = hive.triggerable(cls.do_send)
     hive.trigger(i.push_outgoing_data, i.do_send_data)
 
+    # Sending sequence of data
+    i.outgoing_batch = hive.property(cls, "outgoing_batch", "list")
+    i.push_outgoing_batch = hive.push_in(i.outgoing_batch)
+    ex.send_many = hive.antenna(i.push_outgoing_batch)
+
+    i.do_send_many = hive.triggerable(cls.do_send_many)
+    hive.trigger(i.push_outgoing_batch, i.do_send_many)
+
     i.synchronise_data = hive.triggerable(cls.synchronise)
     i.on_tick = OnTick()
     hive.connect(i.on_tick.on_tick, i.synchronise_data)
 
 
-TCPClient = hive.hive("TCPClient", build_server, builder_cls=TCPClientClass)
+TCPClient = hive.dyna_hive("TCPClient", build_server, declare_client, builder_cls=TCPClientClass)
@@ -1,20 +1,31 @@
-from socketserver import BaseRequestHandler, ThreadingMixIn, TCPServer as TCPServer_
+from collections import deque
+from selectors import DefaultSelector, EVENT_READ, EVENT_WRITE
+from socket import socket, socketpair, AF_INET, SOCK_STREAM
 from threading import Thread
-from queue import Queue, Empty as QueueEmpty
-from socket import socket, AF_INET, SOCK_STREAM
-from select import select
 
 import hive
 
+from .utils import drain
 from ...event import OnTick
 
 # TODO datagrams
 
 
+class _Connection:
+    """Client connection of the server thread, with buffer of data not yet sent"""
+
+    __slots__ = ("sock", "address", "outgoing")
+
+    def __init__(self, sock, address):
+        self.sock = sock
+        self.address = address
+        self.outgoing = bytearray()
+
+
 class TCPServerClass:
 
-    @hive.types(select_interval='float', buffer_size='int')
-    def __init__(self, select_interval=0.01, buffer_size=1024):
+    @hive.types(buffer_size='int', backlog='int')
+    def __init__(self, buffer_size=65536, backlog=1024):
         self.local_address = None
 
         self._socket = socket(AF_INET, SOCK_STREAM)
@@ -25,145 +36,236 @@ class TCPServerClass:
         self.to_address = None
         self.outgoing_data = None
 
+        self.received_batch = None
+        self.outgoing_batch = None
+
         self.connected_address = None
         self.disconnected_address = None
 
-        self._received_queue = Queue()
-        self._outgoing_queue = Queue()
+        # Shared with the server thread, see drain()
+        self._received_queue = deque()
+        self._outgoing_queue = deque()
 
-        self._connected_queue = Queue()
-        self._disconnected_queue = Queue()
+        self._connected_queue = deque()
+        self._disconnected_queue = deque()
 
         self._hive = hive.get_run_hive()
+        self._per_packet = self._hive._hive_object._hive_meta_args_frozen.per_packet
         self._thread = Thread(target=self._handle_connections_threaded, daemon=True)
+        self._running = False
 
-        self._buffer_size = buffer_size
-        self._select_interval = select_interval
+        # Server thread waits on selector, and is woken to send data
+        self._selector = DefaultSelector()
+        self._wakeup_receiver, self._wakeup_sender = socketpair()
+        self._wakeup_receiver.setblocking(False)
+        self._wakeup_sender.setblocking(False)
 
-        # TODO cleanup functions to close thread
+        # Data is received into a single preallocated buffer
+        self._receive_buffer = bytearray(buffer_size)
+        self._receive_view = memoryview(self._receive_buffer)
+
+        self._backlog = backlog
+        self._address_to_connection = {}
 
     def do_bind(self):
         self._socket.bind(self.local_address)
-        self._socket.listen()
+        self._socket.listen(self._backlog)
+        self._socket.setblocking(False)
+
+        # Address may include an assigned port
+        self.local_address = self._socket.getsockname()
 
+        self._selector.register(self._socket, EVENT_READ)
+        self._selector.register(self._wakeup_receiver, EVENT_READ)
+
+        self._running = True
         self._thread.start()
 
+    def _wake(self):
+        try:
+            self._wakeup_sender.send(b"\0")
+
+        # Server thread is already due to wake
+        except BlockingIOError:
+            pass
+
     def do_send(self):
-        self._outgoing_queue.put((self.to_address, self.outgoing_data))
+        self._outgoing_queue.append((self.to_address, self.outgoing_data))
+        self._wake()
 
-    def _sync_received_data(self):
-        received_queue = self._received_queue
+    def do_send_many(self):
+        """Send sequence of (address, data) pairs, waking server thread once"""
+        self._outgoing_queue.extend(self.outgoing_batch)
+        self._wake()
 
-        while True:
-            try:
-                from_address, data = received_queue.get_nowait()
+    def close(self):
+        """Stop server thread, and close connections"""
+        if self._running:
+            self._running = False
+            self._wake()
+            self._thread.join()
 
-            except QueueEmpty:
-                break
+    def _sync_received_data(self):
+        received = drain(self._received_queue)
+        if not received:
+            return
+
+        self.received_batch = received
+        self._hive._on_received_batch()
 
-            received_queue.task_done()
+        if not self._per_packet:
+            return
 
+        for from_address, data in received:
             self.received_data = data
             self.from_address = from_address
 
             self._hive._on_received()
 
     def _sync_connections(self):
-        connected_queue = self._connected_queue
+        for address in drain(self._connected_queue):
+            self.connected_address = address
+            self._hive._on_connected()
 
+    def _sync_disconnections(self):
+        for address in drain(self._disconnected_queue):
+            self.disconnected_address = address
+            self._hive._on_disconnected()
+
+    def synchronise(self):
+        self._sync_received_data()
+        self._sync_connections()
+        self._sync_disconnections()
+
+    def _accept(self):
         while True:
             try:
-                address = connected_queue.get_nowait()
+                sock, address = self._socket.accept()
 
-            except QueueEmpty:
-                break
+            except BlockingIOError:
+                return
 
-            connected_queue.task_done()
+            sock.setblocking(False)
 
-            self.connected_address = address
-            self._hive._on_connected()
+            connection = _Connection(sock, address)
+            self._address_to_connection[address] = connection
+            self._selector.register(sock, EVENT_READ, connection)
 
-    def _sync_disconnections(self):
-        disconnected_queue = self._disconnected_queue
+            # On connected
+            self._connected_queue.append(address)
 
-        while True:
-            try:
-                address = disconnected_queue.get_nowait()
+    def _is_open(self, connection):
+        return self._address_to_connection.get(connection.address) is connection
 
-            except QueueEmpty:
-                break
+    def _disconnect(self, connection):
+        self._selector.unregister(connection.sock)
+        connection.sock.close()
 
-            disconnected_queue.task_done()
+        del self._address_to_connection[connection.address]
 
-            self.disconnected_address = address
-            self._hive._on_disconnected()
+        # On disconnected
+        self._disconnected_queue.append(connection.address)
 
-    def synchronise(self):
-        self._sync_received_data()
-        self._sync_connections()
-        self._sync_disconnections()
+    def _receive(self, connection):
+        try:
+            size = connection.sock.recv_into(self._receive_buffer)
 
-    def _handle_connections_threaded(self):
-        main_socket = self._socket
-        active_sockets = [main_socket]
+        except BlockingIOError:
+            return
 
-        received_queue = self._received_queue
-        outgoing_queue = self._outgoing_queue
+        except OSError:
+            size = 0
 
-        address_to_socket = {}
-        socket_to_address = {}
+        if not size:
+            self._disconnect(connection)
 
-        while True:
-            readable, _, _ = select(active_sockets, (), (), self._select_interval)
+        else:
+            self._received_queue.append((connection.address, bytes(self._receive_view[:size])))
 
-            # Receive data
-            for sock in readable:
-                if sock is main_socket:
-                    connection_sock, address = main_socket.accept()
-                    active_sockets.append(connection_sock)
+    def _send_pending(self, connection):
+        """Send as much buffered data as the socket accepts, and wait for writability if any remains"""
+        outgoing = connection.outgoing
 
-                    # Map address and socket
-                    address_to_socket[address] = connection_sock
-                    socket_to_address[connection_sock] = address
+        try:
+            sent_size = connection.sock.send(outgoing)
 
-                    # On connected
-                    self._connected_queue.put(address)
+        except BlockingIOError:
+            sent_size = 0
 
-                else:
-                    data = sock.recv(self._buffer_size)
-                    address = socket_to_address[sock]
+        except OSError:
+            self._disconnect(connection)
+            return
+
+        del outgoing[:sent_size]
+
+        events = EVENT_READ | EVENT_WRITE if outgoing else EVENT_READ
+        if self._selector.get_key(connection.sock).events != events:
+            self._selector.modify(connection.sock, events, connection)
+
+    def _send_queued(self):
+        address_to_connection = self._address_to_connection
+        pending_connections = set()
+
+        for to_address, data in drain(self._outgoing_queue):
+            try:
+                connection = address_to_connection[to_address]
+
+            except KeyError:
+                # TODO
+                continue
+
+            connection.outgoing += data
+            pending_connections.add(connection)
 
-                    if not data:
-                        del address_to_socket[address]
-                        del socket_to_address[sock]
-                        active_sockets.remove(sock)
+        for connection in pending_connections:
+            # Connection may be waiting for socket to become writable
+            if self._selector.get_key(connection.sock).events == EVENT_READ:
+                self._send_pending(connection)
 
-                        # On disconnected
-                        self._disconnected_queue.put(address)
+    def _handle_connections_threaded(self):
+        main_socket = self._socket
+        wakeup_receiver = self._wakeup_receiver
+        selector = self._selector
+
+        while self._running:
+            for key, events in selector.select():
+                sock = key.fileobj
+
+                if sock is main_socket:
+                    self._accept()
+
+                elif sock is wakeup_receiver:
+                    try:
+                        while wakeup_receiver.recv(4096):
+                            pass
+
+                    except BlockingIOError:
+                        pass
+
+                    self._send_queued()
 
-                    else:
-                        received_queue.put((address, data))
+                else:
+                    connection = key.data
+
+                    if events & EVENT_WRITE and self._is_open(connection):
+                        self._send_pending(connection)
 
-            # Send data
-            while True:
-                try:
-                    to_address, data = outgoing_queue.get_nowait()
+                    if events & EVENT_READ and self._is_open(connection):
+                        self._receive(connection)
 
-                except QueueEmpty:
-                    break
+        for connection in list(self._address_to_connection.values()):
+            self._disconnect(connection)
 
-                outgoing_queue.task_done()
-                try:
-                    connection_sock = address_to_socket[to_address]
+        selector.close()
+        main_socket.close()
 
-                except KeyError:
-                    # TODO
-                    continue
 
-                connection_sock.send(data)
+def declare_server(meta_args):
+    # Batch consumers may disable per packet dispatch, which costs a push for every packet
+    meta_args.per_packet = hive.parameter("bool", True)
 
 
-def build_server(cls, i, ex, args):
+def build_server(cls, i, ex, args, meta_args):
     i.local_address = hive.property(cls, "local_address", "tuple")
     i.push_bind_address = hive.push_in(i.local_address)
     ex.bind_to = hive.antenna(i.push_bind_address)
@@ -171,6 +273,9 @@ def build_server(cls, i, ex, args):
     i.do_bind = hive.triggerable(cls.do_bind)
     hive.trigger(i.push_bind_address, i.do_bind)
 
+    i.pull_local_address = hive.pull_out(i.local_address)
+    ex.local_address = hive.output(i.pull_local_address)
+
     # Receiving connection
     i.connected_address = hive.property(cls, "connected_address", "tuple")
     i.push_connected_address = hive.push_out(i.connected_address)
@@ -181,21 +286,30 @@ def build_server(cls, i, ex, args):
     i.push_disconnected_address = hive.push_out(i.disconnected_address)
     ex.on_client_disconnected = hive.output(i.push_disconnected_address)
 
-    # Receiving
-    i.from_address = hive.property(cls, "from_address", "tuple")
-    i.pull_from_address = hive.pull_out(i.from_address)
-    ex.from_address = hive.output(i.pull_from_address)
+    # Receiving each packet
+    if meta_args.per_packet:
+        i.from_address = hive.property(cls, "from_address", "tuple")
+        i.pull_from_address = hive.pull_out(i.from_address)
+        ex.from_address = hive.output(i.pull_from_address)
+
+        i.received_data = hive.property(cls, "received_data", "bytes")
+        i.push_received = hive.push_out(i.received_data)
+        ex.on_received = hive.output(i.push_received)
 
-    i.received_data = hive.property(cls, "received_data", "bytes")
-    i.push_received = hive.push_out(i.received_data)
-    ex.on_received = hive.output(i.push_received)
+        i.on_received = hive.triggerfunc()
+        hive.trigger(i.on_received, i.push_received)
+
+    # Receiving all data of a tick, as list of (address, data)
+    i.received_batch = hive.property(cls, "received_batch", "list")
+    i.push_received_batch = hive.push_out(i.received_batch)
+    ex.on_received_batch = hive.output(i.push_received_batch)
 
     # Hive callbacks
     i.on_disconnected = hive.triggerfunc()
     i.on_connected = hive.triggerfunc()
-    i.on_received = hive.triggerfunc()
+    i.on_received_batch = hive.triggerfunc()
 
-    hive.trigger(i.on_received, i.push_received)
+    hive.trigger(i.on_received_batch, i.push_received_batch)
     hive.trigger(i.on_connected, i.push_connected_address)
     hive.trigger(i.on_disconnected, i.push_disconnected_address)
 
@@ -212,9 +326,22 @@ def build_server(cls, i, ex, args):
     hive.trigger(i.push_outgoing_data, i.pull_to_address, pretrigger=True)
     hive.trigger(i.push_outgoing_data, i.do_send_data)
 
+    # Sending sequence of (address, data)
+    i.outgoing_batch = hive.property(cls, "outgoing_batch", "list")
+    i.push_outgoing_batch = hive.push_in(i.outgoing_batch)
+    ex.send_many = hive.antenna(i.push_outgoing_batch)
+
+    i.do_send_many = hive.triggerable(cls.do_send_many)
+    hive.trigger(i.push_outgoing_batch, i.do_send_many)
+
     i.synchronise_data = hive.triggerable(cls.synchronise)
     i.on_tick = OnTick()
     hive.connect(i.on_tick.on_tick, i.synchronise_data)
 
+    # Close connections when stopped
+    i.do_close = hive.triggerable(cls.close)
+    ex.close = hive.entry(i.do_close)
+    ex.on_stopped = hive.plugin(cls.close, identifier="on_stopped")
+
 
-TCPServer = hive.hive("TCPServer", build_server, builder_cls=TCPServerClass)
+TCPServer = hive.dyna_hive("TCPServer", build_server, declare_server, builder_cls=TCPServerClass)
@@ -0,0 +1,7 @@
+def drain(queue):
+    """Return list of items currently in deque, which may be appended to by another thread.
+
+    deque.append and deque.popleft are atomic, so no lock is required.
+    """
+    popleft = queue.popleft
+    return [popleft() for _ in range(len(queue))]
@@ -1,12 +1,34 @@
+"""Evaluate a Python expression of named inputs.
+
+Expressions are compiled once per unique expression string, and the compiled evaluator is shared between all
+Expression hives which use it. In vectorised mode, inputs may be arrays; NumPy is used if available, otherwise the
+expression is evaluated per element of list inputs.
+"""
 import ast
+import math
+from functools import lru_cache
+from itertools import repeat
+
 import hive
 
-from math import *
-import math
+try:
+    import numpy
+
+except ImportError:
+    numpy = None
 
 
 namespace = tuple(n for n in dir(math) if not n.startswith("_"))
 
+_math_globals = {name: getattr(math, name) for name in namespace}
+
+if numpy is not None:
+    # Prefer NumPy ufuncs, which accept both scalars and arrays
+    _vector_globals = {name: getattr(numpy, name, value) for name, value in _math_globals.items()}
+
+else:
+    _vector_globals = _math_globals
+
 
 class NodeVisitor(ast.NodeVisitor):
 
@@ -25,35 +47,101 @@ class NodeVisitor(ast.NodeVisitor):
             self.visited_nodes.append(node)
 
 
-def create_func(expression, names):
-    declaration = """
-def func(self, {}):
-    {}
-    self._result = {}"""
+def get_variable_names(expression):
+    """Return names of the variables of expression, in order of first use"""
+    ast_node = ast.parse(expression, mode='eval')
+
+    visitor = NodeVisitor()
+    visitor.visit(ast_node)
+
+    variable_names = []
+    for node in visitor.visited_nodes:
+        if isinstance(node, ast.Name) and node.id not in variable_names:
+            variable_names.append(node.id)
+
+    return tuple(variable_names)
+
+
+def _vectorise_elementwise(func):
+    """Wrap func to evaluate per element if any argument is a list or tuple (without NumPy)"""
+    def evaluate(*values):
+        lengths = {len(value) for value in values if isinstance(value, (list, tuple))}
+        if not lengths:
+            return func(*values)
+
+        if len(lengths) > 1:
+            raise ValueError("Array inputs differ in length: {}".format(sorted(lengths)))
+
+        length, = lengths
+        columns = [value if isinstance(value, (list, tuple)) else repeat(value, length) for value in values]
+        return [func(*row) for row in zip(*columns)]
+
+    return evaluate
 
-    arguments = ", ".join(["{0}={0}".format(name) for name in namespace])
-    declarations = "\n    ".join(["{0}=self._{0}".format(name) for name in names])
-    declare_func = declaration.format(arguments, declarations, expression)
 
-    exec(declare_func, locals(), globals())
-    return func
+def _vectorise_numpy(func):
+    """Wrap func to convert list and tuple arguments to NumPy arrays"""
+    def evaluate(*values):
+        return func(*[numpy.asarray(value) if isinstance(value, (list, tuple)) else value for value in values])
+
+    return evaluate
+
+
+@lru_cache(maxsize=None)
+def compile_expression(expression, vectorised=False):
+    """Compile expression into a function of its variables, which is cached per unique expression string.
+
+    Return variable names and the function, which accepts the variable values as positional arguments.
+    """
+    variable_names = get_variable_names(expression)
+
+    source = "lambda {}: ({})".format(", ".join(variable_names), expression)
+    code = compile(source, "<expression {!r}>".format(expression), "eval")
+
+    if not vectorised:
+        return variable_names, eval(code, dict(_math_globals))
+
+    func = eval(code, dict(_vector_globals))
+    if numpy is not None:
+        return variable_names, _vectorise_numpy(func)
+
+    return variable_names, _vectorise_elementwise(func)
+
+
+@lru_cache(maxsize=None)
+def create_modifier(expression, vectorised=False):
+    """Create modifier which evaluates expression from the pulled inputs, once per unique expression string"""
+    variable_names, func = compile_expression(expression, vectorised)
+
+    if vectorised:
+        declaration = """
+def evaluate(self):
+    self._result = func({})"""
+        modifier_namespace = {"func": func}
+        arguments = ", ".join(["self._{}".format(name) for name in variable_names])
+        exec(declaration.format(arguments), modifier_namespace)
+        return modifier_namespace["evaluate"]
+
+    # Inline the expression, rather than calling the compiled function, to avoid a call per evaluation
+    declaration = """
+def evaluate(self):
+    {}
+    self._result = ({})"""
+    modifier_namespace = dict(_math_globals)
+    declarations = "\n    ".join(["{0} = self._{0}".format(name) for name in variable_names])
+    exec(declaration.format(declarations, expression), modifier_namespace)
+    return modifier_namespace["evaluate"]
 
 
 def declare_expression(meta_args):
     meta_args.expression = hive.parameter("str", "")
     meta_args.result_type = hive.parameter('str', "int")
+    meta_args.vectorised = hive.parameter("bool", False)
 
 
 def build_expression(i, ex, args, meta_args):
     """Execute bound expression for provided inputs and output result"""
-    ast_node = ast.parse(meta_args.expression, mode='eval')
-
-    visitor = NodeVisitor()
-    visitor.visit(ast_node)
-
-    visited_nodes = visitor.visited_nodes
-
-    variable_names = [x.id for x in visited_nodes if isinstance(x, ast.Name)]
+    variable_names, _ = compile_expression(meta_args.expression, meta_args.vectorised)
 
     i.result = hive.attribute(meta_args.result_type)
     i.pull_result = hive.pull_out(i.result)
@@ -68,8 +156,7 @@ def build_expression(i, ex, args, meta_args):
 
         hive.trigger(i.pull_result, pull_in, pretrigger=True)
 
-    func = create_func(meta_args.expression, variable_names)
-    i.modifier = hive.modifier(func)
+    i.modifier = hive.modifier(create_modifier(meta_args.expression, meta_args.vectorised))
     hive.trigger(i.pull_result, i.modifier, pretrigger=True)
 
 
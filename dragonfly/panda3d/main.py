@@ -11,7 +11,7 @@ from ..event import EventManager, EventHandler
 
 class MainloopClass:
 
-    def __init__(self, tick_rate):
+    def __init__(self, *args, **kwargs):
         from direct.showbase.ShowBase import ShowBase
 
         self._base = ShowBase()
@@ -8,12 +8,14 @@ class _DelayCls:
     def __init__(self):
         self.add_handler = None
         self.remove_handler = None
+        self.schedule = None
         self.delay = 0.0
         self.running = False
 
         self._hive = hive.get_run_hive()
 
         self._listener = EventHandler(self.on_tick, ("tick",), mode="match")
+        self._timer = None
 
         self._delay_ticks = 0
         self._elapsed_ticks = 0
@@ -22,7 +24,16 @@ class _DelayCls:
 
     @hive.typed_property("float")
     def elapsed(self):
-        return self._tick_rate * self._elapsed_ticks
+        if not self._tick_rate:
+            return 0.0
+
+        if self._timer is not None:
+            elapsed_ticks = self._timer.delay - self._timer.remaining
+
+        else:
+            elapsed_ticks = self._elapsed_ticks
+
+        return elapsed_ticks / self._tick_rate
 
     def set_add_handler(self, add_handler):
         self.add_handler = add_handler
@@ -30,20 +41,46 @@ class _DelayCls:
     def set_remove_handler(self, remove_handler):
         self.remove_handler = remove_handler
 
+    def set_schedule(self, schedule):
+        self.schedule = schedule
+
     def set_get_tick_rate(self, get_tick_rate):
         self._tick_rate = get_tick_rate()
 
     def on_triggered(self):
         assert self.delay > 0, "Delay must be greater than zero"
 
-        if not self.running:
+        self._delay_ticks = max(round(self.delay * self._tick_rate), 1)
+        self._elapsed_ticks = 0
+
+        # Use timer wheel if available, otherwise count ticks
+        if self.schedule is not None:
+            if self._timer is None:
+                self._timer = self.schedule(self._delay_ticks, self.on_elapsed)
+
+            else:
+                self._timer.rearm(self._delay_ticks)
+
+        elif not self.running:
             self.add_handler(self._listener)
 
-        self._delay_ticks = round(self.delay * self._tick_rate)
-        self._elapsed_ticks = 0
+        self.running = True
+
+    def cancel(self):
+        if not self.running:
+            return
+
+        if self._timer is not None:
+            self._timer.cancel()
+
+        else:
+            self.remove_handler(self._listener)
+
+        self.running = False
 
     def on_elapsed(self):
-        self.remove_handler(self._listener)
+        if self._timer is None:
+            self.remove_handler(self._listener)
 
         self.running = False
         self._hive._on_elapsed()
@@ -64,6 +101,9 @@ def build_delay(cls, i, ex, args):
     i.do_trig = hive.triggerable(i.trigger)
     ex.trig_in = hive.entry(i.do_trig)
 
+    i.cancel = hive.triggerable(cls.cancel)
+    ex.cancel = hive.entry(i.cancel)
+
     ex.delay = hive.property(cls, "delay", "float")
     i.delay_in = hive.pull_in(ex.delay)
     ex.delay_in = hive.antenna(i.delay_in)
@@ -76,6 +116,8 @@ def build_delay(cls, i, ex, args):
     ex.get_add_handler = hive.socket(cls.set_add_handler, "event.add_handler")
     ex.get_remove_handler = hive.socket(cls.set_remove_handler, "event.remove_handler")
 
+    ex.get_schedule = hive.socket(cls.set_schedule, "time.schedule", policy=hive.SingleOptional)
+
     ex.get_get_tick_rate = hive.socket(cls.set_get_tick_rate, "app.get_tick_rate")
 
 
@@ -3,4 +3,5 @@ from .cross import Cross
 from .dot import Dot
 from .determinant import Determinant
 from .compose import Compose
-from .normalise import Normalise
\ No newline at end of file
+from .normalise import Normalise
+from .batch import DotBatch, CrossBatch, DeterminantBatch, NormaliseBatch
@@ -0,0 +1,128 @@
+"""Vector operations on whole arrays of vectors, using NumPy if available.
+
+Arrays of vectors ("vector.array") are (N, 3) NumPy arrays, or sequences of 3-tuples without NumPy. Arrays of
+scalars ("float.array") are (N,) NumPy arrays, or lists.
+"""
+from math import sqrt
+
+import hive
+
+try:
+    import numpy
+
+except ImportError:
+    numpy = None
+
+
+def dot_batch(a, b):
+    if numpy is not None:
+        return numpy.einsum("ij,ij->i", numpy.asarray(a, dtype=float), numpy.asarray(b, dtype=float))
+
+    return [(u[0] * v[0]) + (u[1] * v[1]) + (u[2] * v[2]) for u, v in zip(a, b)]
+
+
+def cross_batch(a, b):
+    if numpy is not None:
+        return numpy.cross(numpy.asarray(a, dtype=float), numpy.asarray(b, dtype=float))
+
+    return [((u[1] * v[2]) - (u[2] * v[1]), (u[2] * v[0]) - (u[0] * v[2]), (u[0] * v[1]) - (u[1] * v[0]))
+            for u, v in zip(a, b)]
+
+
+def length_batch(vectors):
+    if numpy is not None:
+        return numpy.linalg.norm(numpy.asarray(vectors, dtype=float), axis=1)
+
+    return [sqrt(x ** 2 + y ** 2 + z ** 2) for x, y, z in vectors]
+
+
+def normalise_batch(vectors):
+    if numpy is not None:
+        vectors = numpy.asarray(vectors, dtype=float)
+        return vectors / numpy.linalg.norm(vectors, axis=1)[:, numpy.newaxis]
+
+    normalised = []
+    for x, y, z in vectors:
+        length = sqrt(x ** 2 + y ** 2 + z ** 2)
+        normalised.append((x / length, y / length, z / length))
+
+    return normalised
+
+
+def dot_modifier(self):
+    self._result = dot_batch(self._a, self._b)
+
+
+def cross_modifier(self):
+    self._result = cross_batch(self._a, self._b)
+
+
+def length_modifier(self):
+    self._result = length_batch(self._vector)
+
+
+def normalise_modifier(self):
+    self._result = normalise_batch(self._vector)
+
+
+def build_binary(modifier, result_data_type):
+    """Return builder of a hive which applies modifier to arrays a and b"""
+    def build(i, ex, args):
+        i.a = hive.attribute("vector.array")
+        i.b = hive.attribute("vector.array")
+
+        i.pull_a = hive.pull_in(i.a)
+        i.pull_b = hive.pull_in(i.b)
+
+        ex.a = hive.antenna(i.pull_a)
+        ex.b = hive.antenna(i.pull_b)
+
+        i.result = hive.attribute(result_data_type)
+        i.pull_result = hive.pull_out(i.result)
+        ex.result = hive.output(i.pull_result)
+
+        i.calculate = hive.modifier(modifier)
+
+        hive.trigger(i.pull_result, i.pull_a, pretrigger=True)
+        hive.trigger(i.pull_a, i.pull_b)
+        hive.trigger(i.pull_b, i.calculate)
+
+    return build
+
+
+def build_unary(modifier, result_data_type):
+    """Return builder of a hive which applies modifier to array vector"""
+    def build(i, ex, args):
+        i.vector = hive.attribute("vector.array")
+        i.pull_vector = hive.pull_in(i.vector)
+        ex.vector = hive.antenna(i.pull_vector)
+
+        i.result = hive.attribute(result_data_type)
+        i.pull_result = hive.pull_out(i.result)
+        ex.result = hive.output(i.pull_result)
+
+        i.calculate = hive.modifier(modifier)
+
+        hive.trigger(i.pull_result, i.pull_vector, pretrigger=True)
+        hive.trigger(i.pull_vector, i.calculate)
+
+    return build
+
+
+build_dot_batch = build_binary(dot_modifier, "float.array")
+build_dot_batch.__doc__ = """Calculate the dot products between two arrays of vectors"""
+
+build_cross_batch = build_binary(cross_modifier, "vector.array")
+build_cross_batch.__doc__ = """Calculate the cross products between two arrays of vectors"""
+
+build_determinant_batch = build_unary(length_modifier, "float.array")
+build_determinant_batch.__doc__ = """Calculate the determinants (lengths) of an array of vectors"""
+
+build_normalise_batch = build_unary(normalise_modifier, "vector.array")
+build_normalise_batch.__doc__ = """Find the unit vectors for an array of vectors"""
+
+
+DotBatch = hive.hive("DotBatch", build_dot_batch)
+CrossBatch = hive.hive("CrossBatch", build_cross_batch)
+DeterminantBatch = hive.hive("DeterminantBatch", build_determinant_batch)
+NormaliseBatch = hive.hive("NormaliseBatch", build_normalise_batch)
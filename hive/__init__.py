@@ -1,5 +1,6 @@
 from .hive import (hive, dyna_hive, meta_hive, HiveBuilder, RuntimeHive, MetaHivePrimitive, HiveObject,
                    validate_external_name, validate_internal_name)
+from .compiler import compile_run_hive
 from .identifiers import identifiers_match, identifier_to_tuple, is_subtype
 from .manager import (get_building_hive, get_mode, get_run_hive, get_validation_enabled, set_validation_enabled,
                       validation_enabled_as)
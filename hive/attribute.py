@@ -1,40 +1,57 @@
-from weakref import WeakKeyDictionary
+from functools import partial
+from operator import getitem, setitem
 
 from .manager import ContextFactory, get_building_hive, memoize
 from .mixins import Stateful, Exportable, Bindable, Parameter, Nameable
 
 
 class Attribute(Stateful, Bindable, Exportable, Nameable):
-    """Stateful data store object"""
+    """Stateful data store object
+
+    Values are stored in the _hive_attribute_values list of each run hive, at the slot index assigned when the
+    owning hive is built.
+    """
 
     export_only = False
 
     def __init__(self, data_type=None, start_value=None):
         self._hive_object_cls = get_building_hive()
+        self._hive_slot_index = None
 
         self.data_type = data_type
         self.start_value = start_value
 
-        self._values = WeakKeyDictionary()
-
     def _hive_stateful_getter(self, run_hive):
-        return self._values[run_hive]
+        return run_hive._hive_attribute_values[self._hive_slot_index]
 
     def _hive_stateful_setter(self, run_hive, value):
-        assert run_hive in self._values, run_hive
-        self._values[run_hive] = value
+        run_hive._hive_attribute_values[self._hive_slot_index] = value
+
+    def _hive_stateful_bound_getter(self, run_hive):
+        if run_hive is None:
+            return super(Attribute, self)._hive_stateful_bound_getter(run_hive)
+
+        return partial(getitem, run_hive._hive_attribute_values, self._hive_slot_index)
+
+    def _hive_stateful_bound_setter(self, run_hive):
+        if run_hive is None:
+            return super(Attribute, self)._hive_stateful_bound_setter(run_hive)
+
+        return partial(setitem, run_hive._hive_attribute_values, self._hive_slot_index)
 
     def export(self):
         return self
 
     @memoize
     def bind(self, run_hive):
+        assert self._hive_slot_index is not None, "Attribute was not assigned a slot by its hive"
+
         start_value = self.start_value
 
         if isinstance(start_value, Parameter):
             start_value = run_hive._hive_object._hive_args_frozen.get_parameter_value(start_value)
 
-        self._values[run_hive] = start_value
+        run_hive._hive_attribute_values[self._hive_slot_index] = start_value
         return self
 
 
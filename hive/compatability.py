@@ -50,7 +50,7 @@ def validate_signature(obj, *args, **kwargs):
             raise TypeError(err)
 
     else:
-        sig = signature(obj)
+        sig = _get_signature(obj)
         sig.bind(*args, **kwargs)
 
 
@@ -60,4 +60,11 @@ try:
 except ImportError:
     from .manager import memoize as _memoize
     def cache(maxsize=None):
-        return _memoize
\ No newline at end of file
+        return _memoize
+
+
+@cache(maxsize=None)
+def _get_signature(obj):
+    """Return call signature of obj, which is computed once per builder class"""
+    from inspect import signature
+    return signature(obj)
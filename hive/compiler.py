@@ -0,0 +1,323 @@
+"""Flat dispatch compilation for runtime hives.
+
+Once connectivity has been built for a RuntimeHive, each push, pull and trigger chain can be flattened into a single
+generated Python function, inlining the pretrigger/trigger fan-out of every hop. The interpreted path (Pusher lists)
+is left untouched, so any caller holding a reference to an interpreted bee method remains valid.
+
+Compilation is a snapshot; connections or triggers added after compilation are not seen by compiled functions.
+"""
+
+from functools import partial
+from itertools import count
+from operator import getitem, setitem
+
+from .modifier import Modifier
+from .ppin import PushIn, PullIn
+from .ppout import PushOut, PullOut
+from .property import Property
+from .triggerable import Triggerable
+from .triggerfunc import TriggerFunc
+
+
+class CompiledTriggerFunc(TriggerFunc):
+    """TriggerFunc whose call is dispatched through a compiled function"""
+
+    _hive_compiled_call = None
+
+    def __call__(self, *args, **kwargs):
+        self._hive_compiled_call(*args, **kwargs)
+
+
+class _FunctionEmitter(object):
+    """Source generator for a single compiled dispatch function"""
+
+    def __init__(self, compiler, max_depth):
+        self.compiler = compiler
+        self.max_depth = max_depth
+
+        self.lines = []
+        self.namespace = {}
+
+        self._name_counter = count()
+        self._inlining = set()
+
+    def bind_name(self, obj):
+        name = "f{}".format(next(self._name_counter))
+        self.namespace[name] = obj
+        return name
+
+    def new_variable(self):
+        return "v{}".format(next(self._name_counter))
+
+    def emit(self, line, indent):
+        self.lines.append("    " * indent + line)
+
+    def emit_pusher(self, pusher, indent, depth):
+        for name, func in pusher._targets:
+            self.emit_call(func, "", indent, depth)
+
+    def emit_get(self, getter, indent):
+        """Emit load of a value from a getter, return the variable name"""
+        variable = self.new_variable()
+        bound = _resolve_property_access(getter, "_hive_stateful_getter")
+        slot = _resolve_slot_access(getter, getitem)
+
+        if bound is not None:
+            instance, attr = bound
+            self.emit("{} = {}.{}".format(variable, self.bind_name(instance), attr), indent)
+
+        elif slot is not None:
+            values, index = slot
+            self.emit("{} = {}[{}]".format(variable, self.bind_name(values), index), indent)
+
+        else:
+            self.emit("{} = {}()".format(variable, self.bind_name(getter)), indent)
+
+        return variable
+
+    def emit_set(self, setter, value, indent):
+        bound = _resolve_property_access(setter, "_hive_stateful_setter")
+        slot = _resolve_slot_access(setter, setitem)
+
+        if bound is not None:
+            instance, attr = bound
+            self.emit("{}.{} = {}".format(self.bind_name(instance), attr, value), indent)
+
+        elif slot is not None:
+            values, index = slot
+            self.emit("{}[{}] = {}".format(self.bind_name(values), index, value), indent)
+
+        else:
+            self.emit("{}({})".format(self.bind_name(setter), value), indent)
+
+    def emit_pull(self, func, indent, depth):
+        """Emit pull of a value from an output, return the variable name"""
+        owner = getattr(func, "__self__", None)
+
+        if getattr(func, "__func__", None) is PullOut.pull and self._can_inline(owner, depth):
+            self._inlining.add(id(owner))
+
+            self.emit_pusher(owner._pretrigger, indent, depth + 1)
+            variable = self.emit_get(owner._get_value, indent)
+            self.emit_pusher(owner._trigger, indent, depth + 1)
+
+            self._inlining.remove(id(owner))
+            return variable
+
+        variable = self.new_variable()
+        self.emit("{} = {}()".format(variable, self.bind_name(self.compiler.resolve(func))), indent)
+        return variable
+
+    def emit_call(self, func, args, indent, depth):
+        owner = getattr(func, "__self__", None)
+        method = getattr(func, "__func__", None)
+
+        if isinstance(func, TriggerFunc):
+            owner = func
+            method = TriggerFunc.__call__
+
+        if method not in _inlined_methods or not self._can_inline(owner, depth):
+            self.emit("{}({})".format(self.bind_name(self.compiler.resolve(func)), args), indent)
+            return
+
+        self._inlining.add(id(owner))
+        depth += 1
+
+        if method is TriggerFunc.__call__:
+            self.emit_pusher(owner._pretrigger, indent, depth)
+            if owner._func is not None:
+                self.emit_call(owner._func, args, indent, depth)
+            self.emit_pusher(owner._trigger, indent, depth)
+
+        elif method is PushIn.push:
+            self.emit_pusher(owner._pretrigger, indent, depth)
+            self.emit_set(owner._set_value, args, indent)
+            self.emit_pusher(owner._trigger, indent, depth)
+
+        elif method is PullIn.pull:
+            self.emit_pusher(owner._pretrigger, indent, depth)
+            value = self.emit_pull(owner._pull_callback, indent, depth)
+            self.emit_set(owner._set_value, value, indent)
+            self.emit_pusher(owner._trigger, indent, depth)
+
+        elif method is PushOut.push:
+            self.emit_pusher(owner._pretrigger, indent, depth)
+            value = self.emit_get(owner._get_value, indent)
+            for target in owner._targets:
+                self.emit_call(target, value, indent, depth)
+            self.emit_pusher(owner._trigger, indent, depth)
+
+        elif method is Triggerable.trigger:
+            self.emit_call(owner._func, "", indent, depth)
+
+        elif method is Modifier.trigger:
+            self.emit("{}({})".format(self.bind_name(owner._func), self.bind_name(owner._run_hive)), indent)
+
+        self._inlining.remove(id(owner))
+
+    def _can_inline(self, owner, depth):
+        return depth < self.max_depth and id(owner) not in self._inlining
+
+    def build(self, name, signature):
+        if not self.lines:
+            self.emit("pass", 1)
+
+        source = "def {}({}):\n{}\n".format(name, signature, "\n".join(self.lines))
+        code = compile(source, "<hive dispatch: {}>".format(name), "exec")
+
+        namespace = self.namespace
+        exec(code, namespace)
+
+        func = namespace[name]
+        func._hive_source = source
+        return func
+
+
+def _resolve_slot_access(func, operator_func):
+    """Return (values list, index) if func is a bound Attribute slot accessor, else None"""
+    if not isinstance(func, partial) or func.keywords or func.func is not operator_func:
+        return None
+
+    values, index = func.args
+    if not isinstance(index, int):
+        return None
+
+    return values, index
+
+
+def _resolve_property_access(func, method_name):
+    """Return (builder instance, attribute name) if func is a bound Property accessor, else None"""
+    if not isinstance(func, partial) or func.keywords:
+        return None
+
+    accessor = func.func
+    owner = getattr(accessor, "__self__", None)
+
+    if not (isinstance(owner, Property) and accessor.__name__ == method_name):
+        return None
+
+    if not owner._attr.isidentifier():
+        return None
+
+    run_hive, = func.args
+    try:
+        instance = run_hive._hive_build_class_to_instance[owner._cls]
+
+    except (AttributeError, KeyError):
+        return None
+
+    return instance, owner._attr
+
+
+_inlined_methods = {TriggerFunc.__call__, PushIn.push, PullIn.pull, PushOut.push, Triggerable.trigger,
+                    Modifier.trigger}
+_compiled_methods = _inlined_methods | {PullOut.pull}
+
+
+class DispatchCompiler(object):
+    """Compiles the push, pull and trigger entry points of runtime bees into flat dispatch functions"""
+
+    def __init__(self, max_inline_depth=8):
+        self.max_inline_depth = max_inline_depth
+
+        self._compiled = {}
+        self._compiling = set()
+        self._visited_hives = set()
+
+    def resolve(self, func):
+        """Return the compiled equivalent of a bee method (or callable TriggerFunc), or func if unsupported"""
+        owner = getattr(func, "__self__", None)
+        method = getattr(func, "__func__", None)
+
+        if isinstance(func, TriggerFunc):
+            owner = func
+            method = TriggerFunc.__call__
+
+        if method not in _compiled_methods:
+            return func
+
+        key = id(owner), method
+        try:
+            return self._compiled[key][1]
+
+        except KeyError:
+            pass
+
+        # Cycles fall back to the interpreted path
+        if key in self._compiling:
+            return func
+
+        self._compiling.add(key)
+        try:
+            compiled = self._compile_method(owner, method)
+
+        finally:
+            self._compiling.remove(key)
+
+        # Keep owner alive so that its id is not recycled
+        self._compiled[key] = owner, compiled
+        return compiled
+
+    def _compile_method(self, owner, method):
+        emitter = _FunctionEmitter(self, self.max_inline_depth)
+
+        if method is TriggerFunc.__call__:
+            emitter.emit_call(owner, "*args, **kwargs", 1, 0)
+            return emitter.build("trigger", "*args, **kwargs")
+
+        # Use the class method, in case a compiled function is already installed on the instance
+        bound_method = method.__get__(owner)
+
+        if method is PushIn.push:
+            emitter.emit_call(bound_method, "value", 1, 0)
+            return emitter.build("push", "value")
+
+        if method is PullOut.pull:
+            value = emitter.emit_pull(bound_method, 1, 0)
+            emitter.emit("return {}".format(value), 1)
+            return emitter.build("pull", "")
+
+        emitter.emit_call(bound_method, "", 1, 0)
+        return emitter.build(method.__name__, "")
+
+    def compile_bee(self, bee):
+        """Install compiled dispatch functions on a runtime bee"""
+        if isinstance(bee, TriggerFunc):
+            compiled = self.resolve(bee)
+            if compiled is not bee:
+                bee._hive_compiled_call = compiled
+                bee.__class__ = CompiledTriggerFunc
+
+        elif isinstance(bee, (PushIn, PushOut)):
+            bee.push = self.resolve(bee.push)
+
+        elif isinstance(bee, (PullIn, PullOut)):
+            bee.pull = self.resolve(bee.pull)
+
+        elif isinstance(bee, (Triggerable, Modifier)):
+            bee.trigger = self.resolve(bee.trigger)
+
+    def compile_hive(self, run_hive):
+        """Compile all runtime bees exposed by a RuntimeHive, and those of its child hives"""
+        if id(run_hive) in self._visited_hives:
+            return
+
+        self._visited_hives.add(id(run_hive))
+
+        for bee in list(run_hive._hive_bee_instances.values()):
+            if hasattr(bee, "_hive_bee_instances"):
+                self.compile_hive(bee)
+
+            else:
+                self.compile_bee(bee)
+
+
+def compile_run_hive(run_hive, max_inline_depth=8):
+    """Flatten the push, pull and trigger chains of a runtime hive into generated dispatch functions.
+
+    :param run_hive: RuntimeHive instance (connectivity must already be built)
+    :param max_inline_depth: number of hops to inline into a single function before calling out
+    """
+    compiler = DispatchCompiler(max_inline_depth)
+    compiler.compile_hive(run_hive)
+    return compiler
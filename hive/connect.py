@@ -3,7 +3,7 @@ from itertools import product
 
 from .classes import HiveBee
 from .debug import get_debug_context
-from .identifiers import identifiers_match
+from .identifiers import identifiers_match, identifier_to_tuple
 from .manager import get_mode, memoize, register_bee
 from .mixins import ConnectSourceBase, ConnectSourceDerived, ConnectTargetBase, ConnectTargetDerived, Bee, Bindable, \
     Exportable
@@ -11,6 +11,21 @@ from .mixins import ConnectSourceBase, ConnectSourceDerived, ConnectTargetBase,
 ConnectionCandidate = namedtuple("ConnectionCandidate", ("bee_name", "data_type"))
 
 
+def group_candidates_by_type(candidates):
+    """Group connection candidates by their data type tuple
+
+    :param candidates: ConnectionCandidate instances
+    """
+    candidates_by_type = {}
+
+    for candidate in candidates:
+        data_type = candidate.data_type
+        type_tuple = identifier_to_tuple(data_type) if data_type else ()
+        candidates_by_type.setdefault(type_tuple, []).append(candidate)
+
+    return candidates_by_type
+
+
 def find_connection_candidates(sources, targets, support_untyped=False):
     """Finds appropriate connections between ConnectionSources and ConnectionTargets
 
@@ -18,19 +33,51 @@ def find_connection_candidates(sources, targets, support_untyped=False):
     :param targets: connection targets
     :param require_types: require type definitions to be declared
     """
-    candidates = []
+    sources_by_type = group_candidates_by_type(sources)
+    targets_by_type = group_candidates_by_type(targets)
 
-    for source_candidate, target_candidate in product(sources, targets):
-        source_data_type = source_candidate.data_type
-        target_data_type = target_candidate.data_type
+    candidates = []
 
-        if not identifiers_match(source_data_type, target_data_type, support_untyped):
+    # Only compare each pair of distinct data types once
+    for source_type, target_type in product(sources_by_type, targets_by_type):
+        if not identifiers_match(source_type, target_type, support_untyped):
             continue
 
-        candidates.append((source_candidate, target_candidate))
+        candidates.extend(product(sources_by_type[source_type], targets_by_type[target_type]))
 
     return candidates
 
+
+class ConnectionIndex(object):
+    """Index of the connect sources and targets exported by a hive, with memoized lookups by data type"""
+
+    def __init__(self, connect_sources, connect_targets):
+        self.connect_sources = tuple(connect_sources)
+        self.connect_targets = tuple(connect_targets)
+
+        self._sources_by_type = group_candidates_by_type(connect_sources)
+        self._targets_by_type = group_candidates_by_type(connect_targets)
+
+    @staticmethod
+    def _match_data_type(candidates_by_type, data_type):
+        return tuple(candidate for type_tuple, candidates in candidates_by_type.items()
+                     if identifiers_match(type_tuple, data_type) for candidate in candidates)
+
+    @memoize
+    def find_sources(self, data_type):
+        """Return connect sources which match the given data type"""
+        return self._match_data_type(self._sources_by_type, data_type)
+
+    @memoize
+    def find_targets(self, data_type):
+        """Return connect targets which match the given data type"""
+        return self._match_data_type(self._targets_by_type, data_type)
+
+    @memoize
+    def find_connections(self, target_index):
+        """Return (source, target) candidate pairs between this index and the target index"""
+        return tuple(find_connection_candidates(self.connect_sources, target_index.connect_targets))
+
 # TODO allow multiple connections when they're all unique!
 
 
@@ -39,17 +86,10 @@ def find_connections_between_hives(source_hive, target_hive):
     if not source_hive._hive_can_connect_hive(target_hive):
         raise ValueError("Both hives must be either Hive runtimes or Hive objects")
 
-    # Find source hive ConnectSources
-    connect_sources = source_hive._hive_find_connect_sources()
-
-    # Find target hive ConnectSources
-    connect_targets = target_hive._hive_find_connect_targets()
-
-    # First try: match candidates with named data_type
-    candidates = find_connection_candidates(connect_sources, connect_targets)
-
-    if not candidates:
-        candidates = find_connection_candidates(connect_sources, connect_targets)
+    # Match source hive ConnectSources to target hive ConnectTargets with named data_type
+    source_index = source_hive._hive_get_connection_index()
+    target_index = target_hive._hive_get_connection_index()
+    candidates = source_index.find_connections(target_index)
 
     if not candidates:
         raise ValueError("No matching connections found")
@@ -1 +1,2 @@
-from .contexts import DebugContextBase, get_debug_context, set_debug_context, ReportedDebugContextBase, FileDebugContext
+from .contexts import (DebugContextBase, get_debug_context, set_debug_context, ReportedDebugContextBase,
+                       FileDebugContext, ProfilingDebugContext, ProfiledEdge, get_absolute_name)
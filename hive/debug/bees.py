@@ -41,4 +41,26 @@ class DebugTriggerTarget(DebugBeeBase):
 class DebugPretriggerTarget(DebugBeeBase):
 
     def __call__(self):
-        self._debug_context.report_pretrigger(self._source_ref, self._target_ref,)
\ No newline at end of file
+        self._debug_context.report_pretrigger(self._source_ref, self._target_ref,)
+
+
+class ProfiledPushOutTarget(DebugBeeBase):
+
+    def __init__(self, debug_context, source_ref, target_ref, edge):
+        super(ProfiledPushOutTarget, self).__init__(debug_context, source_ref, target_ref)
+
+        self.push = debug_context.profile_callable(edge, target_ref().push)
+
+    def __getattr__(self, name):
+        return getattr(self._target_ref(), name)
+
+
+class ProfiledPullInSource(DebugBeeBase):
+
+    def __init__(self, debug_context, source_ref, target_ref, edge):
+        super(ProfiledPullInSource, self).__init__(debug_context, source_ref, target_ref)
+
+        self.pull = debug_context.profile_callable(edge, source_ref().pull)
+
+    def __getattr__(self, name):
+        return getattr(self._source_ref(), name)
@@ -1,4 +1,6 @@
+from contextvars import ContextVar
 from csv import writer as csv_writer
+from time import perf_counter
 from weakref import ref
 
 from ..compatability import cache
@@ -6,21 +8,21 @@ from ..ppin import PullIn
 from ..ppout import PushOut
 from ..mixins import Nameable
 
-from .bees import DebugPushOutTarget, DebugPretriggerTarget, DebugPullInSource, DebugTriggerTarget
+from .bees import (DebugPushOutTarget, DebugPretriggerTarget, DebugPullInSource, DebugTriggerTarget,
+                   ProfiledPushOutTarget, ProfiledPullInSource)
 
 
-_debug_context = None
+_debug_context = ContextVar("hive_debug_context", default=None)
 
 
 def get_debug_context():
-    return _debug_context
+    return _debug_context.get()
 
 
 def set_debug_context(context):
-    global _debug_context
     if context is not None:
-        assert _debug_context is None
-    _debug_context = context
+        assert _debug_context.get() is None
+    _debug_context.set(context)
 
 
 class DebugContextBase(object):
@@ -81,6 +83,29 @@ class BeeNotNameableError(Exception):
     pass
 
 
+def get_absolute_name(bee):
+    """Return full-stop delimited path of bee from its root hive, using the first runtime info of each bee.
+
+    Raise BeeNotNameableError if bee is not Nameable.
+    """
+    if not isinstance(bee, Nameable):
+        raise BeeNotNameableError("Bee is not Nameable")
+
+    path = []
+    while True:
+        try:
+            parent_ref, bee_name = next(iter(bee._hive_runtime_info))
+
+        except TypeError:
+            break
+
+        path.append(bee_name)
+
+        bee = parent_ref()
+
+    return ".".join(reversed(path))
+
+
 class FileDebugContext(ReportedDebugContextBase):
     """Basic debug context to write to file.
 
@@ -109,24 +134,7 @@ class FileDebugContext(ReportedDebugContextBase):
 
     @cache()
     def _get_absolute_name(self, bee_ref):
-        bee = bee_ref()
-
-        if not isinstance(bee, Nameable):
-            raise BeeNotNameableError("Bee is not Nameable")
-
-        path = []
-        while True:
-            try:
-                parent_ref, bee_name = next(iter(bee._hive_runtime_info))
-
-            except TypeError:
-                break
-
-            path.append(bee_name)
-
-            bee = parent_ref()
-
-        return ".".join(path)
+        return get_absolute_name(bee_ref())
 
     def _write_reported_operation(self, op_name, source_ref, target_ref, data=_NoData):
         try:
@@ -148,7 +156,193 @@ class FileDebugContext(ReportedDebugContextBase):
         super(FileDebugContext, self).__exit__(exc_type, exc_val, exc_tb)
 
         debug_writer = csv_writer(self._file, dialect='excel')
-        debug_writer.writerow("Operation", "Source", "Target", "Value(?)")
+        debug_writer.writerow(("Operation", "Source", "Target", "Value(?)"))
         debug_writer.writerows(self._lines)
 
         self._lines.clear()
+
+
+class ProfiledEdge(object):
+    """Call statistics of a single connection or trigger between two bees"""
+
+    __slots__ = ("source_ref", "target_ref", "kind", "calls", "sampled_calls", "cumulative_time", "self_time")
+
+    def __init__(self, source_ref, target_ref, kind):
+        self.source_ref = source_ref
+        self.target_ref = target_ref
+        self.kind = kind
+
+        self.calls = 0
+        self.sampled_calls = 0
+        self.cumulative_time = 0.0
+        self.self_time = 0.0
+
+    def __repr__(self):
+        return "<ProfiledEdge {} calls={} cumulative={:.6f}s self={:.6f}s>".format(self.kind, self.calls,
+                                                                                 self.cumulative_time, self.self_time)
+
+
+class ProfilingDebugContext(DebugContextBase):
+    """Debug context to measure call counts and wall time of each push, pull and trigger edge between bees.
+
+    Edges are named by the absolute names of their bees (from their runtime info) when reported.
+    Times are only measured for every sample_interval-th outermost call (and all calls that it makes), to reduce
+    overhead; call counts are always recorded. Not thread-safe: profiled hives should be run by a single thread.
+    """
+
+    def __init__(self, sample_interval=1, timer=perf_counter):
+        assert sample_interval >= 1, sample_interval
+
+        self.sample_interval = sample_interval
+
+        self._timer = timer
+        self._edges = {}
+
+        # Stack of [edge, child time] frames of sampled calls
+        self._stack = []
+        # Map of edge tuples (outermost first) to self time
+        self._folded_stacks = {}
+
+        self._outermost_calls = 0
+        self._unsampled_depth = 0
+
+    def _get_edge(self, source, target, kind):
+        source_ref = ref(source)
+        target_ref = ref(target)
+        key = source_ref, target_ref, kind
+
+        try:
+            return self._edges[key]
+
+        except KeyError:
+            edge = self._edges[key] = ProfiledEdge(source_ref, target_ref, kind)
+            return edge
+
+    def profile_callable(self, edge, func):
+        """Return wrapper of func which records calls and times against edge"""
+        timer = self._timer
+        stack = self._stack
+        folded_stacks = self._folded_stacks
+
+        def profiled_call(*args):
+            edge.calls += 1
+
+            if not stack:
+                # Within an outermost call which is not sampled
+                if self._unsampled_depth:
+                    return func(*args)
+
+                self._outermost_calls += 1
+
+                if self._outermost_calls % self.sample_interval:
+                    self._unsampled_depth += 1
+                    try:
+                        return func(*args)
+
+                    finally:
+                        self._unsampled_depth -= 1
+
+            frame = [edge, 0.0]
+            stack.append(frame)
+            start = timer()
+
+            try:
+                return func(*args)
+
+            finally:
+                elapsed = timer() - start
+                self_time = elapsed - frame[1]
+
+                path = tuple(stack_frame[0] for stack_frame in stack)
+                folded_stacks[path] = folded_stacks.get(path, 0.0) + self_time
+
+                stack.pop()
+                if stack:
+                    stack[-1][1] += elapsed
+
+                edge.sampled_calls += 1
+                edge.cumulative_time += elapsed
+                edge.self_time += self_time
+
+        return profiled_call
+
+    def build_connection(self, source, target):
+        if isinstance(source, PushOut):
+            edge = self._get_edge(source, target, "push")
+            target = ProfiledPushOutTarget(self, ref(source), ref(target), edge)
+
+        elif isinstance(target, PullIn):
+            edge = self._get_edge(source, target, "pull")
+            source = ProfiledPullInSource(self, ref(source), ref(target), edge)
+
+        target._hive_connect_target(source)
+        source._hive_connect_source(target)
+
+    def build_trigger(self, source, target, pre):
+        target_func = target._hive_trigger_target()
+
+        if pre:
+            edge = self._get_edge(source, target, "pretrigger")
+            source._hive_pretrigger_source(self.profile_callable(edge, target_func))
+
+        else:
+            edge = self._get_edge(source, target, "trigger")
+            source._hive_trigger_source(self.profile_callable(edge, target_func))
+
+    @staticmethod
+    def _get_bee_name(bee_ref):
+        bee = bee_ref()
+        if bee is None:
+            return "<dead>"
+
+        try:
+            return get_absolute_name(bee) or "<root>"
+
+        except BeeNotNameableError:
+            return "<{}>".format(bee.__class__.__name__)
+
+    def get_edge_name(self, edge):
+        return "{} -{}-> {}".format(self._get_bee_name(edge.source_ref), edge.kind,
+                                    self._get_bee_name(edge.target_ref))
+
+    def get_edges(self):
+        """Return profiled edges, in descending order of self time"""
+        return sorted(self._edges.values(), key=lambda edge: edge.self_time, reverse=True)
+
+    def reset(self):
+        for edge in self._edges.values():
+            edge.calls = edge.sampled_calls = 0
+            edge.cumulative_time = edge.self_time = 0.0
+
+        self._folded_stacks.clear()
+        self._outermost_calls = 0
+
+    def format_report(self, limit=None):
+        """Return table of edge statistics, in descending order of self time"""
+        lines = ["{:>10} {:>10} {:>14} {:>14}  {}".format("Calls", "Sampled", "Cumulative (s)", "Self (s)", "Edge")]
+
+        for edge in self.get_edges()[:limit]:
+            lines.append("{:>10} {:>10} {:>14.6f} {:>14.6f}  {}".format(edge.calls, edge.sampled_calls,
+                                                                      edge.cumulative_time, edge.self_time,
+                                                                      self.get_edge_name(edge)))
+
+        return "\n".join(lines)
+
+    def write_folded_stacks(self, file_):
+        """Write sampled self times in folded-stack format (one "edge;edge;edge microseconds" line per stack),
+        as read by flame graph tools
+        """
+        edge_names = {}
+
+        for path, self_time in self._folded_stacks.items():
+            names = []
+            for edge in path:
+                try:
+                    name = edge_names[edge]
+
+                except KeyError:
+                    name = edge_names[edge] = self.get_edge_name(edge).replace(";", ":")
+
+                names.append(name)
+
+            file_.write("{} {}\n".format(";".join(names), int(self_time * 1e6)))
@@ -1,13 +1,15 @@
 from collections import defaultdict
+from itertools import chain
 from weakref import ref
 
+from .attribute import Attribute
 from .classes import (HiveInternalWrapper, HiveExportableWrapper, HiveArgsWrapper, HiveMetaArgsWrapper, ResolveBee,
                       HiveClassProxy)
 from .compatability import next, validate_signature
-from .connect import connect, ConnectionCandidate
-from .identifiers import identifiers_match
+from .compiler import compile_run_hive
+from .connect import connect, ConnectionCandidate, ConnectionIndex
 from .manager import (bee_register_context, get_mode, hive_mode_as, get_building_hive, building_hive_as, \
-                      run_hive_as, memoize, get_validation_enabled)
+                      run_hive_as, memoize, release_memoized, get_validation_enabled)
 from .mixins import *
 from .policies import MatchmakingPolicyError
 
@@ -20,6 +22,11 @@ def gen_sequence_bee_names():
         yield "anonymous_bee_{}".format(i)
 
 
+def is_matchmaking_bee(bee):
+    """Return True if bee is a plugin or socket that is matched by identifier"""
+    return (bee.implements(Plugin) or bee.implements(Socket)) and bee.identifier is not None
+
+
 class RuntimeHiveInstantiator(Bindable):
     """Instantiator Bee to instantiate runtime hives.
 
@@ -41,98 +48,106 @@ class RuntimeHive(ConnectSourceDerived, ConnectTargetDerived, TriggerSource, Tri
     Lightweight instantiation is supported through caching performed by the HiveObject instance.
     """
 
-    _hive_bee_name = ()
-    _hive_object = None
-    _hive_build_class_to_instance = None
-    _hive_bee_instances = None
-    _bee_names = None
-    _drones = None
+    __slots__ = ("_hive_bee_name", "_hive_object", "_hive_build_class_to_instance", "_hive_attribute_values",
+                 "_hive_runtime_info", "_hive_memoize_dependents", "__weakref__")
+
+    _hive_attribute_count = 0
+    _hive_exposed_bee_names = ()
+
+    def __init__(self, hive_object):
+        # Caches which memoize bind results for this hive, see release_memoized
+        self._hive_memoize_dependents = []
 
-    def __init__(self, hive_object, builders):
         self._hive_bee_name = hive_object._hive_bee_name
         self._hive_object = hive_object
-        self._hive_build_class_to_instance = {}
-        self._hive_bee_instances = {}
-        self._bee_names = ["_drones"]
-        self._drones = []
+        self._hive_build_class_to_instance = build_class_to_instance = {}
+        self._hive_attribute_values = [None] * self._hive_attribute_count
+        self._hive_runtime_info = None
 
         with run_hive_as(self):
             # Build args
             args = hive_object._hive_builder_args
             kwargs = hive_object._hive_builder_kwargs
 
-            for builder, builder_cls in builders:
-
-                if builder_cls is not None:
-                    assert builder_cls not in self._hive_build_class_to_instance, builder_cls
-
-                    # Do not initialise instance yet
-                    build_class_instance = builder_cls.__new__(builder_cls)
+            for builder_cls in hive_object._hive_get_builder_classes():
+                # Do not initialise instance yet
+                build_class_instance = builder_cls.__new__(builder_cls)
+                build_class_to_instance[builder_cls] = build_class_instance
 
-                    self._hive_build_class_to_instance[builder_cls] = build_class_instance
-                    self._drones.append(build_class_instance)
-
-                    build_class_instance.__init__(*args, **kwargs)
+                build_class_instance.__init__(*args, **kwargs)
 
             with building_hive_as(hive_object.__class__), hive_mode_as("build"):
-                # Add external bees to runtime hive
-                exposed_bees = []
-
-                external_bees = hive_object._hive_ex
-                for bee_name, bee in external_bees._items:
-                    exported_bee = bee.export()
+                self_ref = ref(self)
 
-                    # TODO: nice exception reporting
-                    instance = exported_bee.getinstance(self._hive_object)
-
-                    if isinstance(instance, Bindable):
-                        instance = instance.bind(self)
+                # Bind external bees, then internal bees, to runtime hive
+                for bee_name, instance, bind, exposed_name in hive_object._hive_get_instantiation_template():
+                    if bind is not None:
+                        instance = bind(self)
                         if instance is None:
                             continue
 
                     # Store runtime information on bee
                     if isinstance(instance, Nameable):
-                        instance.add_runtime_info(ref(self), bee_name)
+                        instance.add_runtime_info(self_ref, bee_name)
 
-                    exposed_bees.append((bee_name, instance))
+                    if exposed_name is None or isinstance(instance, Stateful):
+                        continue
 
-                # Add internal bees (that are hives, Callable or Stateful) to runtime hive
-                internal_bees = hive_object._hive_i
-                for bee_name, bee in internal_bees._items:
-                    private_name = "_" + bee_name
+                    # Bees must not replace attributes of this hive, including those bound by earlier steps
+                    assert not hasattr(self, exposed_name), exposed_name
 
-                    # Some runtime hive attributes are protected
-                    if not bee.implements(Stateful):
-                        assert not hasattr(self, private_name), private_name
+                    # Risk that multiple references to same bee exist
+                    setattr(self, exposed_name, instance)
 
-                    # TODO: nice exception reporting
-                    instance = bee.getinstance(self._hive_object)
-                    if isinstance(instance, Bindable):
-                        instance = instance.bind(self)
-                        if instance is None:
-                            continue
+    @property
+    def _hive_bee_instances(self):
+        """Dictionary of exposed bee names to bee instances, for bees which were bound to this hive.
 
-                    # Store runtime information on bee
-                    if isinstance(instance, Nameable):
-                        instance.add_runtime_info(ref(self), bee_name)
+        Read from the slots named by the class-level _hive_exposed_bee_names, rather than stored per hive. It is only
+        needed for introspection, compilation and release, so rebuilding it on each access is cheap enough.
+        """
+        instances = {}
 
-                    if isinstance(bee, HiveObject) or bee.implements(Callable):
-                        exposed_bees.append((private_name, instance))
+        for name in self._hive_exposed_bee_names:
+            try:
+                instances[name] = getattr(self, name)
 
-                for bee_name, instance in exposed_bees:
-                    if isinstance(instance, Stateful):
-                        continue
+            except AttributeError:
+                pass
 
-                    # Risk that multiple references to same bee exist
-                    self._hive_bee_instances[bee_name] = instance
-                    self._bee_names.append(bee_name)
+        return instances
 
-                    setattr(self, bee_name, instance)
+    @property
+    def _bee_names(self):
+        return ["_drones"] + list(self._hive_bee_instances)
+
+    @property
+    def _drones(self):
+        # Views the builder class instances, which are already stored per hive
+        return list(self._hive_build_class_to_instance.values())
+
+    def _hive_release(self):
+        """Invalidate results memoized for this hive (and its child hives), once it is no longer used"""
+        for instance in self._hive_bee_instances.values():
+            if isinstance(instance, RuntimeHive):
+                instance._hive_release()
+
+        release_memoized(self)
+
+    def _hive_compile(self, max_inline_depth=8):
+        """Flatten push, pull and trigger chains of this hive (and its children) into generated dispatch functions.
+
+        Connectivity must already be built; later connections are not seen by the compiled functions.
+        """
+        return compile_run_hive(self, max_inline_depth)
 
     @staticmethod
     def _hive_can_connect_hive(other):
         return isinstance(other, RuntimeHive)
 
+    def _hive_get_connection_index(self):
+        return self._hive_object._hive_get_connection_index()
+
     def _hive_find_connect_sources(self):
         return self._hive_object._hive_find_connect_sources()
 
@@ -141,12 +156,12 @@ class RuntimeHive(ConnectSourceDerived, ConnectTargetDerived, TriggerSource, Tri
 
     def _hive_trigger_source(self, target_func):
         source_name = self._hive_object._hive_find_trigger_source()
-        instance = self._hive_bee_instances[source_name]
+        instance = getattr(self, source_name)
         return instance._hive_trigger_source(target_func)
 
     def _hive_trigger_target(self):
         target_name = self._hive_object._hive_find_trigger_target()
-        instance = self._hive_bee_instances[target_name]
+        instance = getattr(self, target_name)
         return instance._hive_trigger_target()
 
     def _hive_get_connect_source(self, target):
@@ -226,15 +241,105 @@ class HiveObject(Exportable, ConnectSourceDerived, ConnectTargetDerived, Trigger
         """Return a RuntimeHiveInstantiator for this parent hive_object"""
         return RuntimeHiveInstantiator(self)
 
-    def instantiate(self):
-        """Return an instance of the runtime Hive for this Hive object."""
-        return self._hive_runtime_class(self, self._hive_parent_class._builders)
+    def instantiate(self, compile_dispatch=False):
+        """Return an instance of the runtime Hive for this Hive object.
+
+        :param compile_dispatch: flatten trigger/push chains into generated functions once connectivity is built
+        """
+        run_hive = self._hive_runtime_class(self)
+
+        if compile_dispatch:
+            run_hive._hive_compile()
+
+        return run_hive
+
+    def instantiate_many(self, count, compile_dispatch=False):
+        """Return a list of runtime Hive instances for this Hive object.
+
+        The instantiation template is resolved once and shared by every instance.
+
+        :param count: number of runtime hives to create
+        :param compile_dispatch: flatten trigger/push chains into generated functions once connectivity is built
+        """
+        runtime_class = self._hive_runtime_class
+
+        # The first instance resolves the template
+        run_hives = [runtime_class(self) for _ in range(count)]
+
+        if compile_dispatch:
+            for run_hive in run_hives:
+                run_hive._hive_compile()
+
+        return run_hives
+
+    @classmethod
+    @memoize
+    def _hive_get_builder_classes(cls):
+        """Return tuple of the builder classes whose instances are created for each runtime hive"""
+        builder_classes = tuple(builder_cls for builder, builder_cls in cls._hive_parent_class._builders
+                                if builder_cls is not None)
+        assert len(set(builder_classes)) == len(builder_classes), builder_classes
+
+        return builder_classes
+
+    @memoize
+    def _hive_get_instantiation_template(self):
+        """Resolve the bees of this Hive object into a tuple of (bee_name, instance, bind, exposed_name) steps.
+
+        Bee instances are memoized per HiveObject, so only binding remains to be performed per runtime hive. bind is the
+        bound method of Bindable instances, otherwise None.
+        Must be called in build mode, with this Hive object's class as the building hive (see RuntimeHive.__init__).
+        """
+        steps = []
+
+        # Add external bees to runtime hive
+        for bee_name, bee in self._hive_ex._items:
+            exported_bee = bee.export()
+
+            # TODO: nice exception reporting
+            instance = exported_bee.getinstance(self)
+            bind = instance.bind if isinstance(instance, Bindable) else None
+            steps.append((bee_name, instance, bind, bee_name))
+
+        # Add internal bees (that are hives, Callable or Stateful) to runtime hive
+        for bee_name, bee in self._hive_i._items:
+            private_name = "_" + bee_name
+
+            # Some runtime hive attributes are protected
+            if not bee.implements(Stateful):
+                assert not hasattr(RuntimeHive, private_name), private_name
+
+            # TODO: nice exception reporting
+            instance = bee.getinstance(self)
+
+            if isinstance(bee, HiveObject) or bee.implements(Callable):
+                exposed_name = private_name
+
+            else:
+                exposed_name = None
+
+            bind = instance.bind if isinstance(instance, Bindable) else None
+            steps.append((bee_name, instance, bind, exposed_name))
+
+        return tuple(steps)
 
     @staticmethod
     def _hive_can_connect_hive(other):
         return isinstance(other, HiveObject)
+
+    @classmethod
+    @memoize
+    def _hive_has_matchmaking_bees(cls):
+        """Return True if this hive, or any of its child hives, exports identified plugins or sockets"""
+        for bee in cls._hive_ex._values:
+            if is_matchmaking_bee(bee):
+                return True
+
+        return any(bee._hive_has_matchmaking_bees() for bee in chain(cls._hive_ex._values, cls._hive_i._values)
+                   if isinstance(bee, HiveObject))
     
     @classmethod
+    @memoize
     def _hive_find_trigger_target(cls):
         """Find name of single external bee that supported TriggerTarget interface.
 
@@ -258,6 +363,7 @@ class HiveObject(Exportable, ConnectSourceDerived, ConnectTargetDerived, Trigger
         return trigger_targets[0]
         
     @classmethod
+    @memoize
     def _hive_find_trigger_source(cls):
         """Find and return name of single external bee that supported TriggerSource interface.
 
@@ -281,38 +387,30 @@ class HiveObject(Exportable, ConnectSourceDerived, ConnectTargetDerived, Trigger
         return trigger_sources[0]
 
     @classmethod
-    def _hive_find_connect_sources(cls):
-        externals = cls._hive_ex
-
-        # Find source hive ConnectSources
+    @memoize
+    def _hive_get_connection_index(cls):
+        """Return ConnectionIndex of the external ConnectSources and ConnectTargets of this hive"""
         connect_sources = []
-        for bee_name, bee in externals._items:
+        connect_targets = []
+
+        for bee_name, bee in cls._hive_ex._items:
             exported_bee = bee.export()
 
-            if not exported_bee.implements(ConnectSource):
-                continue
+            if exported_bee.implements(ConnectSource):
+                connect_sources.append(ConnectionCandidate(bee_name, exported_bee.data_type))
 
-            candidate = ConnectionCandidate(bee_name, exported_bee.data_type)
-            connect_sources.append(candidate)
+            if exported_bee.implements(ConnectTarget):
+                connect_targets.append(ConnectionCandidate(bee_name, exported_bee.data_type))
 
-        return connect_sources
+        return ConnectionIndex(connect_sources, connect_targets)
 
     @classmethod
-    def _hive_find_connect_targets(cls):
-        externals = cls._hive_ex
-
-        # Find target hive ConnectTargets
-        connect_targets = []
-        for bee_name, bee in externals._items:
-            exported_bee = bee.export()
-
-            if not exported_bee.implements(ConnectTarget):
-                continue
-
-            candidate = ConnectionCandidate(bee_name, exported_bee.data_type)
-            connect_targets.append(candidate)
+    def _hive_find_connect_sources(cls):
+        return cls._hive_get_connection_index().connect_sources
 
-        return connect_targets
+    @classmethod
+    def _hive_find_connect_targets(cls):
+        return cls._hive_get_connection_index().connect_targets
 
     @classmethod
     def _hive_find_connect_source(cls, target):
@@ -322,8 +420,7 @@ class HiveObject(Exportable, ConnectSourceDerived, ConnectTargetDerived, Trigger
         """
         assert target.implements(ConnectTarget)
 
-        connect_sources = [c for c in cls._hive_find_connect_sources() if identifiers_match(c.data_type,
-                                                                                            target.data_type)]
+        connect_sources = cls._hive_get_connection_index().find_sources(target.data_type)
 
         if not connect_sources:
             raise TypeError("No matching connection sources found for {}".format(target))
@@ -341,8 +438,7 @@ F
         """
         assert source.implements(ConnectSource)
 
-        connect_targets = [c for c in cls._hive_find_connect_targets() if identifiers_match(c.data_type,
-                                                                                            source.data_type)]
+        connect_targets = cls._hive_get_connection_index().find_targets(source.data_type)
 
         if not connect_targets:
             raise TypeError("No matching connections found for {}".format(source))
@@ -526,8 +622,20 @@ class HiveBuilder(object):
 
         # TODO: auto-remove connections/triggers for which the source/target has been deleted
 
+        # Assign storage slots to attributes owned by this hive
+        attribute_count = 0
+        for bee in chain(internals._values, externals._values):
+            if not isinstance(bee, Attribute) or bee._hive_slot_index is not None:
+                continue
+
+            assert bee._hive_object_cls is hive_object_cls, "Attribute belongs to {}".format(bee._hive_object_cls)
+            bee._hive_slot_index = attribute_count
+            attribute_count += 1
+
         # Build runtime hive class
-        run_hive_class_dict = {"__doc__": cls.__doc__}
+        run_hive_class_dict = {"__doc__": cls.__doc__, "_hive_attribute_count": attribute_count}
+        exposed_internal_names = []
+        exposed_external_names = []
 
         # For internal bees
         for bee_name, bee in internals._items:
@@ -537,12 +645,24 @@ class HiveBuilder(object):
             if isinstance(bee, Stateful):
                 run_hive_class_dict[private_bee_name] = property(bee._hive_stateful_getter, bee._hive_stateful_setter)
 
+            # Otherwise reserve a slot for the bound bee, if it is exposed
+            elif isinstance(bee, HiveObject) or bee.implements(Callable):
+                exposed_internal_names.append(private_bee_name)
+
         # For external bees
         for bee_name, bee in externals._items:
             # If the bee requires a property interface, build a property
             if isinstance(bee, Stateful):
                 run_hive_class_dict[bee_name] = property(bee._hive_stateful_getter, bee._hive_stateful_setter)
 
+            else:
+                exposed_external_names.append(bee_name)
+
+        # Bound bees are stored in slots rather than a per-instance __dict__
+        exposed_bee_names = tuple(exposed_external_names + exposed_internal_names)
+        run_hive_class_dict["__slots__"] = exposed_bee_names
+        run_hive_class_dict["_hive_exposed_bee_names"] = exposed_bee_names
+
         run_hive_cls_name = "{}::run_hive".format(hive_object_cls.__name__)
         hive_object_cls._hive_runtime_class = type(run_hive_cls_name, (RuntimeHive,), run_hive_class_dict)
         return hive_object_cls
@@ -585,40 +705,37 @@ class HiveBuilder(object):
             # Get the external bees' resolvebee instead of raw bee
             bee_source = resolved_hive_object
 
-        child_hives = set()
-
-        # Find external hives
-        for bee in externals._values:
-            if not bee.implements(HiveObject):
-                continue
-
-            if not bee._hive_allow_import_namespace:
-                continue
+        child_hives = []
 
-            child_hives.add(bee)
+        # Find external and internal hives, ignoring those without any plugins or sockets to match
+        for wrapper in (externals, internals):
+            for bee in wrapper._values:
+                if not bee.implements(HiveObject):
+                    continue
 
-        # Find internal hives
-        for bee in internals._values:
-            if not bee.implements(HiveObject):
-                continue
+                if not bee._hive_allow_import_namespace:
+                    continue
 
-            if not bee._hive_allow_import_namespace:
-                continue
+                if not bee._hive_has_matchmaking_bees():
+                    continue
 
-            child_hives.add(bee)
+                if bee not in child_hives:
+                    child_hives.append(bee)
 
         # Find sockets and plugins that are exportable
-        for bee_name in externals._names:
+        for bee_name, bee in externals._items:
             # This will have already been handled by parent (as this method is called top-down)
             if bee_name in exported_to_parent:
                 continue
 
+            if not is_matchmaking_bee(bee):
+                continue
+
             bee = getattr(bee_source, bee_name)
+            identifier = bee.identifier
 
             # Find and connect identified plugins with existing sockets
-            if bee.implements(Plugin) and bee.identifier is not None:
-                identifier = bee.identifier
-
+            if bee.implements(Plugin):
                 plugin_policy = bee.policy()
 
                 node_info = bee, plugin_policy
@@ -627,28 +744,23 @@ class HiveBuilder(object):
                 tracked_policies.append(node_info)
 
                 # Can we connect to a socket?
-                if identifier in socket_map:
-                    socket_bees = socket_map[identifier]
-
-                    for socket_bee, socket_policy in socket_bees:
-                        try:
-                            plugin_policy.pre_connected()
-                            socket_policy.pre_connected()
+                for socket_bee, socket_policy in socket_map.get(identifier, ()):
+                    try:
+                        plugin_policy.pre_connected()
+                        socket_policy.pre_connected()
 
-                            connect(bee, socket_bee)
+                        connect(bee, socket_bee)
 
-                            plugin_policy.on_connected()
-                            socket_policy.on_connected()
+                        plugin_policy.on_connected()
+                        socket_policy.on_connected()
 
-                        except MatchmakingPolicyError:
-                            print("An error occurred during matchmaking for socket {}, {}".format(bee_name, identifier))
-                            print(socket_bee)
-                            raise
+                    except MatchmakingPolicyError:
+                        print("An error occurred during matchmaking for socket {}, {}".format(bee_name, identifier))
+                        print(socket_bee)
+                        raise
 
             # Find and connect identified sockets with existing plugins
-            if bee.implements(Socket) and bee.identifier is not None:
-                identifier = bee.identifier
-
+            if bee.implements(Socket):
                 socket_policy = bee.policy()
                 node_info = bee, socket_policy
                 socket_map[identifier].append(node_info)
@@ -656,35 +768,31 @@ class HiveBuilder(object):
                 tracked_policies.append(node_info)
 
                 # Can we connect to a plugin?
-                if identifier in plugin_map:
-                    plugin_bees = plugin_map[identifier]
-
-                    for plugin_bee, plugin_policy in plugin_bees:
-                        try:
-
-                            plugin_policy.pre_connected()
-                            socket_policy.pre_connected()
+                for plugin_bee, plugin_policy in plugin_map.get(identifier, ()):
+                    try:
+                        plugin_policy.pre_connected()
+                        socket_policy.pre_connected()
 
-                            connect(plugin_bee, bee)
+                        connect(plugin_bee, bee)
 
-                            plugin_policy.on_connected()
-                            socket_policy.on_connected()
+                        plugin_policy.on_connected()
+                        socket_policy.on_connected()
 
-                        except MatchmakingPolicyError:
-                            print("An error occurred during matchmaking for socket {}, {}".format(bee_name, identifier))
-                            print(plugin_bee)
-                            raise
+                    except MatchmakingPolicyError:
+                        print("An error occurred during matchmaking for socket {}, {}".format(bee_name, identifier))
+                        print(plugin_bee)
+                        raise
 
         # Get resolve bees instead of raw HiveObject instances (ResolveBees relative to parent)
         if not is_root:
-            child_hives = {ResolveBee(bee.export(), resolved_hive_object) for bee in child_hives}
+            child_hives = [ResolveBee(bee.export(), resolved_hive_object) for bee in child_hives]
 
         # Now export to child hives
         for child in child_hives:
             cls._hive_build_connectivity(child, tracked_policies, plugin_map, socket_map)
 
-        # Validate policies
-        if get_validation_enabled():
+        # Validate policies once the whole tree has been matched
+        if is_root and get_validation_enabled():
             for bee, policy in tracked_policies:
                 try:
                     policy.validate()
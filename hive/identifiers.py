@@ -1,3 +1,7 @@
+# Interned tuples of string identifiers
+_identifier_tuples = {}
+
+
 def identifier_is_valid(value):
     if isinstance(value, str):
         return True
@@ -11,7 +15,7 @@ def identifier_is_valid(value):
 def identifier_to_tuple(value, allow_none=True):
     """Generate a tuple identifier from a string / tuple object.
 
-    String identifiers are split by full-stop '.'.
+    String identifiers are split by full-stop '.', and the resulting tuples are interned.
     """
     if value is None:
         if not allow_none:
@@ -19,7 +23,12 @@ def identifier_to_tuple(value, allow_none=True):
         return ()
 
     if isinstance(value, str):
-        return tuple(value.split('.'))
+        try:
+            return _identifier_tuples[value]
+
+        except KeyError:
+            as_tuple = _identifier_tuples[value] = tuple(value.split('.'))
+            return as_tuple
     
     if not identifier_is_valid(value):
         raise ValueError("'{}' is not a valid identifier".format(value))
@@ -1,3 +1,4 @@
 from .contexts import *
 from .factory import ContextFactory
-from .memoize import memoize
+from .memoize import (memoize, get_memoize_stats, reset_memoize_stats, get_memoize_stats_enabled,
+                      set_memoize_stats_enabled, release_memoized)
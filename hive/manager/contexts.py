@@ -1,108 +1,116 @@
 from contextlib import contextmanager
+from contextvars import ContextVar
 
 
 hive_modes = {'immediate', 'build', 'declare'}
 
 
-_mode = "immediate"
-_building_hive = None
-_run_hive = None
-_bees = []
-_validation_enabled = True
+# Build and run state is context-local, so that hives can be built and instantiated from several threads
+_mode = ContextVar("hive_mode", default="immediate")
+_building_hive = ContextVar("hive_building_hive", default=None)
+_run_hive = ContextVar("hive_run_hive", default=None)
+_bees = ContextVar("hive_bees", default=())
+_validation_enabled = ContextVar("hive_validation_enabled", default=True)
 
 
 def get_validation_enabled():
-    return _validation_enabled
+    return _validation_enabled.get()
 
 
 def set_validation_enabled(validate):
-    global _validation_enabled
-    _validation_enabled = validate
+    _validation_enabled.set(validate)
 
 
 @contextmanager
 def validation_enabled_as(validate):
-    previous_validation_state = get_validation_enabled()
+    token = _validation_enabled.set(validate)
     try:
-        set_validation_enabled(validate)
         yield
 
     finally:
-        set_validation_enabled(previous_validation_state)
+        _validation_enabled.reset(token)
 
 
 def get_mode():
-    return _mode
+    return _mode.get()
 
 
 def set_mode(mode):
-    global _mode
     assert mode in hive_modes, mode
-    _mode = mode
+    _mode.set(mode)
 
 
 @contextmanager
 def hive_mode_as(mode):
-    previous_mode = get_mode()
+    assert mode in hive_modes, mode
+    token = _mode.set(mode)
     try:
-        set_mode(mode)
         yield
 
     finally:
-        set_mode(previous_mode)
+        _mode.reset(token)
 
 
 def get_building_hive():
     """Return the current hive being built"""
-    return _building_hive
+    return _building_hive.get()
 
 
 def set_building_hive(building_hive):
-    global _building_hive
-    _building_hive = building_hive
+    _building_hive.set(building_hive)
 
 
 @contextmanager
 def building_hive_as(building_hive):
-    previous_building_hive = get_building_hive()
-    set_building_hive(building_hive)
-    yield
-    set_building_hive(previous_building_hive)
+    token = _building_hive.set(building_hive)
+    try:
+        yield
+
+    finally:
+        _building_hive.reset(token)
 
 
 def get_run_hive():
-    return _run_hive
+    return _run_hive.get()
 
 
 def set_run_hive(run_hive):
-    global _run_hive
-    _run_hive = run_hive
+    _run_hive.set(run_hive)
 
 
 @contextmanager
 def run_hive_as(run_hive):
-    previous_run_hive = get_run_hive()
-    set_run_hive(run_hive)
-    yield
-    set_run_hive(previous_run_hive)
+    token = _run_hive.set(run_hive)
+    try:
+        yield
+
+    finally:
+        _run_hive.reset(token)
 
 
 def register_bee(bee):
-    assert _bees, "No valid state exists registering bees, call register_bee_push()"
-    _bees[-1].append(bee)
+    bees = _bees.get()
+    assert bees, "No valid state exists registering bees, call register_bee_push()"
+    bees[-1].append(bee)
 
 
 def register_bee_pop():
-    assert _bees, "No valid state exists registering bees"
-    return _bees.pop()
+    bees = _bees.get()
+    assert bees, "No valid state exists registering bees"
+    _bees.set(bees[:-1])
+    return bees[-1]
 
 
 def register_bee_push():
-    _bees.append([])
+    # Stack is an immutable tuple, so that copied contexts do not share it
+    _bees.set(_bees.get() + ([],))
 
 
 @contextmanager
 def bee_register_context():
     register_bee_push()
-    yield _bees[-1]
-    register_bee_pop()
+    try:
+        yield _bees.get()[-1]
+
+    finally:
+        register_bee_pop()
@@ -1,30 +1,160 @@
-from weakref import WeakKeyDictionary
 from functools import wraps
+from inspect import CO_VARARGS, CO_VARKEYWORDS
+from threading import Lock
 
 
-_memoize_cache = WeakKeyDictionary()
+class MemoizeStats(object):
+    """Hit / miss counters for a memoized function"""
+
+    __slots__ = ("hits", "misses")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return "<MemoizeStats hits={} misses={}>".format(self.hits, self.misses)
+
+
+_memoize_stats = {}
+
+# Counting hits and misses costs time on every call, so it must be enabled explicitly
+_stats_enabled = False
+
+# Guards creation of caches, so that concurrent first calls share one cache
+_cache_lock = Lock()
+
+
+def get_memoize_stats_enabled():
+    return _stats_enabled
+
+
+def set_memoize_stats_enabled(enabled):
+    """Enable or disable counting of hits and misses by memoized functions"""
+    global _stats_enabled
+    _stats_enabled = enabled
+
+
+def get_memoize_stats():
+    """Return dictionary of memoized function names to MemoizeStats"""
+    return _memoize_stats.copy()
+
+
+def reset_memoize_stats():
+    for stats in _memoize_stats.values():
+        stats.hits = stats.misses = 0
+
+
+def release_memoized(obj):
+    """Invalidate all memoized results which were cached for argument obj.
+
+    Caches hold their arguments, so this must be called for objects (e.g. run hives) that are no longer used.
+    Only arguments with a _hive_memoize_dependents list (of the caches that hold them) are tracked. The argument holds
+    these caches itself, so they are released with it rather than by a process-wide map.
+    """
+    dependents = obj._hive_memoize_dependents
+
+    for cache in dependents:
+        cache.pop(obj, None)
+
+    del dependents[:]
+
+
+def _create_cache(owner, cache_name):
+    """Create the results cache of owner, unless another thread has already done so"""
+    with _cache_lock:
+        if isinstance(owner, type):
+            cache = owner.__dict__.get(cache_name)
+            if cache is None:
+                cache = {}
+                setattr(owner, cache_name, cache)
+
+        else:
+            cache = getattr(owner, cache_name, None)
+            if cache is None:
+                cache = {}
+
+                # Avoid custom __setattr__ implementations
+                object.__setattr__(owner, cache_name, cache)
+
+    return cache
 
 
 def memoize(func):
     """Memoizing decorator
 
-    Cache function call results for similar arguments
+    Cache function call results for similar arguments.
+    Results are stored in a dictionary on the instance itself (or the class, for class methods), keyed by argument.
+    Functions of a single argument (e.g. bind(run_hive)) are keyed on that argument directly, without packing a tuple.
     """
-    func_instance_cache = _memoize_cache[func] = WeakKeyDictionary()
+    cache_name = "_hive_memoize_{}".format(func.__qualname__)
+    stats = _memoize_stats["{}.{}".format(func.__module__, func.__qualname__)] = MemoizeStats()
+
+    code = func.__code__
+    has_var_args = code.co_flags & (CO_VARARGS | CO_VARKEYWORDS)
+    is_single_arg = code.co_argcount == 2 and not func.__defaults__ and not has_var_args
+
+    if is_single_arg:
+        @wraps(func)
+        def wrapper(self, arg):
+            # Only look in the namespace of classes, so that they do not share the caches of their bases. Instances
+            # use attribute access, as reading their __dict__ would create one for each memoized bee
+            if isinstance(self, type):
+                cache = self.__dict__.get(cache_name)
+
+            else:
+                cache = getattr(self, cache_name, None)
+
+            if cache is None:
+                cache = _create_cache(self, cache_name)
+
+            try:
+                result = cache[arg]
+
+            except KeyError:
+                if _stats_enabled:
+                    stats.misses += 1
+
+                # If another thread computed the same result concurrently, keep the first one
+                result = cache.setdefault(arg, func(self, arg))
+
+                # Track caches which hold this argument, for release_memoized
+                dependents = getattr(arg, "_hive_memoize_dependents", None)
+                if dependents is not None:
+                    dependents.append(cache)
+
+                return result
+
+            if _stats_enabled:
+                stats.hits += 1
+
+            return result
+
+    else:
+        @wraps(func)
+        def wrapper(self, *args):
+            if isinstance(self, type):
+                cache = self.__dict__.get(cache_name)
+
+            else:
+                cache = getattr(self, cache_name, None)
+
+            if cache is None:
+                cache = _create_cache(self, cache_name)
+
+            try:
+                result = cache[args]
 
-    @wraps(func)
-    def wrapper(self, *args):
-        try:
-            results_cache = func_instance_cache[self]
+            except KeyError:
+                if _stats_enabled:
+                    stats.misses += 1
 
-        except KeyError:
-            results_cache = func_instance_cache[self] = {}
+                return cache.setdefault(args, func(self, *args))
 
-        try:
-            return results_cache[args]
+            if _stats_enabled:
+                stats.hits += 1
 
-        except KeyError:
-            result = results_cache[args] = func.__get__(self)(*args)
             return result
 
-    return wrapper
\ No newline at end of file
+    wrapper._hive_memoize_stats = stats
+    return wrapper
@@ -27,7 +27,7 @@ class Parameter(object):
 
 class Connectable(object):
     # Connectables don't need to be Bees!
-    pass
+    __slots__ = ()
 
 
 class Bindable(object):
@@ -36,6 +36,7 @@ class Bindable(object):
 
 
 class Nameable(object):
+    __slots__ = ()
     _hive_runtime_info = None
 
     def add_runtime_info(self, parent, name):
@@ -12,10 +12,11 @@ from . import Connectable
 
 
 class ConnectSourceBase(Connectable):
-    pass
+    __slots__ = ()
 
 
 class ConnectSource(ConnectSourceBase):
+    __slots__ = ()
     data_type = None
 
     def _hive_is_connectable_source(self, target):
@@ -26,6 +27,7 @@ class ConnectSource(ConnectSourceBase):
 
 
 class ConnectSourceDerived(ConnectSourceBase):
+    __slots__ = ()
 
     def _hive_find_connect_sources(self):
         raise NotImplementedError
@@ -12,10 +12,11 @@ from . import Connectable
 
 
 class ConnectTargetBase(Connectable):
-    pass
+    __slots__ = ()
 
 
 class ConnectTarget(ConnectTargetBase):
+    __slots__ = ()
     data_type = None
 
     def _hive_is_connectable_target(self, source):
@@ -26,6 +27,7 @@ class ConnectTarget(ConnectTargetBase):
 
 
 class ConnectTargetDerived(ConnectTargetBase):    
+    __slots__ = ()
 
     def _hive_find_connect_targets(self):
         raise NotImplementedError
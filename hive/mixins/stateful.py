@@ -6,8 +6,11 @@ The getter/setter of this attribute are hiveinstance._hive_stateful.getter and h
  respectively
  
 A Stateful object's getter/setter always accept a run_hive object, which will be None in immediate mode
+The bound getter/setter return the equivalent callables with the run_hive argument applied
 """
 
+from functools import partial
+
 
 class Stateful(object):
 
@@ -15,4 +18,10 @@ class Stateful(object):
         raise NotImplementedError
 
     def _hive_stateful_setter(self, run_hive, value):
-        raise NotImplementedError    
+        raise NotImplementedError
+
+    def _hive_stateful_bound_getter(self, run_hive):
+        return partial(self._hive_stateful_getter, run_hive)
+
+    def _hive_stateful_bound_setter(self, run_hive):
+        return partial(self._hive_stateful_setter, run_hive)
@@ -8,16 +8,18 @@ from . import Connectable
 
 
 class TriggerTargetBase(Connectable):
-    pass
+    __slots__ = ()
 
 
 class TriggerTarget(TriggerTargetBase):
+    __slots__ = ()
 
     def _hive_trigger_target(self):
         raise NotImplementedError
 
 
 class TriggerTargetDerived(TriggerTargetBase):
+    __slots__ = ()
 
     def _hive_get_trigger_target(self):
         raise NotImplementedError
\ No newline at end of file
@@ -1,5 +1,3 @@
-from functools import partial
-
 from .annotations import get_argument_types
 from .classes import Pusher
 from .identifiers import identifiers_match
@@ -26,7 +24,7 @@ class PPInBase(Antenna, ConnectTarget, TriggerSource, Bindable, Nameable):
             data_type = target.data_type
 
             # If not yet bound, set_value will have None for run hive!
-            self._set_value = partial(target._hive_stateful_setter, run_hive)
+            self._set_value = target._hive_stateful_bound_setter(run_hive)
 
         else:
             self._set_value = target
@@ -1,5 +1,3 @@
-from functools import partial
-
 from .annotations import get_return_type
 from .classes import Pusher
 from .identifiers import identifiers_match
@@ -16,7 +14,7 @@ class PPOutBase(Output, ConnectSource, TriggerSource, Bindable, Nameable):
 
         if is_stateful:
             data_type = target.data_type
-            self._get_value = partial(target._hive_stateful_getter, run_hive)
+            self._get_value = target._hive_stateful_bound_getter(run_hive)
 
         else:
             if not data_type:
@@ -1,5 +1,3 @@
-from weakref import WeakSet
-
 from .mixins import Stateful, Exportable, Bindable, Parameter, Nameable
 from .manager import get_mode, get_building_hive, memoize
 
@@ -13,7 +11,6 @@ class Property(Stateful, Bindable, Exportable, Nameable):
         self._hive_object_cls = get_building_hive()
         self._cls = cls
         self._attr = attr
-        self._bound = WeakSet()
 
         self.data_type = data_type
         self.start_value = start_value
@@ -39,8 +36,6 @@ class Property(Stateful, Bindable, Exportable, Nameable):
 
     @memoize
     def bind(self, run_hive):
-        self._bound.add(run_hive)
-        
         cls = self._cls
         assert cls in run_hive._hive_build_class_to_instance, cls #TODO, DEBUG can remove?
         instance = run_hive._hive_build_class_to_instance[cls]
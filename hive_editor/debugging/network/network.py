@@ -1,9 +1,9 @@
 from errno import ECONNRESET, ENODATA
 from queue import Queue, Empty
 from socket import AF_INET, SOCK_STREAM, socket, error as SOCK_ERROR, SHUT_RDWR, SOL_SOCKET, SO_REUSEADDR
-from struct import pack, unpack_from, calcsize
 from threading import Event, Thread
 
+from dragonfly.network.framing import MessageDecoder, encode_message
 
 from ...observer import Observable
 
@@ -17,34 +17,17 @@ class ConnectionBase:
     def __init__(self):
         self._send_queue = Queue()
 
-        self._received_raw = b''
+        self._decoder = MessageDecoder("u32")
         self._thread = None
 
         self._is_running_event = Event()
 
     def _on_received(self, data):
-        self._received_raw += data
-
-        messages = []
-        while self._received_raw:
-            length, = unpack_from("H", self._received_raw)
-            offset = calcsize("H")
-
-            end_index = offset + length
-            if end_index > len(self._received_raw):
-                break
-
-            message = self._received_raw[offset: end_index]
-            self._received_raw = self._received_raw[end_index:]
-
-            messages.append(message)
-
-        for message in messages:
+        for message in self._decoder.feed(data):
             self.on_received(message)
 
     def send(self, data):
-        length_encoded = pack("H", len(data)) + data
-        self._send_queue.put(length_encoded)
+        self._send_queue.put(encode_message(data, "u32"))
 
     def _run_threaded(self):
         raise NotImplementedError
@@ -55,6 +38,9 @@ class ConnectionBase:
 
         send_queue = self._send_queue
 
+        # Discard partial message of previous connection
+        self._decoder.reset()
+
         self.on_connected()
 
         while all(f.is_set() for f in alive_flags):
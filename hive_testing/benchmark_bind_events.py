@@ -0,0 +1,66 @@
+"""Measure event dispatch to handlers of 2000 bound child hives"""
+
+from __future__ import print_function
+
+import os
+import sys
+import time
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from dragonfly.bind import create_instantiator
+from dragonfly.event import EventManager, EventHandler, bind_info
+from dragonfly.std import Variable
+
+
+class Child(object):
+
+    def __init__(self):
+        self.damage = 0
+
+    def on_damage(self, tail):
+        self.damage += tail[0]
+
+    def set_add_handler(self, add_handler):
+        add_handler(EventHandler(self.on_damage, ("damage",)))
+
+
+def build_child(cls, i, ex, args):
+    ex.get_add_handler = hive.socket(cls.set_add_handler, "event.add_handler")
+
+
+ChildHive = hive.hive("Child", build_child, Child)
+Instantiator = create_instantiator(bind_info)
+
+
+def build_scene(i, ex, args):
+    ex.events = EventManager()
+    ex.instantiator = Instantiator(forward_events="all")
+
+    i.hive_class = Variable("class", start_value=ChildHive)
+    hive.connect(i.hive_class, ex.instantiator.hive_class)
+
+    i.count = Variable("int", start_value=2000)
+    hive.connect(i.count, ex.instantiator.count)
+
+
+SceneHive = hive.hive("Scene", build_scene)
+
+
+def measure(event, event_count=200):
+    scene = SceneHive()
+    scene.instantiator.create_many()
+    read_event = scene.events.read_event.plugin()
+
+    start = time.perf_counter()
+    for _ in range(event_count):
+        read_event(event)
+
+    return (time.perf_counter() - start) / event_count
+
+
+if __name__ == "__main__":
+    print("Matching event:     {:.3f} ms".format(measure(("damage", 1)) * 1000))
+    print("Non-matching event: {:.3f} ms".format(measure(("tick",)) * 1000))
@@ -0,0 +1,74 @@
+"""Compare ticks/sec of interpreted and compiled trigger/push dispatch"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+
+
+class Stage(object):
+
+    def __init__(self):
+        self.value = 0
+
+    def step(self):
+        self.value += 1
+
+
+def build_stage(cls, i, ex, args):
+    i.value = hive.property(cls, "value", "int")
+
+    i.tick = hive.triggerfunc(cls.step)
+    ex.tick = hive.hook(i.tick)
+    ex.do_tick = hive.entry(hive.triggerable(i.tick))
+
+    i.value_in = hive.push_in(i.value)
+    ex.value_in = hive.antenna(i.value_in)
+
+    i.value_out = hive.push_out(i.value)
+    ex.value_out = hive.output(i.value_out)
+    hive.trigger(i.tick, i.value_out)
+
+
+Stage = hive.hive("Stage", build_stage, Stage)
+
+
+def build_pipeline(i, ex, args):
+    stages = [Stage() for _ in range(8)]
+
+    for index, stage in enumerate(stages):
+        setattr(ex, "stage_{}".format(index), stage)
+
+    for source, target in zip(stages, stages[1:]):
+        hive.trigger(source.tick, target.do_tick)
+        hive.connect(source.value_out, target.value_in)
+
+    ex.tick = hive.entry(stages[0].do_tick)
+
+
+Pipeline = hive.hive("Pipeline", build_pipeline)
+
+
+def measure(pipeline, ticks=20000):
+    duration = timeit.timeit(pipeline.tick, number=ticks)
+    return ticks / duration
+
+
+if __name__ == "__main__":
+    interpreted = Pipeline()
+
+    compiled = Pipeline()
+    compiled._hive_compile()
+
+    interpreted_rate = measure(interpreted)
+    compiled_rate = measure(compiled)
+
+    print("Interpreted: {:.0f} ticks/sec".format(interpreted_rate))
+    print("Compiled:    {:.0f} ticks/sec".format(compiled_rate))
+    print("Speedup:     {:.2f}x".format(compiled_rate / interpreted_rate))
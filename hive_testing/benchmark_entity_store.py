@@ -0,0 +1,70 @@
+"""Compare moving 10k entities with per-entity position plugins, and with the bulk get_many / set_many plugins"""
+
+from __future__ import print_function
+
+import os
+import sys
+import time
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from dragonfly.entity import EntityStore
+from dragonfly.entity.store import EntityStoreClass, numpy
+
+
+ENTITY_COUNT = 10000
+
+
+def build_scene(i, ex, args):
+    ex.entities = EntityStore(capacity=ENTITY_COUNT)
+
+
+SceneHive = hive.hive("Scene", build_scene)
+
+
+def move_each(manager, entity_ids):
+    get_position = manager.get_absolute_position
+    set_position = manager.set_absolute_position
+    get_velocity = manager.get_linear_velocity
+
+    for entity_id in entity_ids:
+        x, y, z = get_position(entity_id)
+        dx, dy, dz = get_velocity(entity_id)
+        set_position(entity_id, (x + dx, y + dy, z + dz))
+
+
+def move_many(manager, entity_ids):
+    positions = manager.get_many_positions(entity_ids)
+    velocities = manager.get_many_linear_velocities(entity_ids)
+
+    if numpy is not None:
+        manager.set_many_positions(entity_ids, positions + velocities)
+
+    else:
+        manager.set_many_positions(entity_ids, [(x + dx, y + dy, z + dz) for (x, y, z), (dx, dy, dz)
+                                                in zip(positions, velocities)])
+
+
+def measure(move, manager, entity_ids, repeat=10):
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        move(manager, entity_ids)
+        durations.append(time.perf_counter() - start)
+
+    return min(durations)
+
+
+if __name__ == "__main__":
+    scene = SceneHive()
+    manager = scene.entities._hive_build_class_to_instance[EntityStoreClass]
+
+    entity_ids = [manager.spawn_entity("particle") for _ in range(ENTITY_COUNT)]
+    manager.set_many_linear_velocities(entity_ids, [(1.0, 0.0, 0.0)] * ENTITY_COUNT)
+
+    print("NumPy:           {}".format("yes" if numpy is not None else "no (pure Python fallback)"))
+
+    for label, move in (("Per entity:", move_each), ("get/set_many:", move_many)):
+        print("{:<16} {:.2f} ms per step".format(label, measure(move, manager, entity_ids) * 1000))
@@ -0,0 +1,54 @@
+"""Measure event dispatch throughput against the number of registered handlers"""
+
+from __future__ import print_function
+
+import os
+import sys
+import time
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+from dragonfly.event.event import EventDispatcher, EventHandler
+
+
+def make_dispatcher(handler_count):
+    """Create dispatcher with a tick handler, and a mix of key and collision handlers which do not match ticks"""
+    dispatcher = EventDispatcher()
+    calls = [0]
+
+    def on_event(*args):
+        calls[0] += 1
+
+    dispatcher.add_handler(EventHandler(on_event, ("tick",), mode="match"))
+    dispatcher.add_handler(EventHandler(on_event, ("pre_tick",), mode="trigger"))
+
+    for index in range(handler_count - 2):
+        if index % 2:
+            handler = EventHandler(on_event, ("keyboard", "pressed", "key_{}".format(index)), mode="match")
+
+        else:
+            handler = EventHandler(on_event, ("collision", "entity_{}".format(index)), priority=index % 7)
+
+        dispatcher.add_handler(handler)
+
+    return dispatcher, calls
+
+
+def measure(handler_count, event_count=20000):
+    dispatcher, calls = make_dispatcher(handler_count)
+    events = [("tick",), ("pre_tick",), ("keyboard", "pressed", "key_1"), ("collision", "entity_0", "entity_2")]
+
+    start = time.perf_counter()
+    for index in range(event_count):
+        dispatcher.handle_event(events[index % 4])
+
+    duration = time.perf_counter() - start
+
+    assert calls[0] == event_count
+    return event_count / duration
+
+
+if __name__ == "__main__":
+    for handler_count in (10, 100, 1000, 10000):
+        print("{:>6} handlers: {:>10.0f} events/s".format(handler_count, measure(handler_count)))
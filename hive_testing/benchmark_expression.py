@@ -0,0 +1,70 @@
+"""Measure build time of many Expression hives sharing an expression, and the time to evaluate them"""
+
+from __future__ import print_function
+
+import os
+import sys
+import time
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from dragonfly.op import Expression
+
+
+EXPRESSION = "a * b + sqrt(c) - d / e"
+VARIABLES = "abcde"
+
+
+def build_scene(i, ex, args, meta_args):
+    for index in range(meta_args.count):
+        expression = Expression(EXPRESSION, "float")
+        setattr(i, "expression_{}".format(index), expression)
+        setattr(ex, "result_{}".format(index), hive.output(expression.result))
+
+        for name in VARIABLES:
+            attribute = hive.attribute("float", 2.0)
+            setattr(i, "{}_{}".format(name, index), attribute)
+
+            pull_out = hive.pull_out(attribute)
+            setattr(i, "pull_{}_{}".format(name, index), pull_out)
+            hive.connect(pull_out, getattr(expression, name))
+
+
+def declare_scene(meta_args):
+    meta_args.count = hive.parameter("int", 100)
+
+
+Scene = hive.dyna_hive("Scene", build_scene, declarator=declare_scene)
+
+
+if __name__ == "__main__":
+    count = 100
+    build_durations = []
+
+    for _ in range(5):
+        start = time.perf_counter()
+        scene = Scene(count)
+        build_durations.append(time.perf_counter() - start)
+
+    print("First build:  {:.3f} s ({} hives)".format(build_durations[0], count))
+    print("Rebuild:      {:.3f} s".format(min(build_durations[1:])))
+
+    for label in ("Interpreted", "Compiled"):
+        if label == "Compiled":
+            scene._hive_compile()
+
+        pulls = [getattr(scene, "result_{}".format(index)).pull for index in range(count)]
+
+        evaluate_durations = []
+        for _ in range(20):
+            start = time.perf_counter()
+
+            for _ in range(100):
+                for pull in pulls:
+                    pull()
+
+            evaluate_durations.append(time.perf_counter() - start)
+
+        print("{:<13} {:.0f} evaluations/s".format(label + ":", count * 100 / min(evaluate_durations)))
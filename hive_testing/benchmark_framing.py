@@ -0,0 +1,62 @@
+"""Compare reassembly of a burst of small messages by buffer slicing and by MessageDecoder"""
+
+from __future__ import print_function
+
+import os
+import sys
+import time
+from struct import pack, unpack_from
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+from dragonfly.network import MessageDecoder, encode_message
+
+
+def decode_by_slicing(chunks):
+    """Reassemble messages as the editor debugger did, by slicing the remaining buffer per message"""
+    received_raw = b""
+    messages = []
+
+    for chunk in chunks:
+        received_raw += chunk
+
+        while len(received_raw) >= 4:
+            length, = unpack_from("!I", received_raw)
+            end_index = 4 + length
+            if end_index > len(received_raw):
+                break
+
+            messages.append(received_raw[4:end_index])
+            received_raw = received_raw[end_index:]
+
+    return messages
+
+
+def decode_with_decoder(chunks):
+    decoder = MessageDecoder("u32")
+    messages = []
+
+    for chunk in chunks:
+        messages.extend(decoder.feed(chunk))
+
+    return messages
+
+
+def measure(decode, chunks):
+    start = time.perf_counter()
+    messages = decode(chunks)
+    return time.perf_counter() - start, len(messages)
+
+
+if __name__ == "__main__":
+    stream = b"".join(encode_message(pack("!Q", index)) for index in range(100000))
+    chunks = [stream[index:index + 262144] for index in range(0, len(stream), 262144)]
+
+    slicing_time, slicing_count = measure(decode_by_slicing, chunks)
+    decoder_time, decoder_count = measure(decode_with_decoder, chunks)
+    assert slicing_count == decoder_count
+
+    print("Messages:       {} in {} chunks".format(decoder_count, len(chunks)))
+    print("Slicing:        {:.3f} s".format(slicing_time))
+    print("MessageDecoder: {:.3f} s".format(decoder_time))
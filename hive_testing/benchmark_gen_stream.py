@@ -0,0 +1,85 @@
+"""Compare ForEach pushing every item of a Map / Filter pipeline, with pushing chunks of items"""
+
+from __future__ import print_function
+
+import os
+import sys
+import time
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from dragonfly.gen import ForEach, Map, Filter
+
+
+ITEM_COUNT = 100000
+
+
+def declare_scene(meta_args):
+    meta_args.chunk_size = hive.parameter("int", 1)
+
+
+def build_scene(i, ex, args, meta_args):
+    i.source = hive.attribute()
+    i.pull_source = hive.pull_out(i.source)
+
+    i.map = Map("x * 3")
+    i.filter = Filter("x % 2 == 0")
+    hive.connect(i.pull_source, i.map.iterable)
+    hive.connect(i.map.iterator, i.filter.iterable)
+
+    i.foreach = ForEach(chunk_size=meta_args.chunk_size)
+    hive.connect(i.filter.iterator, i.foreach.iterable)
+    ex.start = hive.entry(i.foreach.start)
+
+    i.total = hive.attribute("int", 0)
+
+    if meta_args.chunk_size > 1:
+        i.chunk = hive.attribute("list")
+        i.push_chunk = hive.push_in(i.chunk)
+        hive.connect(i.foreach.chunk, i.push_chunk)
+        push_in = i.push_chunk
+
+        def add(self):
+            self._total += sum(self._chunk)
+
+    else:
+        i.item = hive.attribute("int")
+        i.push_item = hive.push_in(i.item)
+        hive.connect(i.foreach.item, i.push_item)
+        push_in = i.push_item
+
+        def add(self):
+            self._total += self._item
+
+    i.add = hive.modifier(add)
+    hive.trigger(push_in, i.add)
+
+    i.pull_total = hive.pull_out(i.total)
+    ex.total = hive.output(i.pull_total)
+
+
+Scene = hive.dyna_hive("Scene", build_scene, declare_scene)
+
+
+def measure(chunk_size, repeat=5):
+    durations = []
+
+    for _ in range(repeat):
+        scene = Scene(chunk_size)
+        scene._source = range(ITEM_COUNT)
+
+        start = time.perf_counter()
+        scene.start()
+        durations.append(time.perf_counter() - start)
+
+    assert scene.total.pull() == sum(x * 3 for x in range(ITEM_COUNT) if (x * 3) % 2 == 0)
+    return min(durations)
+
+
+if __name__ == "__main__":
+    for chunk_size in (1, 16, 256):
+        duration = measure(chunk_size)
+        print("Chunk size {:>3}: {:.1f} ms ({:.0f} items/s)".format(chunk_size, duration * 1000,
+                                                                     ITEM_COUNT / duration))
@@ -0,0 +1,83 @@
+"""Compare per-entity hive construction against bulk instantiation from one HiveObject"""
+
+from __future__ import print_function
+
+import gc
+import os
+import sys
+import time
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from hive.manager import hive_mode_as
+
+
+class Entity(object):
+
+    def __init__(self):
+        self.health = 100
+        self.damage = 0
+
+    def apply_damage(self):
+        self.health -= self.damage
+
+
+def build_entity(cls, i, ex, args):
+    i.health = hive.property(cls, "health", "int")
+    i.pull_health = hive.pull_out(i.health)
+    ex.health = hive.output(i.pull_health)
+
+    i.damage = hive.property(cls, "damage", "int")
+    i.push_damage = hive.push_in(i.damage)
+    ex.damage = hive.antenna(i.push_damage)
+
+    i.apply_damage = hive.triggerable(cls.apply_damage)
+    hive.trigger(i.push_damage, i.apply_damage)
+
+    i.on_damaged = hive.triggerfunc()
+    ex.on_damaged = hive.hook(i.on_damaged)
+    i.do_on_damaged = hive.triggerable(i.on_damaged)
+    hive.trigger(i.push_damage, i.do_on_damaged)
+
+    ex.score = hive.attribute("int", 0)
+    i.pull_score = hive.pull_out(ex.score)
+    ex.score_out = hive.output(i.pull_score)
+
+
+Entity = hive.hive("Entity", build_entity, Entity)
+
+
+def spawn_individually(count):
+    return [Entity() for _ in range(count)]
+
+
+def spawn_many(count):
+    with hive_mode_as("build"):
+        hive_object = Entity()
+
+    return hive_object.instantiate_many(count)
+
+
+def measure(spawn, count):
+    # Do not charge this run for collecting the hives of the previous one
+    gc.collect()
+
+    start = time.perf_counter()
+    spawn(count)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    count = 10000
+
+    # Warm up class build
+    spawn_individually(1)
+
+    individual_time = measure(spawn_individually, count)
+    bulk_time = measure(spawn_many, count)
+
+    print("Individual: {:.0f} hives/sec".format(count / individual_time))
+    print("Bulk:       {:.0f} hives/sec".format(count / bulk_time))
+    print("Speedup:    {:.2f}x".format(individual_time / bulk_time))
@@ -0,0 +1,139 @@
+"""Measure build time of a synthetic 10-level hive tree with plugin/socket matchmaking.
+
+Matchmaking only visits child hives which have plugins or sockets to match. This is compared with visiting every child
+hive, as the matchmaking did before.
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import time
+from itertools import chain
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from hive.manager import hive_mode_as
+
+
+class Payload(object):
+
+    def __init__(self):
+        self.value = 0
+
+
+def build_payload(cls, i, ex, args):
+    i.value = hive.property(cls, "value", "int")
+    i.pull_value = hive.pull_out(i.value)
+    ex.value = hive.output(i.pull_value)
+
+
+# Has no plugins or sockets, so matchmaking can skip it
+PayloadHive = hive.hive("PayloadHive", build_payload, Payload)
+
+
+class Node(object):
+
+    def __init__(self):
+        self.value = 0
+        self.get_root = None
+
+    def set_get_root(self, get_root):
+        self.get_root = get_root
+
+    def get_node(self):
+        return self
+
+
+def declare_node(meta_args):
+    meta_args.depth = hive.parameter("int", 9)
+
+
+def build_node(cls, i, ex, args, meta_args):
+    depth = meta_args.depth
+
+    i.value = hive.property(cls, "value", "int")
+    i.pull_value = hive.pull_out(i.value)
+    ex.value = hive.output(i.pull_value)
+
+    # Plugins which are only matched within this level
+    ex.level_plugin = hive.plugin(cls.get_node, identifier="level.{}".format(depth), policy=hive.MultipleOptional)
+    ex.level_socket = hive.socket(cls.set_get_root, identifier="level.{}".format(depth + 1),
+                                  policy=hive.MultipleOptional)
+
+    # Sockets for the root plugin
+    if depth % 3 == 0:
+        ex.root_socket = hive.socket(cls.set_get_root, identifier="root", policy=hive.MultipleOptional)
+
+    i.payload = PayloadHive(import_namespace=True)
+
+    if depth:
+        i.left = NodeHive(depth - 1, import_namespace=True)
+        i.right = NodeHive(depth - 1, import_namespace=True)
+
+
+NodeHive = hive.dyna_hive("NodeHive", build_node, declare_node, Node)
+
+
+class Root(object):
+
+    def get_root(self):
+        return self
+
+
+def make_root_hive(index):
+    def build_root(cls, i, ex, args):
+        ex.root_plugin = hive.plugin(cls.get_root, identifier="root", policy=hive.MultipleOptional)
+        i.tree = NodeHive(import_namespace=True)
+
+    return hive.hive("Root{}".format(index), build_root, Root)
+
+
+def count_bees(hive_object_cls):
+    count = 0
+
+    for bee in chain(hive_object_cls._hive_i._values, hive_object_cls._hive_ex._values):
+        count += 1
+
+        if isinstance(bee, hive.HiveObject):
+            count += count_bees(bee.__class__)
+
+    return count
+
+
+def measure(prune):
+    has_matchmaking_bees = hive.HiveObject.__dict__["_hive_has_matchmaking_bees"]
+
+    if not prune:
+        hive.HiveObject._hive_has_matchmaking_bees = classmethod(lambda cls: True)
+
+    durations = []
+    try:
+        for index in range(5):
+            root_hive = make_root_hive(index)
+            start = time.perf_counter()
+
+            with hive_mode_as("build"):
+                root = root_hive()
+
+            durations.append(time.perf_counter() - start)
+
+    finally:
+        hive.HiveObject._hive_has_matchmaking_bees = has_matchmaking_bees
+
+    return root, min(durations)
+
+
+if __name__ == "__main__":
+    # Build child hive classes in advance, so that only matchmaking of the root hive differs between runs
+    with hive_mode_as("build"):
+        make_root_hive(-1)()
+
+    root, pruned = measure(prune=True)
+    _, unpruned = measure(prune=False)
+
+    print("Bees in tree: {}".format(count_bees(root.__class__)))
+    print("Pruned:   {:.3f} s".format(pruned))
+    print("Unpruned: {:.3f} s ({:.2f}x pruned)".format(unpruned, unpruned / pruned))
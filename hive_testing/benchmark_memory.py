@@ -0,0 +1,93 @@
+"""Measure memory allocated per runtime hive instance"""
+
+from __future__ import print_function
+
+import os
+import sys
+import tracemalloc
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from hive.manager import hive_mode_as
+
+
+class Entity(object):
+
+    def __init__(self):
+        self.health = 100
+        self.damage = 0
+
+    def apply_damage(self):
+        self.health -= self.damage
+
+
+def build_entity(cls, i, ex, args):
+    i.health = hive.property(cls, "health", "int")
+    i.pull_health = hive.pull_out(i.health)
+    ex.health = hive.output(i.pull_health)
+
+    i.damage = hive.property(cls, "damage", "int")
+    i.push_damage = hive.push_in(i.damage)
+    ex.damage = hive.antenna(i.push_damage)
+
+    i.apply_damage = hive.triggerable(cls.apply_damage)
+    hive.trigger(i.push_damage, i.apply_damage)
+
+    ex.score = hive.attribute("int", 0)
+    i.pull_score = hive.pull_out(ex.score)
+    ex.score_out = hive.output(i.pull_score)
+
+
+Entity = hive.hive("Entity", build_entity, Entity)
+
+
+def with_instance_dict(runtime_class):
+    """Return copy of a generated runtime hive class which stores bound bees in a per-instance __dict__"""
+    slot_names = set(runtime_class.__slots__)
+    class_dict = {name: value for name, value in vars(runtime_class).items()
+                  if name != "__slots__" and name not in slot_names}
+    return type(runtime_class.__name__, runtime_class.__bases__, class_dict)
+
+
+def get_container_size(run_hive):
+    """Return size of the runtime hive object itself (and its __dict__, if any), excluding the bound bees"""
+    size = sys.getsizeof(run_hive)
+
+    instance_dict = getattr(run_hive, "__dict__", None)
+    if instance_dict is not None:
+        size += sys.getsizeof(instance_dict)
+
+    return size
+
+
+def measure(count, use_instance_dict=False):
+    """Return bytes allocated per runtime hive, and the size of each runtime hive object itself"""
+    with hive_mode_as("build"):
+        hive_object = Entity()
+
+    if use_instance_dict:
+        hive_object._hive_runtime_class = with_instance_dict(hive_object._hive_runtime_class)
+
+    # Warm up memoized bees
+    hive_object.instantiate()
+
+    tracemalloc.start()
+    snapshot = tracemalloc.take_snapshot()
+    run_hives = [hive_object.instantiate() for _ in range(count)]
+    allocated = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(snapshot, "filename"))
+    tracemalloc.stop()
+
+    return allocated / len(run_hives), get_container_size(run_hives[0])
+
+
+if __name__ == "__main__":
+    count = 10000
+
+    slotted, slotted_container = measure(count)
+    instance_dict, instance_dict_container = measure(count, use_instance_dict=True)
+
+    print("Slotted:            {:.0f} bytes/hive (hive object {} bytes)".format(slotted, slotted_container))
+    print("Instance __dict__:  {:.0f} bytes/hive (hive object {} bytes, {:.2f}x slotted)".format(
+        instance_dict, instance_dict_container, instance_dict / slotted))
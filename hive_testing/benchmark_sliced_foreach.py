@@ -0,0 +1,87 @@
+"""Compare the longest tick of iterating 100k items with ForEach inside one tick, and with SlicedForEach"""
+
+from __future__ import print_function
+
+import os
+import sys
+import time
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from dragonfly.event import EventManager, OnTick
+from dragonfly.gen import ForEach, SlicedForEach
+
+
+ITEM_COUNT = 100000
+
+
+def build_work(i, ex, args, meta_args):
+    i.source = hive.attribute("list", list(range(ITEM_COUNT)))
+    i.pull_source = hive.pull_out(i.source)
+
+    i.total = hive.attribute("int", 0)
+    i.item = hive.attribute("int")
+    i.push_item = hive.push_in(i.item)
+
+    def add(self):
+        self._total += self._item
+
+    i.add = hive.modifier(add)
+    hive.trigger(i.push_item, i.add)
+
+    i.pull_total = hive.pull_out(i.total)
+    ex.total = hive.output(i.pull_total)
+
+    if meta_args.sliced:
+        i.foreach = SlicedForEach(max_time=2.0, max_items=0)
+        ex.start = hive.entry(i.foreach.start)
+
+    else:
+        # Iterate everything on the first tick
+        i.foreach = ForEach()
+        i.on_tick = OnTick()
+        hive.trigger(i.on_tick, i.foreach.start)
+        hive.trigger(i.foreach.finished, i.on_tick.disable)
+
+    hive.connect(i.pull_source, i.foreach.iterable)
+    hive.connect(i.foreach.item, i.push_item)
+
+
+def declare_work(meta_args):
+    meta_args.sliced = hive.parameter("bool", False)
+
+
+Work = hive.dyna_hive("Work", build_work, declare_work)
+
+
+def build_scene(i, ex, args, meta_args):
+    ex.events = EventManager()
+    ex.work = Work(meta_args.sliced)
+
+
+Scene = hive.dyna_hive("Scene", build_scene, declare_work)
+
+
+def measure(sliced):
+    scene = Scene(sliced)
+    read_event = scene.events.read_event.plugin()
+
+    if sliced:
+        scene.work.start()
+
+    durations = []
+    while scene.work.total.pull() != ITEM_COUNT * (ITEM_COUNT - 1) // 2:
+        start = time.perf_counter()
+        read_event(("tick",))
+        durations.append(time.perf_counter() - start)
+
+    return durations
+
+
+if __name__ == "__main__":
+    for label, sliced in (("ForEach", False), ("SlicedForEach", True)):
+        durations = measure(sliced)
+        print("{:<14} {:>4} ticks, longest tick {:.1f} ms, total {:.1f} ms".format(
+            label + ":", len(durations), max(durations) * 1000, sum(durations) * 1000))
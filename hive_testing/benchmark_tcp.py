@@ -0,0 +1,82 @@
+"""Measure echo round trips of 1000 concurrent loopback clients through a TCPServer hive"""
+
+from __future__ import print_function
+
+import os
+import sys
+import time
+from selectors import DefaultSelector, EVENT_READ
+from socket import create_connection
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from dragonfly.event import EventManager
+from dragonfly.network.tcp import TCPServer
+
+
+def build_echo_server(i, ex, args):
+    ex.events = EventManager()
+    ex.server = TCPServer()
+
+    hive.connect(ex.server.from_address, ex.server.to_address)
+    hive.connect(ex.server.on_received, ex.server.send)
+
+
+EchoServerHive = hive.hive("EchoServer", build_echo_server)
+
+
+def build_batch_echo_server(i, ex, args):
+    ex.events = EventManager()
+    ex.server = TCPServer(per_packet=False)
+
+    hive.connect(ex.server.on_received_batch, ex.server.send_many)
+
+
+BatchEchoServerHive = hive.hive("BatchEchoServer", build_batch_echo_server)
+
+
+def measure(echo_server_hive, client_count=1000, round_count=10, message=b"x" * 64):
+    echo_server = echo_server_hive()
+    echo_server.server.bind_to.push(("127.0.0.1", 0))
+    address = echo_server.server.local_address.pull()
+
+    read_event = echo_server.events.read_event.plugin()
+
+    clients = [create_connection(address) for _ in range(client_count)]
+    selector = DefaultSelector()
+    for client in clients:
+        client.setblocking(False)
+        selector.register(client, EVENT_READ)
+
+    start = time.perf_counter()
+
+    for _ in range(round_count):
+        for client in clients:
+            client.send(message)
+
+        # Tick until every client received its echo
+        remaining = {client: len(message) for client in clients}
+        while remaining:
+            read_event(("tick",))
+
+            for key, _ in selector.select(0.001):
+                client = key.fileobj
+                remaining[client] -= len(client.recv(65536))
+
+                if not remaining[client]:
+                    del remaining[client]
+
+    duration = time.perf_counter() - start
+
+    for client in clients:
+        client.close()
+
+    echo_server.server.close()
+    return client_count * round_count / duration
+
+
+if __name__ == "__main__":
+    print("Round trips per packet: {:.0f} /s".format(measure(EchoServerHive)))
+    print("Round trips batched:    {:.0f} /s".format(measure(BatchEchoServerHive)))
@@ -0,0 +1,79 @@
+"""Measure tick fan-out to OnTick hives, through individual event handlers and through the tick scheduler"""
+
+from __future__ import print_function
+
+import os
+import sys
+import time
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from dragonfly.event import EventManager, EventHandler, OnTick
+from dragonfly.event.event import EventHiveClass
+
+
+class Counter(object):
+
+    def __init__(self):
+        self.count = 0
+
+    def increment(self):
+        self.count += 1
+
+
+def build_counter(cls, i, ex, args):
+    ex.on_tick = OnTick()
+
+    i.increment = hive.triggerable(cls.increment)
+    hive.trigger(ex.on_tick, i.increment)
+
+
+CounterHive = hive.hive("Counter", build_counter, Counter)
+
+
+def declare_scene(meta_args):
+    meta_args.hive_count = hive.parameter("int", 5000)
+
+
+def build_scene(i, ex, args, meta_args):
+    ex.events = EventManager()
+
+    for index in range(meta_args.hive_count):
+        setattr(ex, "counter_{}".format(index), CounterHive(import_namespace=True))
+
+
+SceneHive = hive.dyna_hive("Scene", build_scene, declare_scene)
+
+
+def measure(use_scheduler, tick_count=100):
+    scene = SceneHive()
+    events = scene.events
+
+    if not use_scheduler:
+        # Register an event handler per hive instead, as OnTick does without a tick scheduler
+        events._hive_build_class_to_instance[EventHiveClass].tick_scheduler.clear_subscribers()
+        add_handler = events.add_handler.plugin()
+
+        for bee_name in scene._hive_exposed_bee_names:
+            if bee_name.startswith("counter_"):
+                add_handler(EventHandler(getattr(scene, bee_name).on_tick._on_tick, ("tick",), mode="match"))
+
+    read_event = events.read_event.plugin()
+    event = ("tick",)
+
+    start = time.perf_counter()
+    for _ in range(tick_count):
+        read_event(event)
+
+    return (time.perf_counter() - start) / tick_count
+
+
+if __name__ == "__main__":
+    handler_time = measure(False)
+    scheduler_time = measure(True)
+
+    print("Event handlers: {:.2f} ms/tick".format(handler_time * 1000))
+    print("Tick scheduler: {:.2f} ms/tick".format(scheduler_time * 1000))
+    print("Speedup:        {:.2f}x".format(handler_time / scheduler_time))
@@ -0,0 +1,83 @@
+"""Measure tick cost of 100k pending timers, counted per tick by event handlers and kept in the timer wheel"""
+
+from __future__ import print_function
+
+import os
+import random
+import sys
+import time
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+from dragonfly.event import EventDispatcher, EventHandler, TimerWheel
+
+
+class CountdownTimer(object):
+    """Count ticks until elapsed, as Delay does without a timer wheel"""
+
+    def __init__(self, dispatcher, delay, callback):
+        self.dispatcher = dispatcher
+        self.delay = delay
+        self.elapsed = 0
+        self.callback = callback
+
+        self.handler = EventHandler(self.on_tick, ("tick",), mode="match")
+        dispatcher.add_handler(self.handler)
+
+    def on_tick(self):
+        self.elapsed += 1
+
+        if self.elapsed == self.delay:
+            self.dispatcher.remove_handler(self.handler)
+            self.callback()
+
+
+def get_delays(timer_count):
+    rng = random.Random(0)
+    return [rng.randint(1, 3600) for _ in range(timer_count)]
+
+
+def measure_handlers(delays, tick_count):
+    dispatcher = EventDispatcher()
+    fired = []
+
+    for delay in delays:
+        CountdownTimer(dispatcher, delay, lambda: fired.append(None))
+
+    start = time.perf_counter()
+    for _ in range(tick_count):
+        dispatcher.handle_event(("tick",))
+
+    return (time.perf_counter() - start) / tick_count, len(fired)
+
+
+def measure_wheel(delays, tick_count):
+    dispatcher = EventDispatcher()
+    wheel = TimerWheel()
+    fired = []
+
+    dispatcher.add_handler(EventHandler(wheel.advance, ("tick",), mode="match"))
+
+    for delay in delays:
+        wheel.schedule(delay, lambda: fired.append(None))
+
+    start = time.perf_counter()
+    for _ in range(tick_count):
+        dispatcher.handle_event(("tick",))
+
+    return (time.perf_counter() - start) / tick_count, len(fired)
+
+
+if __name__ == "__main__":
+    delays = get_delays(100000)
+    tick_count = 300
+
+    handler_time, handler_fired = measure_handlers(delays, tick_count)
+    wheel_time, wheel_fired = measure_wheel(delays, tick_count)
+    assert handler_fired == wheel_fired
+
+    print("Timers fired:   {}".format(wheel_fired))
+    print("Event handlers: {:.3f} ms/tick".format(handler_time * 1000))
+    print("Timer wheel:    {:.3f} ms/tick".format(wheel_time * 1000))
+    print("Speedup:        {:.0f}x".format(handler_time / wheel_time))
@@ -0,0 +1,95 @@
+"""Compare dot products of 10k vector pairs through scalar Dot hives and a single DotBatch hive"""
+
+from __future__ import print_function
+
+import os
+import random
+import sys
+import time
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from dragonfly.transform.vector import Dot, DotBatch
+from dragonfly.transform.vector.batch import numpy
+
+
+def get_vectors(count, seed):
+    rng = random.Random(seed)
+    return [(rng.random(), rng.random(), rng.random()) for _ in range(count)]
+
+
+def build_scalar(i, ex, args):
+    i.a = hive.attribute("vector")
+    i.b = hive.attribute("vector")
+
+    i.pull_a = hive.pull_out(i.a)
+    i.pull_b = hive.pull_out(i.b)
+
+    ex.dot = Dot()
+    hive.connect(i.pull_a, ex.dot.a)
+    hive.connect(i.pull_b, ex.dot.b)
+
+
+ScalarHive = hive.hive("Scalar", build_scalar)
+
+
+def build_batch(i, ex, args):
+    i.a = hive.attribute("vector.array")
+    i.b = hive.attribute("vector.array")
+
+    i.pull_a = hive.pull_out(i.a)
+    i.pull_b = hive.pull_out(i.b)
+
+    ex.dot = DotBatch()
+    hive.connect(i.pull_a, ex.dot.a)
+    hive.connect(i.pull_b, ex.dot.b)
+
+
+BatchHive = hive.hive("Batch", build_batch)
+
+
+def measure_scalar(a, b, repeat=5):
+    scalar_hives = []
+    for u, v in zip(a, b):
+        scalar_hive = ScalarHive()
+        scalar_hive._a, scalar_hive._b = u, v
+        scalar_hives.append(scalar_hive)
+
+    pulls = [scalar_hive.dot.result.pull for scalar_hive in scalar_hives]
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        results = [pull() for pull in pulls]
+
+    return (time.perf_counter() - start) / repeat, results
+
+
+def measure_batch(a, b, repeat=5):
+    batch_hive = BatchHive()
+
+    if numpy is not None:
+        a, b = numpy.array(a), numpy.array(b)
+
+    batch_hive._a, batch_hive._b = a, b
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        results = batch_hive.dot.result.pull()
+
+    return (time.perf_counter() - start) / repeat, list(results)
+
+
+if __name__ == "__main__":
+    a = get_vectors(10000, 0)
+    b = get_vectors(10000, 1)
+
+    scalar_time, scalar_results = measure_scalar(a, b)
+    batch_time, batch_results = measure_batch(a, b)
+    assert all(abs(x - y) < 1e-9 for x, y in zip(scalar_results, batch_results))
+
+    print("NumPy:      {}".format("yes" if numpy is not None else "no (pure-Python fallback)"))
+    print("Dot hives:  {:.2f} ms".format(scalar_time * 1000))
+    print("DotBatch:   {:.2f} ms".format(batch_time * 1000))
+    print("Speedup:    {:.0f}x".format(scalar_time / batch_time))
@@ -0,0 +1,89 @@
+from __future__ import print_function
+
+import asyncio
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from dragonfly.app import AsyncMainloop
+from dragonfly.event import EventManager, EventHandler
+
+
+class Receiver(object):
+    """Coroutine-based I/O hive, which pushes received messages as events"""
+
+    def __init__(self):
+        self._read_event = None
+
+    def set_read_event(self, read_event):
+        self._read_event = read_event
+
+    def set_create_task(self, create_task):
+        create_task(self.receive())
+
+    async def receive(self):
+        for index in range(3):
+            await asyncio.sleep(0.01)
+            self._read_event(("message", index))
+
+
+def build_receiver(cls, i, ex, args):
+    ex.get_read_event = hive.socket(cls.set_read_event, "event.process")
+    ex.get_create_task = hive.socket(cls.set_create_task, "app.create_task")
+
+
+ReceiverHive = hive.hive("Receiver", build_receiver, Receiver)
+
+
+class Service(object):
+
+    def __init__(self, *args, **kwargs):
+        self._hive = hive.get_run_hive()
+
+        self.tick_count = 0
+        self.messages = []
+        self.events = []
+
+    def on_tick(self):
+        self.tick_count += 1
+
+    def on_message(self, tail):
+        self.messages.append(tail)
+
+        if len(self.messages) == 3:
+            self._hive.stop()
+
+    def set_add_handler(self, add_handler):
+        add_handler(EventHandler(self.on_message, ("message",)))
+        add_handler(EventHandler(lambda: self.events.append("start"), ("start",), mode="match"))
+        add_handler(EventHandler(lambda: self.events.append("stop"), ("stop",), mode="match"))
+
+
+def build_service(cls, i, ex, args):
+    i.events = EventManager(export_namespace=True)
+    i.receiver = ReceiverHive(import_namespace=True)
+
+    i.on_tick = hive.triggerable(cls.on_tick)
+    hive.trigger(i.tick, i.on_tick)
+
+    ex.get_add_handler = hive.socket(cls.set_add_handler, "event.add_handler")
+
+
+ServiceHive = AsyncMainloop.extend("Service", build_service, Service)
+
+
+def test_async_mainloop():
+    """Ticks and coroutine events are interleaved on one asyncio event loop"""
+    service = ServiceHive(tick_rate=1000)
+    service.run()
+
+    instance = service._hive_build_class_to_instance[Service]
+    assert instance.messages == [(0,), (1,), (2,)], instance.messages
+    assert instance.events == ["start", "stop"], instance.events
+    assert instance.tick_count > 10, instance.tick_count
+
+
+test_async_mainloop()
@@ -0,0 +1,44 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+
+
+def build_pair(i, ex, args):
+    args.first_start = hive.parameter("int", 1)
+
+    ex.first = hive.attribute("int", args.first_start)
+    i.second = hive.attribute("str", "b")
+
+    i.pull_first = hive.pull_out(ex.first)
+    ex.first_out = hive.output(i.pull_first)
+
+    i.push_first = hive.push_in(ex.first)
+    ex.first_in = hive.antenna(i.push_first)
+
+
+Pair = hive.hive("Pair", build_pair)
+
+
+def test_attribute_slots():
+    """Attributes are stored in per-hive slots, independently for each instance"""
+    pair_a = Pair()
+    pair_b = Pair(first_start=2)
+
+    assert len(pair_a._hive_attribute_values) == 2
+    assert pair_a.first == 1 and pair_b.first == 2
+    assert pair_a._second == "b"
+
+    pair_a.first_in.push(10)
+    pair_b.first = 20
+
+    assert pair_a.first_out.pull() == 10
+    assert pair_b.first_out.pull() == 20
+
+
+test_attribute_slots()
@@ -0,0 +1,102 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from dragonfly.bind import create_instantiator
+from dragonfly.event import EventManager, EventHandler, bind_info
+from dragonfly.event.event import EventHiveClass
+from dragonfly.std import Variable
+
+
+received = []
+
+
+class Child(object):
+
+    def __init__(self):
+        self._hive = hive.get_run_hive()
+
+    def set_add_handler(self, add_handler):
+        add_handler(EventHandler(lambda tail: received.append((id(self), tail)), ("damage",)))
+        add_handler(EventHandler(lambda event: received.append((id(self), event)), priority=1))
+
+
+def build_child(cls, i, ex, args):
+    ex.get_add_handler = hive.socket(cls.set_add_handler, "event.add_handler")
+
+
+ChildHive = hive.hive("Child", build_child, Child)
+Instantiator = create_instantiator(bind_info)
+
+
+def build_scene(i, ex, args, meta_args):
+    ex.events = EventManager()
+    ex.instantiator = Instantiator(forward_events=meta_args.forward_events)
+
+    i.hive_class = Variable("class", start_value=ChildHive)
+    hive.connect(i.hive_class, ex.instantiator.hive_class)
+
+    i.leader = Variable("tuple", start_value=("entity", 7))
+    if meta_args.forward_events == "by_leader":
+        hive.connect(i.leader, ex.instantiator.event_leader)
+
+
+def declare_scene(meta_args):
+    meta_args.forward_events = hive.parameter("str", "all")
+
+
+SceneHive = hive.dyna_hive("Scene", build_scene, declare_scene)
+
+
+def test_forward_by_leader():
+    """Handlers of bound hives are registered with the parent dispatcher, below their leader"""
+    scene = SceneHive("by_leader")
+    read_event = scene.events.read_event.plugin()
+    dispatcher = scene.events._hive_build_class_to_instance[EventHiveClass]
+
+    scene.instantiator.create()
+    process_id = scene.instantiator.last_process_id.pull()
+    assert len(dispatcher._entries) == 2
+
+    del received[:]
+    read_event(("entity", 7, "damage", 10))
+    read_event(("entity", 8, "damage", 10))
+    assert [tail for _, tail in received] == [(10,), ("damage", 10)], received
+
+    # Paused processes unregister their handlers
+    scene.instantiator.pause_events.push(process_id)
+    assert not dispatcher.has_handlers
+
+    del received[:]
+    read_event(("entity", 7, "damage", 10))
+    assert received == []
+
+    scene.instantiator.resume_events.push(process_id)
+    read_event(("entity", 7, "damage", 10))
+    assert len(received) == 2
+
+    scene.instantiator.stop_process.push(process_id)
+    assert not dispatcher.has_handlers
+
+
+def test_forward_all():
+    """Without a leader, handlers of bound hives are registered unchanged"""
+    scene = SceneHive("all")
+    read_event = scene.events.read_event.plugin()
+
+    scene.instantiator.create()
+    scene.instantiator.create()
+
+    del received[:]
+    read_event(("damage", 3))
+    assert len(received) == 4
+    assert len({child_id for child_id, _ in received}) == 2
+
+
+test_forward_by_leader()
+test_forward_all()
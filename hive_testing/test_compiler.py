@@ -0,0 +1,112 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+
+
+class Counter(object):
+
+    def __init__(self):
+        self._hive = hive.get_run_hive()
+        self.value = 0
+        self.received = []
+
+    def increment(self):
+        self.value += 1
+
+    def receive(self, value):
+        self.received.append(value)
+
+
+def build_counter(cls, i, ex, args):
+    i.value = hive.property(cls, "value", "int")
+
+    i.increment = hive.triggerfunc(cls.increment)
+    ex.increment = hive.hook(i.increment)
+    ex.do_increment = hive.entry(hive.triggerable(i.increment))
+
+    i.push_value = hive.push_out(i.value)
+    ex.value_out = hive.output(i.push_value)
+    hive.trigger(i.increment, i.push_value)
+
+    i.pull_value = hive.pull_out(i.value)
+    ex.pull_value = hive.output(i.pull_value)
+
+    i.push_receive = hive.push_in(cls.receive)
+    ex.receive = hive.antenna(i.push_receive)
+
+
+Counter = hive.hive("Counter", build_counter, Counter)
+
+
+class Mirror(object):
+
+    def __init__(self):
+        self.mirrored = None
+        self.modified = 0
+
+
+def count_modified(run_hive):
+    run_hive._modified += 1
+
+
+def build_mirror(cls, i, ex, args):
+    i.mirrored = hive.property(cls, "mirrored", "int")
+    i.pull_mirrored = hive.pull_in(i.mirrored)
+    ex.mirrored_in = hive.antenna(i.pull_mirrored)
+
+    i.modified = hive.property(cls, "modified", "int")
+    i.modify = hive.modifier(count_modified)
+    hive.trigger(i.pull_mirrored, i.modify)
+
+    ex.trig_in = hive.entry(i.pull_mirrored)
+
+
+Mirror = hive.hive("Mirror", build_mirror, Mirror)
+
+
+def build_scene(i, ex, args):
+    ex.counter = Counter()
+    ex.mirror = Mirror()
+
+    hive.connect(ex.counter.value_out, ex.counter.receive)
+    hive.connect(ex.counter.pull_value, ex.mirror.mirrored_in)
+    hive.trigger(ex.counter.increment, ex.mirror.trig_in)
+
+
+Scene = hive.hive("Scene", build_scene)
+
+
+def run_scene(scene):
+    for _ in range(3):
+        scene.counter.do_increment()
+
+    counter = next(iter(scene.counter._hive_build_class_to_instance.values()))
+    mirror = next(iter(scene.mirror._hive_build_class_to_instance.values()))
+    return counter.value, counter.received, mirror.mirrored, mirror.modified
+
+
+def test_compiled_matches_interpreted():
+    """Compiled dispatch produces the same side effects as the interpreted path"""
+    interpreted = run_scene(Scene())
+
+    scene = Scene()
+    scene._hive_compile()
+    compiled = run_scene(scene)
+
+    assert interpreted == compiled == (3, [1, 2, 3], 3, 3), (interpreted, compiled)
+
+
+def test_instantiate_compile_dispatch():
+    """HiveObject.instantiate can compile on request"""
+    compiled_scene = Scene()._hive_object.instantiate(compile_dispatch=True)
+    assert run_scene(compiled_scene) == (3, [1, 2, 3], 3, 3)
+
+
+test_compiled_matches_interpreted()
+test_instantiate_compile_dispatch()
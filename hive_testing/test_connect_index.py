@@ -0,0 +1,64 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+
+
+def build_source(i, ex, args):
+    ex.value = hive.attribute("int", 1)
+    ex.name = hive.attribute("str", "source")
+
+    i.push_value = hive.push_out(ex.value)
+    ex.value_out = hive.output(i.push_value)
+
+    i.fire = hive.triggerfunc()
+    hive.trigger(i.fire, i.push_value)
+
+
+def build_target(i, ex, args):
+    ex.value = hive.attribute("int", 0)
+
+    i.push_value = hive.push_in(ex.value)
+    ex.value_in = hive.antenna(i.push_value)
+
+
+Source = hive.hive("Source", build_source)
+Target = hive.hive("Target", build_target)
+
+
+def build_graph(i, ex, args):
+    ex.source = Source()
+    ex.target = Target()
+    hive.connect(ex.source, ex.target)
+
+
+Graph = hive.hive("Graph", build_graph)
+
+
+def test_connection_index():
+    """Hive-to-hive connections are resolved from the memoized per-class index"""
+    graph = Graph()
+    graph.source._fire()
+    assert graph.target.value == 1
+
+    source_index = graph.source._hive_get_connection_index()
+    target_index = graph.target._hive_get_connection_index()
+    assert source_index is Graph().source._hive_get_connection_index()
+
+    candidates = source_index.find_connections(target_index)
+    assert [(a.bee_name, b.bee_name) for a, b in candidates] == [("value_out", "value_in")]
+    assert [c.bee_name for c in target_index.find_targets(("int",))] == ["value_in"]
+    assert not target_index.find_targets("str")
+
+
+def test_identifier_interning():
+    assert hive.identifier_to_tuple("int.float") is hive.identifier_to_tuple("int.float")
+
+
+test_connection_index()
+test_identifier_interning()
@@ -0,0 +1,88 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from dragonfly.entity import ComponentStore, EntityStore, Position
+from dragonfly.entity.store import EntityStoreClass
+
+
+def build_scene(i, ex, args):
+    ex.entities = EntityStore(capacity=2)
+
+    i.entity_id = hive.attribute("int.entity_id", 0)
+    i.pull_entity_id = hive.pull_out(i.entity_id)
+
+    i.get_position = Position(bound=False, mode="get")
+    hive.connect(i.pull_entity_id, i.get_position.entity_id)
+    ex.position = hive.output(i.get_position.position)
+
+
+SceneHive = hive.hive("Scene", build_scene)
+
+
+def test_component_store():
+    """Entity ids are dense, and ids of destroyed entities are reused"""
+    store = ComponentStore(capacity=1)
+    ids = [store.create() for _ in range(3)]
+    assert ids == [0, 1, 2]
+    assert store.capacity == 4
+
+    store.set("position", 1, (1, 2, 3))
+    store.destroy(1)
+    assert 1 not in store and len(store) == 2
+
+    assert store.create() == 1
+    assert store.get("position", 1) == (0.0, 0.0, 0.0)
+
+    store.set_many("linear_velocity", [2, 0], [(1, 0, 0), (0, 1, 0)])
+    assert [tuple(value) for value in store.get_many("linear_velocity", [0, 2])] == [(0, 1, 0), (1, 0, 0)]
+
+    try:
+        store.get("position", 3)
+
+    except KeyError:
+        pass
+
+    else:
+        assert False, "Unused entity ids should be rejected"
+
+
+def test_entity_store():
+    """EntityStore provides the entity plugins to entity hives, without a renderer"""
+    scene = SceneHive()
+    manager = scene.entities._hive_build_class_to_instance[EntityStoreClass]
+
+    created = []
+    manager.on_entity_created(lambda entity_id, entity: created.append(entity_id))
+
+    first = manager.spawn_entity("box")
+    second = manager.spawn_entity("box")
+    assert created == [first, second]
+
+    manager.set_absolute_position(first, (1, 2, 3))
+    manager.set_relative_position(second, first, (1, 1, 1))
+    assert scene.position.pull() == (1.0, 2.0, 3.0)
+    assert manager.get_absolute_position(second) == (2.0, 3.0, 4.0)
+    assert manager.get_relative_position(first, second) == (-1.0, -1.0, -1.0)
+
+    manager.set_tag(first, "health", 10)
+    manager.set_visibility(first, False)
+    assert manager.get_tag(first, "health") == 10 and not manager.get_visibility(first)
+
+    manager.set_many_positions([first, second], [(0, 0, 0), (5, 5, 5)])
+    assert [tuple(value) for value in manager.get_many_positions([second])] == [(5, 5, 5)]
+
+    destroyed = []
+    manager.register_hive_destructor(second, destroyed.append)
+    manager.destroy_entity(second)
+    assert destroyed == [second]
+    assert manager.spawn_entity("box") == second
+
+
+test_component_store()
+test_entity_store()
@@ -0,0 +1,44 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+from dragonfly.event.event import EventDispatcher, EventHandler
+
+
+def test_event_dispatcher():
+    """Handlers are called by pattern mode, in order of priority and then registration"""
+    dispatcher = EventDispatcher()
+    calls = []
+
+    def record(name):
+        return lambda *args: calls.append((name,) + args)
+
+    any_handler = EventHandler(record("any"), priority=5)
+    dispatcher.add_handler(any_handler)
+    dispatcher.add_handler(EventHandler(record("leader"), ("keyboard",), priority=1))
+    dispatcher.add_handler(EventHandler(record("match"), ("keyboard", "pressed"), priority=1, mode="match"))
+    dispatcher.add_handler(EventHandler(record("trigger"), ("keyboard", "pressed"), mode="trigger"))
+    dispatcher.add_handler(EventHandler(record("other"), ("mouse",)))
+
+    dispatcher.handle_event(("keyboard", "pressed"))
+    assert calls == [("trigger",), ("leader", ("pressed",)), ("match",), ("any", ("keyboard", "pressed"))], calls
+
+    del calls[:]
+    dispatcher.handle_event(("keyboard", "pressed", "a"))
+    assert calls == [("trigger",), ("leader", ("pressed", "a")), ("any", ("keyboard", "pressed", "a"))], calls
+
+    # Handlers removed by an earlier handler are not called for the current event
+    del calls[:]
+    dispatcher.add_handler(EventHandler(lambda: dispatcher.remove_handler(any_handler), ("mouse",), mode="trigger"))
+    dispatcher.handle_event(("mouse", [1, 2]))
+    assert calls == [("other", ([1, 2],))], calls
+
+    dispatcher.clear_handlers()
+    assert not dispatcher.has_handlers
+
+
+test_event_dispatcher()
@@ -0,0 +1,60 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+from dragonfly.event import EventManager, EventHandler
+
+
+def make_event_manager(**kwargs):
+    event_manager = EventManager(queued=True, **kwargs)
+    received = []
+
+    event_manager.add_handler.plugin()(EventHandler(received.append, ("keyboard",)))
+    return event_manager, received
+
+
+def test_queued_events():
+    """Queued events are dispatched on the next tick, and duplicates are coalesced"""
+    event_manager, received = make_event_manager(coalesce=True)
+
+    for key in "wwaw":
+        event_manager.event_in.push(("keyboard", "pressed", key))
+
+    assert received == []
+    assert event_manager.queue_depth.pull() == 2
+    assert event_manager.coalesced_count.pull() == 2
+
+    event_manager.read_event.plugin()(("tick",))
+    assert received == [("pressed", "w"), ("pressed", "a")], received
+    assert event_manager.queue_depth.pull() == 0
+    assert event_manager.max_queue_depth.pull() == 2
+
+    # Coalesced event may be queued again after it was dispatched
+    event_manager.event_in.push(("keyboard", "pressed", "w"))
+    event_manager.flush_events()
+    assert received[-1] == ("pressed", "w")
+
+
+def test_overflow_policies():
+    """Full queues drop the oldest or newest events, or are flushed"""
+    expected = {"drop_oldest": [(2,), (3,)], "drop_newest": [(0,), (1,)], "flush": [(0,), (1,), (2,), (3,)]}
+
+    for overflow_policy, expected_received in expected.items():
+        event_manager, received = make_event_manager(max_queue_size=2, overflow_policy=overflow_policy)
+
+        for index in range(4):
+            event_manager.event_in.push(("keyboard", index))
+
+        event_manager.read_event.plugin()(("tick",))
+        assert received == expected_received, (overflow_policy, received)
+
+        expected_dropped = 0 if overflow_policy == "flush" else 2
+        assert event_manager.dropped_count.pull() == expected_dropped
+
+
+test_queued_events()
+test_overflow_policies()
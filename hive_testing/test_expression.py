@@ -0,0 +1,118 @@
+from __future__ import print_function
+
+import io
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+import dragonfly.op.expression
+from hive.debug import FileDebugContext
+from dragonfly.op import Expression
+from dragonfly.op.expression import compile_expression, get_variable_names
+
+
+def build_scene(i, ex, args, meta_args):
+    i.expression = Expression(meta_args.expression, meta_args.result_type, vectorised=meta_args.vectorised)
+    ex.result = hive.output(i.expression.result)
+
+    for name in get_variable_names(meta_args.expression):
+        attribute = hive.attribute()
+        setattr(i, name, attribute)
+
+        pull_out = hive.pull_out(attribute)
+        setattr(i, "pull_{}".format(name), pull_out)
+        hive.connect(pull_out, getattr(i.expression, name))
+
+
+def declare_scene(meta_args):
+    meta_args.expression = hive.parameter("str", "")
+    meta_args.result_type = hive.parameter("str", "float")
+    meta_args.vectorised = hive.parameter("bool", False)
+
+
+Scene = hive.dyna_hive("Scene", build_scene, declarator=declare_scene)
+
+
+def test_expression():
+    """Expression is evaluated from all of its inputs, and may use math functions"""
+    scene = Scene("x * 2 + sqrt(y) - x")
+    scene._x = 3
+    scene._y = 16.0
+
+    assert scene.result.pull() == 7.0
+
+    scene._x = 10
+    assert scene.result.pull() == 14.0
+
+
+def test_compiled_once():
+    """Expressions are compiled once per unique expression string, and shared between hives"""
+    first = Scene("a + b * c", "int")
+    second = Scene("a + b * c", "int")
+
+    for scene, value in ((first, 1), (second, 2)):
+        scene._a = value
+        scene._b = 3
+        scene._c = 4
+
+    assert first.result.pull() == 13
+    assert second.result.pull() == 14
+    assert compile_expression("a + b * c") is compile_expression("a + b * c")
+    assert get_variable_names("a + a * sin(b)") == ("a", "b")
+
+
+def test_compiled_hive():
+    """Compiled hives evaluate the expression from the flattened input pulls"""
+    scene = Scene("x - y")
+    scene._x = 5
+    scene._y = 2
+    assert scene.result.pull() == 3
+
+    scene._hive_compile()
+    scene._x = 10
+    assert scene.result.pull() == 8
+
+
+def test_debug_context():
+    """Expressions built under a debug context pull their inputs through the (wrapped) pull_in bees"""
+    debug_file = io.StringIO()
+
+    with FileDebugContext(debug_file):
+        scene = Scene("p * 3 - q")
+        scene._p = 5
+        scene._q = 1
+        assert scene.result.pull() == 14
+
+    assert "pull-in" in debug_file.getvalue()
+
+
+def test_vectorised():
+    """Vectorised expressions accept arrays, and broadcast scalars"""
+    scene = Scene("a * b + c", "float.array", vectorised=True)
+    scene._a = [1.0, 2.0, 3.0]
+    scene._b = 2.0
+    scene._c = [0.5, 0.5, 0.5]
+
+    assert list(scene.result.pull()) == [2.5, 4.5, 6.5]
+
+    if dragonfly.op.expression.numpy is None:
+        scene._c = [1.0]
+
+        try:
+            scene.result.pull()
+
+        except ValueError:
+            pass
+
+        else:
+            assert False, "Arrays of differing length should be rejected"
+
+
+test_expression()
+test_compiled_once()
+test_compiled_hive()
+test_debug_context()
+test_vectorised()
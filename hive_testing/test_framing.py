@@ -0,0 +1,80 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from dragonfly.network import Framing, FramingError, MessageDecoder, encode_message
+
+
+def test_decoder():
+    """Messages are reassembled from single-byte chunks, including messages beyond 64KiB"""
+    messages = [b"", b"a", b"hello world", bytes(range(256)) * 300]
+
+    for mode in ("varint", "u32", "newline"):
+        stream = b"".join(encode_message(message.replace(b"\n", b""), mode) for message in messages)
+        expected = [message.replace(b"\n", b"") for message in messages]
+
+        decoder = MessageDecoder(mode)
+        received = []
+        for index in range(len(stream)):
+            received.extend(decoder.feed(stream[index:index + 1]))
+
+        assert received == expected, mode
+        assert decoder.pending_size == 0
+
+        # Whole stream in one chunk
+        assert MessageDecoder(mode).feed(stream) == expected
+
+    try:
+        MessageDecoder("u32", max_message_size=10).feed(encode_message(b"x" * 11))
+
+    except FramingError:
+        pass
+
+    else:
+        assert False, "Expected FramingError"
+
+
+def build_framed(i, ex, args):
+    ex.framing = Framing("varint", by_address=True)
+
+    i.address = hive.attribute("tuple", ("localhost", 1))
+    i.pull_address = hive.pull_out(i.address)
+    hive.connect(i.pull_address, ex.framing.address)
+
+
+FramedHive = hive.hive("Framed", build_framed)
+
+
+def test_framing_hive():
+    """Framing hive keeps a separate stream per address"""
+    framed = FramedHive()
+
+    framed_data = []
+    hive.connect(framed.framing.data_out, hive.push_in(framed_data.append))
+
+    received = []
+    hive.connect(framed.framing.message, hive.push_in(received.append))
+
+    for message in (b"first", b"second"):
+        framed.framing.send.push(message)
+
+    stream = b"".join(framed_data)
+    framed.framing.data_in.push(stream[:3])
+
+    framed._address = ("localhost", 2)
+    framed.framing.data_in.push(stream)
+
+    framed._address = ("localhost", 1)
+    framed.framing.data_in.push(stream[3:])
+
+    assert received == [b"first", b"second", b"first", b"second"], received
+    assert framed.framing.message_address.pull() == ("localhost", 1)
+
+
+test_decoder()
+test_framing_hive()
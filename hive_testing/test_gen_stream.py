@@ -0,0 +1,92 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from dragonfly.gen import ForEach, Map, Filter, Chunk, Window, Take
+from dragonfly.gen.stream import chunk_stream, window_stream
+
+
+def build_pipeline(i, ex, args):
+    i.source = hive.attribute()
+    i.pull_source = hive.pull_out(i.source)
+
+    i.map = Map("x * x")
+    i.filter = Filter("x % 2 == 0")
+    i.take = Take(3)
+    i.chunk = Chunk(2)
+
+    hive.connect(i.pull_source, i.map.iterable)
+    hive.connect(i.map.iterator, i.filter.iterable)
+    hive.connect(i.filter.iterator, i.take.iterable)
+    hive.connect(i.take.iterator, i.chunk.iterable)
+
+    ex.iterator = hive.output(i.chunk.iterator)
+
+
+Pipeline = hive.hive("Pipeline", build_pipeline)
+
+
+def test_pipeline():
+    """Streaming hives compose lazily, and only consume the source as far as needed"""
+    consumed = []
+
+    def source():
+        for value in range(100):
+            consumed.append(value)
+            yield value
+
+    pipeline = Pipeline()
+    pipeline._source = source()
+
+    iterator = pipeline.iterator.pull()
+    assert consumed == []
+
+    assert list(iterator) == [[0, 4], [16]]
+    assert consumed == list(range(5))
+
+
+def test_streams():
+    assert list(chunk_stream(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(window_stream(range(5), 3)) == [(0, 1, 2), (1, 2, 3), (2, 3, 4)]
+    assert list(window_stream(range(7), 2, step=3)) == [(0, 1), (3, 4)]
+    assert list(window_stream(range(1), 2)) == []
+
+
+def build_chunked_foreach(i, ex, args):
+    i.source = hive.attribute("list", list(range(10)))
+    i.pull_source = hive.pull_out(i.source)
+
+    i.window = Window(3)
+    hive.connect(i.pull_source, i.window.iterable)
+
+    i.foreach = ForEach(chunk_size=4)
+    hive.connect(i.window.iterator, i.foreach.iterable)
+
+    ex.chunk = hive.output(i.foreach.chunk)
+    ex.index = hive.output(i.foreach.index)
+    ex.start = hive.entry(i.foreach.start)
+
+
+ChunkedForEach = hive.hive("ChunkedForEach", build_chunked_foreach)
+
+
+def test_chunked_foreach():
+    """ForEach pushes lists of chunk_size items when chunked"""
+    foreach = ChunkedForEach()
+
+    chunks = []
+    hive.connect(foreach.chunk, hive.push_in(lambda chunk: chunks.append((foreach.index.pull(), chunk))))
+    foreach.start()
+
+    windows = [tuple(range(index, index + 3)) for index in range(8)]
+    assert chunks == [(0, windows[:4]), (4, windows[4:])]
+
+
+test_pipeline()
+test_streams()
+test_chunked_foreach()
@@ -32,6 +32,9 @@ def build_my_hive(i, ex, args):
     i.hive_class = Variable("class", start_value=SomeHive)
     hive.connect(i.hive_class, ex.instantiator.hive_class)
 
+    i.count = Variable("int", start_value=3)
+    hive.connect(i.count, ex.instantiator.count)
+
 
 MyHive = hive.hive("MyHive", build_my_hive)
 my_hive = MyHive()
@@ -45,8 +48,12 @@ pid_b = my_hive.instantiator.last_process_id.pull()
 my_hive.instantiator.create()
 pid_c = my_hive.instantiator.last_process_id.pull()
 
+my_hive.instantiator.create_many()
+pids = my_hive.instantiator.last_process_ids.pull()
+assert len(pids) == 3 and pid_c not in pids, pids
+
 my_hive.events.read_event.plugin()(("tick",))
-print(pid_a, pid_b, pid_c)
+print(pid_a, pid_b, pid_c, pids)
 print("Closing A!")
 my_hive.instantiator.stop_process.push(pid_a)
 #
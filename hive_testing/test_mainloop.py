@@ -0,0 +1,122 @@
+from __future__ import print_function
+
+import os
+import sys
+import time
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from dragonfly.app import Mainloop
+from dragonfly.app.mainloop import _Mainloop
+
+
+class FakeClock(object):
+    """Simulated clock, which advances by resolution whenever it is read, and by the duration of each sleep"""
+
+    def __init__(self, resolution=1e-6):
+        self.now = 0.0
+        self.resolution = resolution
+
+    def clock(self):
+        self.now += self.resolution
+        return self.now
+
+    def sleep(self, duration):
+        self.now += duration
+
+
+class TickCounter(object):
+
+    def __init__(self, *args, **kwargs):
+        self._hive = hive.get_run_hive()
+
+        self.tick_count = 0
+        self.tick_times = []
+        self.max_ticks = 20
+        self.tick_sleep = 0.0
+
+        self.clock = time.perf_counter
+        self.sleep = time.sleep
+
+    def on_tick(self):
+        self.tick_count += 1
+        self.tick_times.append(self.clock())
+
+        if self.tick_sleep:
+            self.sleep(self.tick_sleep)
+
+        if self.tick_count == self.max_ticks:
+            self._hive.stop()
+
+
+def build_counter(cls, i, ex, args):
+    i.on_tick = hive.triggerable(cls.on_tick)
+    hive.trigger(i.tick, i.on_tick)
+
+
+CounterLoop = Mainloop.extend("CounterLoop", build_counter, TickCounter)
+
+
+def create_loop(fake_clock, **kwargs):
+    """Create CounterLoop which uses fake_clock instead of the system clock"""
+    loop = CounterLoop(**kwargs)
+
+    for builder_cls in (_Mainloop, TickCounter):
+        instance = loop._hive_build_class_to_instance[builder_cls]
+        instance.clock = fake_clock.clock
+        instance.sleep = fake_clock.sleep
+
+    return loop, loop._hive_build_class_to_instance[TickCounter]
+
+
+def test_strategies():
+    """Each strategy ticks at the tick rate, and is idle between ticks"""
+    for strategy in ("sleep", "hybrid", "spin"):
+        fake_clock = FakeClock()
+        loop, counter = create_loop(fake_clock, tick_rate=200, strategy=strategy)
+
+        loop.run()
+
+        assert counter.tick_count == 20
+        assert loop.overrun_count.pull() == 0
+
+        intervals = [b - a for a, b in zip(counter.tick_times, counter.tick_times[1:])]
+        assert all(abs(interval - 0.005) < 1e-4 for interval in intervals), (strategy, intervals)
+
+        assert loop.tick_duration.pull() < 1e-4
+        assert loop.idle_percentage.pull() > 95.0
+
+
+def test_catch_up():
+    """Slow ticks are counted as overruns, and at most max_catch_up_ticks are run back to back"""
+    fake_clock = FakeClock()
+    loop, counter = create_loop(fake_clock, tick_rate=200, strategy="sleep", max_catch_up_ticks=2)
+    counter.tick_sleep = 0.012
+    counter.max_ticks = 5
+
+    loop.run()
+
+    assert loop.overrun_count.pull() == 5
+    assert loop.tick_duration.pull() >= 0.012
+
+    # Ticks run as soon as the previous one finishes, as the backlog is dropped rather than caught up
+    intervals = [b - a for a, b in zip(counter.tick_times, counter.tick_times[1:])]
+    assert all(0.012 <= interval < 0.0121 for interval in intervals), intervals
+
+
+def test_system_clock():
+    """The system clock is used by default"""
+    loop = CounterLoop(tick_rate=1000, strategy="hybrid")
+    counter = loop._hive_build_class_to_instance[TickCounter]
+
+    loop.run()
+
+    assert counter.tick_count == 20
+    assert counter.tick_times == sorted(counter.tick_times)
+
+
+test_strategies()
+test_catch_up()
+test_system_clock()
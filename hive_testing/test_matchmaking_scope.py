@@ -0,0 +1,125 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from hive.policies import MatchmakingPolicyError
+
+
+class Node(object):
+
+    def __init__(self, name=""):
+        self.name = name
+        self.root_getters = []
+        self.sibling_getters = []
+
+    def get_name(self):
+        return self.name
+
+    def add_root_getter(self, get_name):
+        self.root_getters.append(get_name)
+
+    def add_sibling_getter(self, get_name):
+        self.sibling_getters.append(get_name)
+
+
+def build_node(cls, i, ex, args):
+    ex.sibling_plugin = hive.plugin(cls.get_name, identifier="sibling.name", policy=hive.MultipleOptional)
+    ex.sibling_socket = hive.socket(cls.add_sibling_getter, identifier="sibling.name", policy=hive.MultipleOptional)
+    ex.root_socket = hive.socket(cls.add_root_getter, identifier="root.name", policy=hive.MultipleOptional)
+
+
+NodeHive = hive.hive("Node", build_node, Node)
+
+
+class Provider(object):
+
+    def get_name(self):
+        return "provider"
+
+
+def build_provider(cls, i, ex, args):
+    ex.required_plugin = hive.plugin(cls.get_name, identifier="root.required")
+
+
+ProviderHive = hive.hive("Provider", build_provider, Provider)
+
+
+class Root(Node):
+
+    def __init__(self):
+        super().__init__("root")
+        self.get_required = None
+
+    def set_get_required(self, get_required):
+        self.get_required = get_required
+
+
+def build_root(cls, i, ex, args):
+    ex.root_plugin = hive.plugin(cls.get_name, identifier="root.name", policy=hive.MultipleOptional)
+    ex.sibling_plugin = hive.plugin(cls.get_name, identifier="sibling.name", policy=hive.MultipleOptional)
+    ex.required_socket = hive.socket(cls.set_get_required, identifier="root.required", policy=hive.SingleRequired)
+
+    i.first = NodeHive(import_namespace=True, name="first")
+    i.second = NodeHive(import_namespace=True, name="second")
+
+    # Matched after its siblings, which must not cause the required socket to be validated early
+    i.provider = ProviderHive(import_namespace=True)
+
+
+RootHive = hive.hive("Root", build_root, Root)
+
+
+def get_names(getters):
+    return sorted(get_name() for get_name in getters)
+
+
+def test_ancestor_visibility():
+    """Nested hives see the plugins of their ancestors"""
+    root = RootHive()
+
+    assert get_names(root._first._drones[0].root_getters) == ["root"]
+    assert get_names(root._second._drones[0].root_getters) == ["root"]
+
+
+def test_sibling_visibility():
+    """Plugins for an identifier that an ancestor also provides are shared with later siblings"""
+    root = RootHive()
+
+    assert get_names(root._first._drones[0].sibling_getters) == ["first", "root"]
+    assert get_names(root._second._drones[0].sibling_getters) == ["first", "root", "second"]
+
+
+def test_validation_at_root():
+    """Policies are validated once the whole tree is matched, so a later subtree may satisfy a required socket"""
+    root = RootHive()
+
+    assert root._drones[0].get_required() == "provider"
+
+
+def test_validation_failure():
+    """Unsatisfied policies are still reported, once at the root"""
+    def build_lonely_root(cls, i, ex, args):
+        ex.required_socket = hive.socket(cls.set_get_required, identifier="root.required", policy=hive.SingleRequired)
+        i.first = NodeHive(import_namespace=True, name="first")
+
+    lonely_root_hive = hive.hive("LonelyRoot", build_lonely_root, Root)
+
+    try:
+        lonely_root_hive()
+
+    except MatchmakingPolicyError:
+        pass
+
+    else:
+        raise AssertionError("Unsatisfied SingleRequired socket was not reported")
+
+
+test_ancestor_visibility()
+test_sibling_visibility()
+test_validation_at_root()
+test_validation_failure()
@@ -0,0 +1,104 @@
+from __future__ import print_function
+
+import gc
+import os
+import sys
+from weakref import ref
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from hive.manager import get_memoize_stats, reset_memoize_stats, set_memoize_stats_enabled, memoize
+
+
+class Counter(object):
+
+    def __init__(self):
+        self.count = 0
+
+    def increment(self):
+        self.count += 1
+
+
+def build_counter(cls, i, ex, args):
+    i.count = hive.property(cls, "count", "int")
+    i.pull_count = hive.pull_out(i.count)
+    ex.count = hive.output(i.pull_count)
+
+    i.increment = hive.triggerable(cls.increment)
+    ex.increment = hive.entry(i.increment)
+
+
+Counter = hive.hive("Counter", build_counter, Counter)
+
+
+def test_memoize_stats():
+    """Repeated instantiation hits the per-bee caches"""
+    Counter()
+    reset_memoize_stats()
+    set_memoize_stats_enabled(True)
+
+    try:
+        Counter()
+        stats = get_memoize_stats()["hive.ppout.PPOutBee.getinstance"]
+        assert stats.misses == 1, stats
+
+        Counter()
+        assert stats.hits >= 1 and stats.misses == 2, stats
+
+    finally:
+        set_memoize_stats_enabled(False)
+
+
+def test_memoize_stats_disabled():
+    """Hits and misses are not counted unless enabled"""
+    reset_memoize_stats()
+
+    Counter()
+    stats = get_memoize_stats()["hive.ppout.PPOutBee.getinstance"]
+    assert stats.hits == stats.misses == 0, stats
+
+
+def test_release_memoized():
+    """Released run hives are no longer held by memoized bind results"""
+    counter = Counter()
+    counter.increment()
+    assert counter.count.pull() == 1
+
+    counter._hive_release()
+    counter_ref = ref(counter)
+    del counter
+    gc.collect()
+
+    assert counter_ref() is None
+
+
+class Describer(object):
+
+    @memoize
+    def describe(self, run_hive):
+        return repr(run_hive)
+
+
+def test_dependents_collected():
+    """Run hives hold the memoize caches which hold them, but not the owners of those caches"""
+    counter = Counter()
+
+    describer = Describer()
+    describer.describe(counter)
+
+    describer_ref = ref(describer)
+    del describer
+    gc.collect()
+
+    assert describer_ref() is None
+
+    counter._hive_release()
+    assert not counter._hive_memoize_dependents
+
+
+test_memoize_stats()
+test_memoize_stats_disabled()
+test_release_memoized()
+test_dependents_collected()
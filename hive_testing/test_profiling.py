@@ -0,0 +1,93 @@
+from __future__ import print_function
+
+import io
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from hive.debug import ProfilingDebugContext
+
+
+class Counter(object):
+
+    def __init__(self):
+        self.count = 0
+
+    def increment(self):
+        self.count += 1
+
+
+def build_counter(cls, i, ex, args):
+    i.count = hive.property(cls, "count", "int")
+    i.count_out = hive.push_out(i.count)
+    ex.count_out = hive.output(i.count_out)
+
+    i.increment = hive.triggerable(cls.increment)
+    ex.increment = hive.entry(i.increment)
+
+    i.tick = hive.triggerfunc()
+    ex.tick = hive.hook(i.tick)
+    ex.do_tick = hive.entry(hive.triggerable(i.tick))
+    hive.trigger(i.tick, i.increment)
+    hive.trigger(i.tick, i.count_out)
+
+
+CounterHive = hive.hive("Counter", build_counter, Counter)
+
+
+def build_pair(i, ex, args):
+    i.first = CounterHive()
+    i.second = CounterHive()
+
+    i.count = hive.attribute("int", 0)
+    i.count_in = hive.push_in(i.count)
+    hive.connect(i.first.count_out, i.count_in)
+
+    i.tick = hive.triggerfunc()
+    hive.trigger(i.tick, i.first.do_tick)
+    hive.trigger(i.first.tick, i.second.increment)
+
+
+PairHive = hive.hive("Pair", build_pair)
+
+
+def test_profiling_context():
+    """Calls through each edge are counted and timed, and nested times are attributed to their callers"""
+    context = ProfilingDebugContext()
+    with context:
+        pair = PairHive()
+
+    for _ in range(10):
+        pair._tick()
+
+    edges = {context.get_edge_name(edge): edge for edge in context.get_edges()}
+    push_edge = edges["first.count_out -push-> count_in"]
+    assert push_edge.calls == push_edge.sampled_calls == 10
+    assert edges["first.tick -trigger-> second.increment"].calls == 10
+    assert all(edge.cumulative_time >= edge.self_time >= 0.0 for edge in edges.values())
+
+    folded = io.StringIO()
+    context.write_folded_stacks(folded)
+    stacks = [line.rsplit(" ", 1)[0] for line in folded.getvalue().splitlines()]
+    assert any(stack.endswith(";first.count_out -push-> count_in") for stack in stacks), stacks
+
+
+def test_profiling_sampling():
+    """Only every sample_interval-th outermost call is timed"""
+    context = ProfilingDebugContext(sample_interval=4)
+    with context:
+        pair = PairHive()
+
+    for _ in range(8):
+        pair._tick()
+
+    assert max(edge.calls for edge in context.get_edges()) == 8
+    for edge in context.get_edges():
+        assert edge.sampled_calls == edge.calls // 4, edge
+
+
+test_profiling_context()
+test_profiling_sampling()
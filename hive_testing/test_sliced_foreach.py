@@ -0,0 +1,100 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from dragonfly.event import EventManager
+from dragonfly.gen import SlicedForEach
+
+
+def build_scene(i, ex, args):
+    ex.events = EventManager()
+
+    i.source = hive.attribute()
+    i.pull_source = hive.pull_out(i.source)
+
+    ex.foreach = SlicedForEach(max_items=3)
+    hive.connect(i.pull_source, ex.foreach.iterable)
+
+
+SceneHive = hive.hive("Scene", build_scene)
+
+
+def tick(scene):
+    scene.events.read_event.plugin()(("tick",))
+
+
+def test_sliced_foreach():
+    """Items are pushed across ticks, at most max_items per tick"""
+    scene = SceneHive()
+    scene._source = list(range(10))
+
+    items = []
+    finished = []
+    hive.connect(scene.foreach.item, hive.push_in(items.append))
+    hive.trigger(scene.foreach.finished, hive.triggerable(lambda: finished.append(scene.foreach.count.pull())))
+
+    scene.foreach.start()
+    assert items == []
+    assert scene.foreach.running.pull()
+
+    counts = []
+    for _ in range(5):
+        tick(scene)
+        counts.append(len(items))
+
+    assert counts == [3, 6, 9, 10, 10], counts
+    assert items == list(range(10))
+    assert finished == [10]
+    assert scene.foreach.progress.pull() == 1.0
+    assert not scene.foreach.running.pull()
+
+
+def test_break():
+    """Breaking stops iteration, and triggers finished"""
+    scene = SceneHive()
+    scene._source = iter(range(100))
+
+    items = []
+    finished = []
+    hive.connect(scene.foreach.item, hive.push_in(items.append))
+    hive.trigger(scene.foreach.finished, hive.triggerable(lambda: finished.append(True)))
+
+    scene.foreach.start()
+    tick(scene)
+    assert scene.foreach.progress.pull() == 0.0
+
+    scene.foreach.break_()
+    tick(scene)
+
+    assert items == [0, 1, 2]
+    assert finished == [True]
+    assert scene.foreach.index.pull() == 2
+
+
+def test_max_time():
+    """Iteration in a tick stops once max_time has elapsed"""
+    scene = SceneHive()
+    scene.foreach.max_items = 0
+    scene.foreach.max_time = 1.0
+
+    def slow_source():
+        while True:
+            sum(range(1000))
+            yield None
+
+    scene._source = slow_source()
+    scene.foreach.start()
+    tick(scene)
+
+    count = scene.foreach.count.pull()
+    assert 3 < count < 10000, count
+
+
+test_sliced_foreach()
+test_break()
+test_max_time()
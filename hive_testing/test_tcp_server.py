@@ -0,0 +1,128 @@
+from __future__ import print_function
+
+import os
+import sys
+import time
+from socket import create_connection
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from dragonfly.event import EventManager
+from dragonfly.network.tcp import TCPClient, TCPServer
+
+
+def build_echo_server(i, ex, args):
+    ex.events = EventManager()
+    ex.server = TCPServer(buffer_size=16)
+
+    # Echo received data
+    hive.connect(ex.server.from_address, ex.server.to_address)
+    hive.connect(ex.server.on_received, ex.server.send)
+
+
+EchoServerHive = hive.hive("EchoServer", build_echo_server)
+
+
+def build_batch_echo_server(i, ex, args):
+    ex.events = EventManager()
+    ex.server = TCPServer(per_packet=False)
+
+    # Echo all data received in a tick at once
+    hive.connect(ex.server.on_received_batch, ex.server.send_many)
+
+
+BatchEchoServerHive = hive.hive("BatchEchoServer", build_batch_echo_server)
+
+
+def build_client(i, ex, args):
+    ex.events = EventManager()
+    ex.client = TCPClient()
+
+
+ClientHive = hive.hive("Client", build_client)
+
+
+def run_until(echo_server, condition, timeout=5.0):
+    read_event = echo_server.events.read_event.plugin()
+    end_time = time.perf_counter() + timeout
+
+    while not condition():
+        assert time.perf_counter() < end_time, "Timed out"
+
+        read_event(("tick",))
+        time.sleep(0.001)
+
+
+def test_echo():
+    """Messages larger than the receive buffer are echoed completely, and disconnections are reported"""
+    echo_server = EchoServerHive()
+    echo_server.server.bind_to.push(("127.0.0.1", 0))
+
+    connected = []
+    disconnected = []
+    hive.connect(echo_server.server.on_client_connected, hive.push_in(connected.append))
+    hive.connect(echo_server.server.on_client_disconnected, hive.push_in(disconnected.append))
+
+    clients = [create_connection(echo_server.server.local_address.pull()) for _ in range(8)]
+    message = bytes(range(256)) * 64
+
+    for client in clients:
+        client.sendall(message)
+
+    for client in clients:
+        received = bytearray()
+        client.settimeout(0.005)
+
+        def is_received():
+            try:
+                received.extend(client.recv(len(message)))
+
+            except OSError:
+                pass
+
+            return len(received) == len(message)
+
+        run_until(echo_server, is_received)
+        assert received == message
+
+    client_address = clients[0].getsockname()
+    clients[0].close()
+    run_until(echo_server, lambda: disconnected)
+
+    assert len(connected) == 8 and client_address in connected
+    assert disconnected == [client_address], disconnected
+
+    for client in clients[1:]:
+        client.close()
+
+    echo_server.server.close()
+
+
+def test_batch_echo():
+    """Data received by the server and client is pushed as one batch per tick"""
+    echo_server = BatchEchoServerHive()
+    echo_server.server.bind_to.push(("127.0.0.1", 0))
+
+    # Per packet outputs are omitted, as the server only dispatches batches
+    assert not hasattr(echo_server.server, "on_received")
+
+    client = ClientHive()
+    client.client.connect_to.push(echo_server.server.local_address.pull())
+
+    received = []
+    hive.connect(client.client.on_received_batch, hive.push_in(received.extend))
+
+    client.client.send_many.push([b"a", b"b", b"c"])
+
+    def tick():
+        echo_server.events.read_event.plugin()(("tick",))
+        return b"".join(received) == b"abc"
+
+    run_until(client, tick)
+    echo_server.server.close()
+
+
+test_echo()
+test_batch_echo()
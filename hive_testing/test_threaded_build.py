@@ -0,0 +1,74 @@
+from __future__ import print_function
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from hive.manager import get_mode, get_building_hive, get_run_hive
+
+
+class Accumulator(object):
+
+    def __init__(self):
+        self.total = 0
+        self.step = 0
+
+    def add(self):
+        self.total += self.step
+
+
+def make_hive(index):
+    """Build a distinct hive class, whose builder checks that build state is not shared between threads"""
+
+    def build_accumulator(cls, i, ex, args):
+        assert get_mode() == "build"
+        assert get_building_hive().__name__ == "HiveObject<Accumulator{}>".format(index)
+
+        i.total = hive.property(cls, "total", "int")
+        i.pull_total = hive.pull_out(i.total)
+        ex.total = hive.output(i.pull_total)
+
+        i.step = hive.property(cls, "step", "int")
+        i.push_step = hive.push_in(i.step)
+        ex.step = hive.antenna(i.push_step)
+
+        i.add = hive.triggerable(cls.add)
+        hive.trigger(i.push_step, i.add)
+
+        ex.offset = hive.attribute("int", index)
+
+    return hive.hive("Accumulator{}".format(index), build_accumulator, Accumulator)
+
+
+def build_and_run(index):
+    accumulator_hive = make_hive(index)
+    accumulator = accumulator_hive()
+
+    for _ in range(10):
+        accumulator.step.push(index)
+
+    return accumulator.total.pull() + accumulator.offset
+
+
+def test_threaded_build():
+    """Build and instantiate distinct hive classes concurrently"""
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    try:
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(build_and_run, range(64)))
+
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert results == [11 * index for index in range(64)], results
+    assert get_mode() == "immediate"
+    assert get_building_hive() is None and get_run_hive() is None
+
+
+test_threaded_build()
@@ -0,0 +1,91 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from dragonfly.event import EventManager, OnTick, TickScheduler
+from dragonfly.event.event import EventHiveClass
+
+
+class Counter(object):
+
+    def __init__(self):
+        self.count = 0
+
+    def increment(self):
+        self.count += 1
+
+
+def build_counter(cls, i, ex, args, meta_args):
+    i.on_tick = OnTick(divisor=meta_args.divisor)
+    ex.on_tick = hive.hook(i.on_tick)
+
+    i.increment = hive.triggerable(cls.increment)
+    hive.trigger(i.on_tick, i.increment)
+
+    i.count = hive.property(cls, "count", "int")
+    i.pull_count = hive.pull_out(i.count)
+    ex.count = hive.output(i.pull_count)
+
+
+def declare_counter(meta_args):
+    meta_args.divisor = hive.parameter("int", 1)
+
+
+CounterHive = hive.dyna_hive("Counter", build_counter, declare_counter, Counter)
+
+
+def build_scene(i, ex, args):
+    ex.events = EventManager()
+
+    ex.every_tick = CounterHive(import_namespace=True)
+    ex.every_third_tick = CounterHive(3, import_namespace=True)
+    ex.disabled = CounterHive(import_namespace=True)
+
+
+SceneHive = hive.hive("Scene", build_scene)
+
+
+def test_tick_scheduler():
+    """Subscribers with a divisor are staggered, and disabled subscribers are skipped"""
+    scheduler = TickScheduler()
+    calls = []
+
+    for index in range(3):
+        scheduler.add_subscriber(lambda index=index: calls.append(index), divisor=3)
+
+    removed = scheduler.add_subscriber(lambda: calls.append("removed"))
+    scheduler.remove_subscriber(removed)
+
+    for _ in range(6):
+        scheduler.tick()
+
+    assert calls == [0, 1, 2, 0, 1, 2], calls
+
+
+def test_on_tick():
+    """OnTick hives subscribe to the tick scheduler of the event manager"""
+    scene = SceneHive()
+    scene.disabled.on_tick.disable()
+
+    event_manager = scene.events._hive_build_class_to_instance[EventHiveClass]
+    assert len(event_manager.tick_scheduler._subscriptions) == 3
+
+    for _ in range(9):
+        scene.events.read_event.plugin()(("tick",))
+
+    assert scene.every_tick.count.pull() == 9
+    assert scene.every_third_tick.count.pull() == 3
+    assert scene.disabled.count.pull() == 0
+
+    scene.disabled.on_tick.enable()
+    scene.events.read_event.plugin()(("tick",))
+    assert scene.disabled.count.pull() == 1
+
+
+test_tick_scheduler()
+test_on_tick()
@@ -0,0 +1,115 @@
+from __future__ import print_function
+
+import os
+import random
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from dragonfly.event import EventManager, TimerWheel
+from dragonfly.event.event import EventHiveClass
+from dragonfly.std import Variable
+from dragonfly.time import Delay
+
+
+class Scene(object):
+
+    def __init__(self):
+        self.elapsed_count = 0
+
+    def get_tick_rate(self):
+        return 10
+
+    def on_elapsed(self):
+        self.elapsed_count += 1
+
+
+def build_scene(cls, i, ex, args):
+    ex.events = EventManager()
+    ex.get_tick_rate = hive.plugin(cls.get_tick_rate, identifier="app.get_tick_rate")
+
+    ex.delay = Delay()
+    i.delay_value = Variable("float", start_value=0.5)
+    hive.connect(i.delay_value, ex.delay.delay_in)
+
+    i.on_elapsed = hive.triggerable(cls.on_elapsed)
+    hive.trigger(ex.delay.on_elapsed, i.on_elapsed)
+
+    i.elapsed_count = hive.property(cls, "elapsed_count", "int")
+    i.pull_elapsed_count = hive.pull_out(i.elapsed_count)
+    ex.elapsed_count = hive.output(i.pull_elapsed_count)
+
+
+SceneHive = hive.hive("Scene", build_scene, Scene)
+
+
+def test_timer_wheel():
+    """Timers expire on the tick they were scheduled for, across all levels of the wheel"""
+    wheel = TimerWheel()
+    rng = random.Random(0)
+
+    fired = []
+    expected = {}
+    cancelled = []
+
+    for index in range(2000):
+        delay = rng.choice((1, 255, 256, 257, 65535, 65536, 70000, rng.randint(1, 80000)))
+        timer = wheel.schedule(delay, lambda index=index: fired.append((wheel.current_tick, index)))
+        expected[index] = delay
+
+        if index % 10 == 0:
+            timer.cancel()
+            cancelled.append(index)
+
+    rearmed = wheel.schedule(5, lambda: fired.append((wheel.current_tick, "rearmed")))
+    wheel.advance()
+    rearmed.rearm(300)
+
+    while wheel.pending_count:
+        wheel.advance()
+
+    for index in cancelled:
+        del expected[index]
+
+    expected_fired = sorted([(delay, index) for index, delay in expected.items()] + [(301, "rearmed")], key=str)
+    assert sorted(fired, key=str) == expected_fired
+
+
+def test_delay():
+    """Delay hive schedules its timer with the event manager"""
+    scene = SceneHive()
+    read_event = scene.events.read_event.plugin()
+
+    # The timer wheel is only created once a timer is scheduled
+    event_manager = scene.events._hive_build_class_to_instance[EventHiveClass]
+    assert event_manager.timer_wheel is None
+
+    scene.delay.trig_in()
+    assert event_manager.timer_wheel.pending_count == 1
+
+    for _ in range(4):
+        read_event(("tick",))
+
+    # Re-arming restarts the delay
+    scene.delay.trig_in()
+    for _ in range(4):
+        read_event(("tick",))
+
+    assert scene.elapsed_count.pull() == 0
+    assert scene.delay.elapsed.pull() == 0.4
+
+    read_event(("tick",))
+    assert scene.elapsed_count.pull() == 1
+
+    scene.delay.trig_in()
+    scene.delay.cancel()
+    for _ in range(10):
+        read_event(("tick",))
+
+    assert scene.elapsed_count.pull() == 1
+
+
+test_timer_wheel()
+test_delay()
@@ -0,0 +1,53 @@
+from __future__ import print_function
+
+import os
+import sys
+from math import sqrt
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from dragonfly.std import Variable
+from dragonfly.transform.vector import CrossBatch, DeterminantBatch, DotBatch, NormaliseBatch
+
+
+def build_batch(i, ex, args):
+    i.a = Variable("vector.array", start_value=[(1.0, 0.0, 0.0), (1.0, 2.0, 2.0)])
+    i.b = Variable("vector.array", start_value=[(0.0, 1.0, 0.0), (2.0, 0.0, 1.0)])
+
+    ex.dot = DotBatch()
+    ex.cross = CrossBatch()
+    ex.determinant = DeterminantBatch()
+    ex.normalise = NormaliseBatch()
+
+    for binary in (ex.dot, ex.cross):
+        hive.connect(i.a, binary.a)
+        hive.connect(i.b, binary.b)
+
+    hive.connect(i.a, ex.determinant.vector)
+    hive.connect(i.a, ex.normalise.vector)
+
+
+BatchHive = hive.hive("Batch", build_batch)
+
+
+def as_lists(array):
+    return [list(map(float, row)) if hasattr(row, "__len__") else float(row) for row in array]
+
+
+def test_vector_batch():
+    """Batch hives compute one result per vector in a single pull"""
+    batch = BatchHive()
+
+    assert as_lists(batch.dot.result.pull()) == [0.0, 4.0]
+    assert as_lists(batch.cross.result.pull()) == [[0.0, 0.0, 1.0], [2.0, 3.0, -4.0]]
+    assert as_lists(batch.determinant.result.pull()) == [1.0, 3.0]
+
+    normalised = as_lists(batch.normalise.result.pull())
+    assert normalised[0] == [1.0, 0.0, 0.0]
+    assert all(abs(value - expected) < 1e-12 for value, expected in zip(normalised[1], (1 / 3, 2 / 3, 2 / 3)))
+    assert abs(sqrt(sum(value ** 2 for value in normalised[1])) - 1.0) < 1e-12
+
+
+test_vector_batch()